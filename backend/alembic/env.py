@@ -5,13 +5,16 @@ from sqlalchemy import pool
 
 from alembic import context
 
-from app.core.database import Base
+from app.core.database import Base, DATABASE_URL
 from app.models.job import Job  # 모델 import
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
 
+# 애플리케이션 설정의 DATABASE_URL을 사용
+config.set_main_option("sqlalchemy.url", DATABASE_URL)
+
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
 if config.config_file_name is not None:
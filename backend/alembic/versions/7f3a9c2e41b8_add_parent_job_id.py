@@ -0,0 +1,30 @@
+"""Add parent_job_id for document versions
+
+Revision ID: 7f3a9c2e41b8
+Revises: db5d3c5b73cc
+Create Date: 2026-10-19 10:12:41.503127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7f3a9c2e41b8'
+down_revision: Union[str, None] = 'db5d3c5b73cc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('jobs', sa.Column('parent_job_id', sa.String(), nullable=True))
+    op.create_foreign_key('fk_jobs_parent_job_id', 'jobs', 'jobs', ['parent_job_id'], ['id'])
+    op.create_index(op.f('ix_jobs_parent_job_id'), 'jobs', ['parent_job_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_jobs_parent_job_id'), table_name='jobs')
+    op.drop_constraint('fk_jobs_parent_job_id', 'jobs', type_='foreignkey')
+    op.drop_column('jobs', 'parent_job_id')
@@ -0,0 +1,147 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import FileResponse
+from app.core.config import settings
+from app.core import dead_letters, deadlines, metrics, model_tiers
+from app.core.celery_app import AGENT_QUEUE, EXTRACT_QUEUE, PERSIST_QUEUE
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.redis_client import get_broker_redis, get_redis
+from app.core.profiling import PROFILE_ARTIFACTS, get_profile_dir, list_profile_artifacts
+import hmac
+import logging
+import os
+from datetime import datetime
+from pydantic import BaseModel
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+async def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """관리자 토큰을 검증합니다."""
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not found")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+router = APIRouter(prefix="/admin", dependencies=[Depends(require_admin)])
+
+def _check_job_id(job_id: str):
+    # 경로 조작 방지
+    if job_id in (".", "..") or os.path.basename(job_id) != job_id:
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+@router.get("/jobs/{job_id}/profile")
+async def get_job_profile(job_id: str):
+    _check_job_id(job_id)
+    artifacts = list_profile_artifacts(job_id)
+    if not artifacts:
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+    return {
+        "jobId": job_id,
+        "artifacts": [
+            {"name": name, "url": f"/admin/jobs/{job_id}/profile/{name}"}
+            for name in artifacts
+        ]
+    }
+
+@router.get("/jobs/{job_id}/profile/{artifact}")
+async def download_job_profile(job_id: str, artifact: str):
+    _check_job_id(job_id)
+    # 허용된 산출물 이름만 제공
+    if artifact not in PROFILE_ARTIFACTS:
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+    file_path = os.path.join(get_profile_dir(job_id), artifact)
+    if not os.path.exists(file_path):
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+    return FileResponse(
+        file_path,
+        media_type=PROFILE_ARTIFACTS[artifact],
+        filename=f"{job_id}.{artifact}"
+    )
+
+def get_stage_metrics(redis) -> dict:
+    """단계별 파이프라인의 단계별 대기열 길이, 처리량, 이용률"""
+    concurrency = {
+        "extract": settings.EXTRACT_CONCURRENCY,
+        "agent": settings.AGENT_CONCURRENCY,
+        "persist": settings.PERSIST_CONCURRENCY
+    }
+    stats = metrics.get_stage_stats(redis, concurrency)
+    broker = get_broker_redis()
+    for stage, queue in (("extract", EXTRACT_QUEUE), ("agent", AGENT_QUEUE), ("persist", PERSIST_QUEUE)):
+        stats[stage]["queueDepth"] = metrics.get_queue_depth(broker, queue)
+    return stats
+
+@router.get("/metrics")
+async def get_metrics():
+    """에이전트 재시도/서킷 브레이커 상태와 처리 지표(모델 티어별 지연 시간과 비용, 건너뛴 작업 포함)를 반환합니다."""
+    redis = get_redis()
+    breaker = CircuitBreaker(redis, "agent")
+    counters = metrics.get_counters(redis)
+    return {
+        "breaker": {
+            "state": breaker.state(),
+            "retryAfter": breaker.retry_after()
+        },
+        "counters": counters,
+        "tiers": model_tiers.get_tier_stats(counters),
+        "loadShedding": deadlines.get_shedding_stats(counters),
+        "queueDepth": metrics.get_backlog_depth(get_broker_redis()),
+        "throughput": metrics.get_throughput(redis),
+        "avgJobDuration": metrics.get_average_job_duration(redis),
+        "stages": get_stage_metrics(redis)
+    }
+
+def _local_time(value: Optional[datetime]) -> Optional[datetime]:
+    # 시간대가 있는 시각은 서버 시간대로 바꿈 (저장된 실패 시각은 서버 시간 기준)
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone().replace(tzinfo=None)
+    return value
+
+@router.get("/dead-letters")
+async def list_dead_letters(
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    error_class: Optional[str] = Query(None, alias="errorClass"),
+    transient: Optional[bool] = None,
+    limit: int = Query(100, ge=1, le=1000)
+):
+    """실패한 작업을 실패 시각 구간, 오류 종류(상위 클래스 포함), 재시도 분류로 조회합니다 (오래된 순)."""
+    redis = get_redis()
+    entries = dead_letters.find(redis, _local_time(since), _local_time(until), error_class, limit=limit, transient=transient)
+    return {"deadLetters": entries, **dead_letters.get_summary(redis)}
+
+class ReplayRequest(BaseModel):
+    jobIds: Optional[List[str]] = None
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+    errorClass: Optional[str] = None
+    transient: Optional[bool] = None
+    limit: Optional[int] = None
+
+@router.post("/dead-letters/replay")
+async def replay_dead_letters(body: ReplayRequest):
+    """조건에 맞는 실패한 작업을 재처리 대기열에 넣습니다.
+
+    재처리 작업은 주기 작업이 DLQ_REPLAY_RATE 속도로 일반 대기열에 등록하므로 한꺼번에 몰리지 않습니다.
+    """
+    limit = min(body.limit or settings.DLQ_REPLAY_MAX_BATCH, settings.DLQ_REPLAY_MAX_BATCH)
+    if limit < 1:
+        raise HTTPException(status_code=400, detail="limit must be positive")
+    redis = get_redis()
+    entries = [
+        entry for entry in dead_letters.find(
+            redis, _local_time(body.since), _local_time(body.until), body.errorClass, body.jobIds,
+            transient=body.transient
+        )
+        if dead_letters.is_replayable(entry)
+    ][:limit]
+    queued = dead_letters.queue_replay(redis, entries)
+    summary = dead_letters.get_summary(redis)
+    return {
+        "queued": queued,
+        "replayQueue": summary["replayQueue"],
+        "estimatedSeconds": summary["replayQueue"] / settings.DLQ_REPLAY_RATE if settings.DLQ_REPLAY_RATE > 0 else None
+    }
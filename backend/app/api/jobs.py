@@ -1,8 +1,8 @@
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, BackgroundTasks, Request, Response, Header, WebSocket, WebSocketDisconnect
 from sqlalchemy.orm import Session
-from app.core.database import get_db
-from app.models.job import Job
-from app.core.celery_app import celery_app
+from app.core.database import SessionLocal, get_db
+from app.models.job import Job, JobStatus
+from app.core.celery_app import celery_app, job_lane
 from fastapi.responses import StreamingResponse
 import uuid
 import json
@@ -10,93 +10,536 @@ import asyncio
 import logging
 import os
 import shutil
-from redis import Redis
 from app.core.config import settings
+from app.core.redis_client import get_redis
+from app.core.profiling import should_profile
+from app.core.admission import AdmissionRejected, check_admission
+from app.core.estimates import estimate_job_times, mark_enqueued
+from app.core import idempotency
+from app.core.cancellation import request_cancel
+from app.core.estimates import PENDING_JOBS_KEY
+from app.core.job_cache import etag_matches, make_etag, serialize, terminal_responses
+from app.core.job_events import JobEventHub, publish_job_event
+from app.core import deadlines, metrics
+from app.storage import BlobInfo, acquire_blob, get_blob_store, release_blob
 from datetime import datetime
-import aiofiles
-from typing import Optional
+from starlette.concurrency import run_in_threadpool
+from typing import List, Optional
+from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Redis 연결 풀 생성
-redis_pool = None
-
-def get_redis():
-    global redis_pool
-    if redis_pool is None:
-        redis_pool = Redis(
-            host=settings.REDIS_HOST,
-            port=settings.REDIS_PORT,
-            db=settings.REDIS_DB,
-            decode_responses=True,
-            socket_timeout=1,
-            socket_connect_timeout=1
-        )
-    return redis_pool
+# 더 이상 상태가 바뀌지 않는 작업 상태
+TERMINAL_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED, JobStatus.SKIPPED)
+
+async def save_upload(job_id: str, file: UploadFile) -> BlobInfo:
+    """업로드 파일을 저장소에 저장하고 작업이 파일을 참조한다고 기록합니다.
 
-async def save_file_async(file_path: str, file: UploadFile):
-    async with aiofiles.open(file_path, 'wb') as out_file:
-        content = await file.read()
-        await out_file.write(content)
+    같은 내용의 파일이 이미 있으면 다시 쓰지 않고 재사용합니다.
+    """
+    store = get_blob_store()
+    blob = await run_in_threadpool(store.put, file.file)
+    redis = get_redis()
+    acquire_blob(redis, blob.digest, job_id, blob.size)
+    redis.hset(f"job:{job_id}", "blob", blob.digest)
+    # 참조를 기록하기 직전에 정리된 경우 다시 저장
+    if not blob.created and not store.exists(blob.digest):
+        await file.seek(0)
+        await run_in_threadpool(store.put, file.file)
+    if not blob.created:
+        try:
+            metrics.incr_counter(redis, "upload_dedup_hits")
+        except Exception as e:
+            logger.warning(f"Failed to record dedup metric: {str(e)}")
+    return blob
 
-async def create_job_in_db(job_id: str, db: Session):
-    job = Job(id=job_id, status="pending")
+async def create_job_in_db(job_id: str, db: Session, parent_job_id: Optional[str] = None):
+    job = Job(id=job_id, status="pending", parent_job_id=parent_job_id)
     db.add(job)
     db.commit()
     return job
 
+def with_estimates(payload: dict, job_id: str, job_data: Optional[dict] = None) -> dict:
+    """상태 응답에 예상 시작/완료 시각을 추가합니다."""
+    try:
+        redis = get_redis()
+        if job_data is None:
+            job_data = redis.hgetall(f"job:{job_id}")
+        payload.update(estimate_job_times(redis, job_id, {**job_data, "status": payload["status"]}))
+    except Exception as e:
+        logger.warning(f"Failed to estimate job times for {job_id}: {str(e)}")
+    return payload
+
+def get_client_id(request: Request) -> str:
+    """클라이언트 식별자를 반환합니다 (X-Client-Id 헤더 또는 접속 IP)."""
+    client_id = request.headers.get("X-Client-Id")
+    if client_id:
+        return client_id
+    return request.client.host if request.client else ""
+
 @router.post("/jobs")
 async def create_job(
+    request: Request,
+    response: Response,
     file: UploadFile = File(...),
+    profile: bool = False,
+    parent_job_id: Optional[str] = None,
+    pipeline: Optional[str] = None,
+    deadline: Optional[str] = None,
+    idempotency_key: Optional[str] = Header(None),
     db: Session = Depends(get_db)
 ):
+    """문서 처리 작업을 접수합니다.
+
+    deadline(지금부터의 초 또는 ISO 8601 시각)까지 처리를 시작하지 못한 작업은 워커가 건너뜁니다.
+    """
     # 파일 확장자 검증
     allowed_extensions = {".pdf", ".docx", ".doc", ".txt"}
     file_ext = os.path.splitext(file.filename)[1].lower()
     if file_ext not in allowed_extensions:
         raise HTTPException(status_code=400, detail="Only PDF, DOCX, DOC, or TXT files are allowed")
+    if idempotency_key is not None and not 0 < len(idempotency_key) <= idempotency.MAX_KEY_LENGTH:
+        raise HTTPException(status_code=400, detail="Invalid Idempotency-Key")
+    if pipeline is not None and pipeline not in ("sequential", "parallel"):
+        raise HTTPException(status_code=400, detail="pipeline must be sequential or parallel")
+    try:
+        deadline_at = deadlines.parse_deadline(deadline)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="deadline must be seconds from now or a future ISO 8601 time")
+    # 새 버전 문서는 이전 버전 작업의 섹션 요약을 재사용
+    if parent_job_id and not db.query(Job.id).filter(Job.id == parent_job_id).first():
+        raise HTTPException(status_code=400, detail="Parent job not found")
     
     # 작업 ID 생성
     job_id = str(uuid.uuid4())
+    client_id = get_client_id(request)
     
-    # uploads 디렉토리가 없으면 생성
-    os.makedirs("uploads", exist_ok=True)
-    
-    # 고유한 파일명 생성
-    unique_filename = f"{job_id}_{file.filename}"
-    file_path = f"uploads/{unique_filename}"
-    
-    # 비동기로 파일 저장 및 DB 작업 실행
-    await save_file_async(file_path, file)
-    await create_job_in_db(job_id, db)
+    # 같은 Idempotency-Key로 이미 접수된 작업이 있으면 그 작업을 반환
+    reserved = False
+    blob = None
+    if idempotency_key:
+        try:
+            existing_job_id = idempotency.reserve(get_redis(), client_id, idempotency_key, job_id)
+            if existing_job_id:
+                logger.info(f"Idempotent replay for key {idempotency_key}: {existing_job_id}")
+                response.headers["Idempotent-Replayed"] = "true"
+                status = get_redis().hget(f"job:{existing_job_id}", "status") or "pending"
+                return {"jobId": existing_job_id, "status": status}
+            reserved = True
+        except Exception as e:
+            logger.warning(f"Failed to check Idempotency-Key: {str(e)}")
     
-    # Celery 작업 등록
-    celery_app.send_task(
-        "app.tasks.process_guideline.process_guideline",
-        args=[job_id, unique_filename],
-        task_id=job_id
-    )
+    try:
+        # 부하에 따른 접수 제어 (Redis 조회와 디스크 확인이 동기식이므로 스레드 풀에서 실행)
+        try:
+            await run_in_threadpool(check_admission, client_id)
+        except AdmissionRejected as e:
+            logger.warning(f"Job rejected: {e.reason} (retry after {e.retry_after}s)")
+            raise HTTPException(
+                status_code=e.status_code,
+                detail=e.reason,
+                headers={"Retry-After": str(e.retry_after)}
+            )
+        
+        # 내용 기준 저장소에 파일 저장 및 DB 작업 실행
+        blob = await save_upload(job_id, file)
+        await create_job_in_db(job_id, db, parent_job_id)
+        if parent_job_id:
+            get_redis().hset(f"job:{job_id}", "parent_job_id", parent_job_id)
+        
+        # 완료 시각 추정을 위한 작업 특징과 대기 순서 기록
+        try:
+            mark_enqueued(get_redis(), job_id, file_ext.lstrip("."), job_lane(), blob.size)
+        except Exception as e:
+            logger.warning(f"Failed to record job features for {job_id}: {str(e)}")
+        try:
+            deadlines.mark_job(get_redis(), job_id, deadline_at)
+        except Exception as e:
+            logger.warning(f"Failed to record deadline for {job_id}: {str(e)}")
+        
+        # Celery 작업 등록 (워커는 다이제스트로 저장소의 파일을 찾음)
+        # STAGED_PIPELINE이면 추출 단계부터 단계별 큐로 처리
+        celery_app.send_task(
+            "app.tasks.stages.extract_stage" if settings.STAGED_PIPELINE else "app.tasks.process_guideline.process_guideline",
+            args=[job_id, file.filename],
+            kwargs={"profile": should_profile(profile), "blob": blob.digest, "parent_job_id": parent_job_id, "pipeline": pipeline},
+            task_id=job_id
+        )
+    except Exception:
+        # 접수에 실패하면 재시도가 새 작업을 만들 수 있도록 예약 해제
+        if reserved:
+            try:
+                idempotency.release(get_redis(), client_id, idempotency_key, job_id)
+            except Exception as e:
+                logger.warning(f"Failed to release Idempotency-Key: {str(e)}")
+        # 등록되지 않은 작업의 파일 참조는 해제해 보관 기간 후 정리되도록 함
+        if blob is not None:
+            try:
+                release_blob(get_redis(), blob.digest, job_id)
+            except Exception as e:
+                logger.warning(f"Failed to release blob {blob.digest}: {str(e)}")
+        raise
     
     return {"jobId": job_id, "status": "pending"}
 
-@router.get("/jobs/{event_id}")
+def _parse_checklist(value):
+    if not value:
+        return None
+    try:
+        return json.loads(value)
+    except ValueError:
+        return [value]
+
+def _strip_job_prefix(job_id: str, filename: str) -> str:
+    # 파일명에서 job_id 제거
+    if filename and filename.startswith(f"{job_id}_"):
+        return filename[len(job_id) + 1:]
+    return filename
+
+def job_payload_from_redis(job_id: str, job_data: dict) -> dict:
+    """Redis에 기록된 작업 상태로 상태 응답을 만듭니다."""
+    status = job_data.get("status", JobStatus.PENDING.value)
+    summary = job_data.get("summary") or None
+    checklist = _parse_checklist(job_data.get("checklist"))
+    error = job_data.get("error")
+
+    result = None
+    if status == JobStatus.COMPLETED.value:
+        result = {"summary": summary or "", "checklist": checklist or []}
+    elif status == JobStatus.FAILED.value and error:
+        result = {"error": error}
+
+    return {
+        "jobId": job_id,
+        "status": status,
+        "filename": _strip_job_prefix(job_id, job_data.get("filename", "")),
+        "createdAt": job_data.get("enqueued_at"),
+        "updatedAt": job_data.get("updated_at") or job_data.get("enqueued_at"),
+        "result": result,
+        "summary": summary,
+        "checklist": checklist,
+        "started_at": job_data.get("started_at"),
+        "completed_at": job_data.get("completed_at"),
+        "failed_at": job_data.get("failed_at"),
+        "error": error,
+        "extractor": job_data.get("extractor"),
+        "nearDuplicateOf": job_data.get("near_duplicate_of"),
+        "nearDuplicateSimilarity": float(job_data["near_duplicate_similarity"]) if job_data.get("near_duplicate_similarity") else None,
+        "modelTier": job_data.get("model_tier"),
+        "parentJobId": job_data.get("parent_job_id"),
+        "deadlineAt": job_data.get("deadline_at"),
+        "replayOf": job_data.get("replay_of"),
+        "skipReason": job_data.get("skip_reason"),
+        "sections": {
+            "total": int(job_data["sections_total"]),
+            "reused": int(job_data["sections_reused"])
+        } if job_data.get("sections_total") else None
+    }
+
+def job_payload_from_db(job: Job) -> dict:
+    """DB의 작업 행으로 상태 응답을 만듭니다."""
+    result = job.result
+    # 실패한 작업은 결과가 JSON 문자열로 저장되어 있음
+    if isinstance(result, str):
+        try:
+            result = json.loads(result)
+        except ValueError:
+            result = {"error": result}
+    result = result or None
+
+    status = JobStatus(job.status).value
+    return {
+        "jobId": job.id,
+        "status": status,
+        "filename": None,
+        "createdAt": job.created_at.isoformat() if job.created_at else None,
+        "updatedAt": job.updated_at.isoformat() if job.updated_at else None,
+        "result": result,
+        "summary": result.get("summary") if result else None,
+        "checklist": result.get("checklist") if result else None,
+        "started_at": None,
+        "completed_at": None,
+        "failed_at": None,
+        "error": result.get("error") if result else None,
+        "extractor": None,
+        "parentJobId": job.parent_job_id,
+        "sections": result.get("sections") if result else None
+    }
+
+def _json_response(body: str, etag: str, terminal: bool) -> Response:
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={
+            "ETag": etag,
+            # 완료된 작업은 바뀌지 않으므로 브라우저가 재요청 없이 재사용
+            "Cache-Control": "private, max-age=3600" if terminal else "no-cache"
+        }
+    )
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
+
+def touch_jobs(job_ids: List[str]):
+    """클라이언트가 아직 작업 결과를 기다리고 있음을 기록합니다 (떠난 클라이언트의 작업을 건너뛰는 데 사용)."""
+    if not job_ids:
+        return
+    try:
+        deadlines.touch(get_redis(), job_ids)
+    except Exception as e:
+        logger.warning(f"Failed to record client liveness: {str(e)}")
+
+class BulkStatusRequest(BaseModel):
+    jobIds: List[str]
+    # 이 시각 이후 바뀐 작업만 반환 (이전 응답의 serverTime)
+    since: Optional[datetime] = None
+    includeResult: bool = False
+
+def _parse_timestamp(value) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+def _compact_payload(payload: dict, include_result: bool) -> dict:
+    compact = {"status": payload["status"], "updatedAt": payload["updatedAt"]}
+    if payload.get("error"):
+        compact["error"] = payload["error"]
+    if include_result and payload["status"] in TERMINAL_STATUSES:
+        compact["result"] = payload["result"]
+    return compact
+
+@router.post("/jobs/status")
+async def get_job_statuses(
+    body: BulkStatusRequest,
+    db: Session = Depends(get_db)
+):
+    """여러 작업의 상태를 한 번에 조회합니다.
+
+    Redis의 작업 상태를 파이프라인 한 번으로 읽고, Redis에 없는 작업만 DB에서 IN 쿼리 한 번으로 조회합니다.
+    since를 주면 그 이후 바뀐 작업만 jobs에 담고 나머지는 unchanged로 돌려줍니다.
+    """
+    job_ids = list(dict.fromkeys(body.jobIds))
+    if len(job_ids) > settings.BULK_STATUS_MAX_IDS:
+        raise HTTPException(status_code=400, detail=f"Too many job IDs (max {settings.BULK_STATUS_MAX_IDS})")
+    server_time = datetime.now().isoformat()
+
+    payloads = {}
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        for job_id in job_ids:
+            pipe.hgetall(f"job:{job_id}")
+        for job_id, job_data in zip(job_ids, pipe.execute()):
+            if job_data:
+                payloads[job_id] = job_payload_from_redis(job_id, job_data)
+    except Exception as e:
+        logger.warning(f"Failed to read job statuses from Redis: {str(e)}")
+    touch_jobs([job_id for job_id, payload in payloads.items() if payload["status"] not in TERMINAL_STATUSES])
+
+    misses = [job_id for job_id in job_ids if job_id not in payloads]
+    if misses:
+        for job in db.query(Job).filter(Job.id.in_(misses)).all():
+            payloads[job.id] = job_payload_from_db(job)
+
+    since = body.since.replace(tzinfo=None) if body.since else None
+    jobs = {}
+    unchanged = []
+    for job_id in job_ids:
+        payload = payloads.get(job_id)
+        if payload is None:
+            continue
+        updated_at = _parse_timestamp(payload["updatedAt"])
+        if since is not None and updated_at is not None and updated_at.replace(tzinfo=None) <= since:
+            unchanged.append(job_id)
+            continue
+        jobs[job_id] = _compact_payload(payload, body.includeResult)
+
+    response = {
+        "jobs": jobs,
+        "notFound": [job_id for job_id in job_ids if job_id not in payloads],
+        "serverTime": server_time
+    }
+    if since is not None:
+        response["unchanged"] = unchanged
+    return response
+
+@router.get("/jobs/{job_id}")
 async def get_job_status(
-    event_id: str,
+    job_id: str,
+    request: Request,
     db: Session = Depends(get_db)
 ):
-    job = db.query(Job).filter(Job.id == event_id).first()
+    """작업 상태를 조회합니다.
+
+    Redis를 먼저 조회하고 없으면 DB를 조회합니다. 완료된 작업은 직렬화해 둔 응답을 그대로 반환하고,
+    If-None-Match가 현재 ETag와 같으면 본문 없이 304를 반환합니다.
+    """
+    if_none_match = request.headers.get("If-None-Match")
+    redis = None
+    job_data = None
+    try:
+        redis = get_redis()
+        cached = terminal_responses.get(redis, job_id)
+        if cached:
+            body, etag = cached
+            if etag_matches(if_none_match, etag):
+                return _not_modified(etag)
+            return _json_response(body, etag, terminal=True)
+        job_data = redis.hgetall(f"job:{job_id}")
+    except Exception as e:
+        logger.warning(f"Failed to read job {job_id} from Redis: {str(e)}")
+
+    if job_data:
+        payload = job_payload_from_redis(job_id, job_data)
+    else:
+        job = db.query(Job).filter(Job.id == job_id).first()
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        payload = job_payload_from_db(job)
+
+    if payload["status"] in TERMINAL_STATUSES:
+        if redis is not None:
+            body, etag = terminal_responses.put(redis, job_id, payload)
+        else:
+            body = serialize(payload)
+            etag = make_etag(body)
+        if etag_matches(if_none_match, etag):
+            return _not_modified(etag)
+        return _json_response(body, etag, terminal=True)
+
+    touch_jobs([job_id])
+    # 진행 중인 작업의 ETag는 작업 상태로만 계산 (예상 시각은 요청마다 조금씩 달라짐)
+    etag = make_etag(payload)
+    if etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+    return _json_response(serialize(with_estimates(payload, job_id, job_data)), etag, terminal=False)
+
+async def load_job_payload(job_id: str) -> Optional[dict]:
+    """WebSocket으로 보낼 작업 상태를 읽습니다 (Redis 우선, 없으면 DB).
+
+    Redis와 DB 클라이언트가 동기식이므로 이벤트 루프를 막지 않도록 스레드 풀에서 읽습니다.
+    """
+    return await run_in_threadpool(_read_job_payload, job_id)
+
+def _read_job_payload(job_id: str) -> Optional[dict]:
+    try:
+        redis = get_redis()
+        cached = terminal_responses.get(redis, job_id)
+        if cached:
+            return json.loads(cached[0])
+        job_data = redis.hgetall(f"job:{job_id}")
+        if job_data:
+            return with_estimates(job_payload_from_redis(job_id, job_data), job_id, job_data)
+    except Exception as e:
+        logger.warning(f"Failed to read job {job_id} from Redis: {str(e)}")
+
+    with SessionLocal() as db:
+        job = db.query(Job).filter(Job.id == job_id).first()
+        return job_payload_from_db(job) if job else None
+
+# API 프로세스당 하나의 Redis 구독을 공유하는 작업 상태 전이 허브
+# 구독 중인 작업은 JOB_LIVENESS_INTERVAL마다 클라이언트가 기다리고 있다고 기록
+job_events = JobEventHub(
+    load_job_payload,
+    terminal_statuses=[status.value for status in TERMINAL_STATUSES],
+    on_heartbeat=touch_jobs
+)
+
+async def _send_job_events(websocket: WebSocket, subscriber):
+    while True:
+        message = await subscriber.queue.get()
+        if message is None:
+            # 메시지를 제때 받지 못한 클라이언트는 연결을 끊고 다시 구독하게 함
+            await websocket.close(code=1013)
+            return
+        await websocket.send_json(message)
+
+@router.websocket("/ws/jobs")
+async def job_events_socket(websocket: WebSocket):
+    """여러 작업의 상태 전이를 하나의 연결로 받는 WebSocket
+
+    클라이언트 메시지: {"action": "subscribe" | "unsubscribe", "jobIds": [...]}
+    서버 메시지: 구독 시 {"type": "snapshot", "jobId", "job"}, 상태가 바뀔 때 {"type": "update", "job"}
+    완료/실패/취소된 작업은 마지막 메시지를 보낸 뒤 자동으로 구독이 해제됩니다.
+    """
+    await websocket.accept()
+    subscriber = job_events.connect()
+    sender = asyncio.create_task(_send_job_events(websocket, subscriber))
+    try:
+        while True:
+            try:
+                message = await websocket.receive_json()
+            except ValueError:
+                subscriber.offer({"type": "error", "detail": "Invalid JSON"})
+                continue
+
+            action = message.get("action") if isinstance(message, dict) else None
+            job_ids = message.get("jobIds") if isinstance(message, dict) else None
+            if action not in ("subscribe", "unsubscribe") or not isinstance(job_ids, list) \
+                    or not all(isinstance(job_id, str) for job_id in job_ids):
+                subscriber.offer({"type": "error", "detail": "Expected {action: subscribe|unsubscribe, jobIds: [...]}"})
+                continue
+
+            if action == "subscribe":
+                rejected = await job_events.subscribe(subscriber, job_ids)
+                if rejected:
+                    subscriber.offer({
+                        "type": "error",
+                        "detail": f"Subscription limit ({settings.WS_MAX_SUBSCRIPTIONS}) exceeded",
+                        "jobIds": rejected
+                    })
+            else:
+                job_events.unsubscribe(subscriber, job_ids)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        job_events.disconnect(subscriber)
+        sender.cancel()
+
+@router.delete("/jobs/{job_id}")
+async def cancel_job(
+    job_id: str,
+    db: Session = Depends(get_db)
+):
+    job = db.query(Job).filter(Job.id == job_id).first()
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
+    if job.status in TERMINAL_STATUSES:
+        raise HTTPException(status_code=409, detail=f"Job already {JobStatus(job.status).value}")
     
-    return {
-        "jobId": job.id,
-        "status": job.status,
-        "createdAt": job.created_at,
-        "updatedAt": job.updated_at,
-        "result": job.result
-    }
+    # 처리 중인 워커는 취소 플래그를 보고 텍스트 추출과 에이전트 요청을 중단
+    redis = get_redis()
+    request_cancel(redis, job_id)
+    
+    # 아직 대기 중인 작업은 워커가 받는 즉시 버리도록 revoke
+    celery_app.control.revoke(job_id)
+    
+    job.status = JobStatus.CANCELLED
+    db.commit()
+    
+    cancelled_at = datetime.now().isoformat()
+    pipe = redis.pipeline()
+    pipe.hset(f"job:{job_id}", mapping={
+        "status": JobStatus.CANCELLED.value,
+        "cancelled_at": cancelled_at,
+        "updated_at": cancelled_at
+    })
+    pipe.zrem(PENDING_JOBS_KEY, job_id)
+    pipe.zrem(deadlines.LAST_SEEN_KEY, job_id)
+    publish_job_event(pipe, job_id, JobStatus.CANCELLED.value)
+    pipe.execute()
+    
+    # 대기 중에 revoke된 작업은 워커가 참조를 해제하지 못하므로 여기서 해제
+    digest = redis.hget(f"job:{job_id}", "blob")
+    if digest:
+        release_blob(redis, digest, job_id)
+    
+    logger.info(f"Job cancelled: {job_id}")
+    return {"jobId": job_id, "status": JobStatus.CANCELLED.value}
 
 @router.get("/jobs/{event_id}/stream")
 async def stream_job_status(
@@ -110,74 +553,23 @@ async def stream_job_status(
                 yield f"data: {json.dumps({'error': 'Job not found'})}\n\n"
                 break
             
-            data = {
+            data = with_estimates({
                 "id": job.id,
                 "status": job.status,
                 "createdAt": job.created_at.isoformat() if job.created_at else None,
                 "updatedAt": job.updated_at.isoformat() if job.updated_at else None,
                 "result": job.result
-            }
+            }, job.id)
             
             yield f"data: {json.dumps(data)}\n\n"
             
-            if job.status in ["completed", "failed"]:
+            if job.status in TERMINAL_STATUSES:
                 break
+            touch_jobs([event_id])
                 
             await asyncio.sleep(2)
     
     return StreamingResponse(
         event_generator(),
         media_type="text/event-stream"
-    ) 
-
-@router.get("/jobs/{job_id}")
-async def get_job_status(
-    job_id: str,
-    db: Session = Depends(get_db)
-):
-    logger.info(f"Fetching job status for job_id: {job_id}")
-    
-    # Redis에서 먼저 확인
-    job_data = get_redis().hgetall(f"job:{job_id}")
-    if job_data:
-        logger.info(f"Retrieved Redis data: {job_data}")
-        
-        # JSON 문자열을 파싱
-        summary = job_data.get("summary", None)
-        checklist = None
-        if job_data.get("checklist"):
-            try:
-                checklist = json.loads(job_data["checklist"])
-            except Exception as e:
-                checklist = [job_data["checklist"]]
-        
-        # 파일명에서 job_id 제거
-        filename = job_data.get("filename", "")
-        if filename and filename.startswith(f"{job_id}_"):
-            filename = filename[len(job_id) + 1:]
-        
-        return {
-            "jobId": job_id,
-            "status": job_data.get("status", "pending"),
-            "filename": filename,
-            "summary": summary,
-            "checklist": checklist,
-            "started_at": job_data.get("started_at"),
-            "completed_at": job_data.get("completed_at"),
-            "failed_at": job_data.get("failed_at"),
-            "error": job_data.get("error")
-        }
-    
-    # Redis에 없으면 DB에서 확인
-    job = db.query(Job).filter(Job.id == job_id).first()
-    if not job:
-        logger.error(f"Job not found: {job_id}")
-        raise HTTPException(status_code=404, detail="Job not found")
-    
-    return {
-        "jobId": job.id,
-        "status": job.status,
-        "createdAt": job.created_at,
-        "updatedAt": job.updated_at,
-        "result": job.result
-    } 
\ No newline at end of file
+    )
@@ -0,0 +1,71 @@
+import logging
+import math
+import time
+from app.core import metrics
+from app.core.config import settings
+from app.core.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+CLIENT_QUOTA_KEY = "quota:{client_id}:{window}"
+
+class AdmissionRejected(Exception):
+    """작업 접수가 거부되었을 때 발생하는 예외"""
+
+    def __init__(self, status_code: int, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.status_code = status_code
+        self.reason = reason
+        self.retry_after = retry_after
+
+def _retry_after(seconds: float) -> int:
+    return int(min(max(math.ceil(seconds), 1), settings.ADMISSION_MAX_RETRY_AFTER))
+
+def _check_client_quota(client_id: str):
+    limit = settings.CLIENT_QUOTA_PER_MINUTE
+    if limit <= 0 or not client_id:
+        return
+
+    now = time.time()
+    window = int(now // 60)
+    key = CLIENT_QUOTA_KEY.format(client_id=client_id, window=window)
+    try:
+        pipe = get_redis().pipeline()
+        pipe.incr(key)
+        pipe.expire(key, 120)
+        count = pipe.execute()[0]
+    except Exception as e:
+        logger.warning(f"Failed to check client quota: {str(e)}")
+        return
+
+    if count > limit:
+        raise AdmissionRejected(429, "Client quota exceeded", _retry_after((window + 1) * 60 - now))
+
+def check_admission(client_id: str = None):
+    """새 작업을 받을 수 있는지 확인하고, 불가하면 AdmissionRejected를 발생시킵니다.
+
+    부하 지표는 ADMISSION_CACHE_TTL 동안 캐시되므로 요청마다 드는 비용은 O(1)입니다.
+    """
+    _check_client_quota(client_id)
+
+    max_depth = settings.ADMISSION_MAX_QUEUE_DEPTH
+    max_backlog = settings.ADMISSION_MAX_BACKLOG_SECONDS
+    min_free = settings.ADMISSION_MIN_FREE_DISK_MB * 1024 * 1024
+    if max_depth <= 0 and max_backlog <= 0 and min_free <= 0:
+        return
+
+    snapshot = metrics.get_load_snapshot()
+
+    if min_free > 0 and snapshot.free_disk_bytes is not None and snapshot.free_disk_bytes < min_free:
+        raise AdmissionRejected(503, "Upload storage is full", settings.ADMISSION_DISK_RETRY_AFTER)
+
+    if max_depth > 0 and snapshot.queue_depth >= max_depth:
+        excess = snapshot.queue_depth - max_depth + 1
+        raise AdmissionRejected(503, "Job queue is full", _retry_after(snapshot.drain_seconds(excess)))
+
+    if max_backlog > 0:
+        backlog = snapshot.drain_seconds(snapshot.queue_depth)
+        if backlog >= max_backlog:
+            raise AdmissionRejected(503, "Job backlog is too long", _retry_after(backlog - max_backlog))
+
+    snapshot.note_admitted()
@@ -0,0 +1,113 @@
+import logging
+import math
+import socket
+import time
+from celery.worker.autoscale import Autoscaler
+from app.core import metrics
+from app.core.config import settings
+from app.core.redis_client import get_broker_redis, get_redis
+
+logger = logging.getLogger(__name__)
+
+# 오토스케일러가 살아있는 워커를 등록하는 Redis 키
+WORKERS_KEY = "autoscale:workers"
+
+def compute_target_concurrency(
+    queue_depth: int,
+    active: int,
+    avg_duration: float,
+    agent_headroom: int,
+    min_concurrency: int,
+    max_concurrency: int,
+    target_drain_seconds: float,
+    worker_count: int = 1
+) -> int:
+    """대기열 길이, 평균 처리 시간, 에이전트 여유량으로 워커 하나의 목표 동시성을 계산합니다.
+
+    agent_headroom이 음수이면 에이전트 호출 한도가 없는 것으로 간주합니다.
+    """
+    backlog = queue_depth + active
+    if backlog <= 0:
+        return min_concurrency
+
+    # 목표 시간 안에 대기열을 비우는 데 필요한 전체 동시성을 워커 수로 나눔
+    needed_total = math.ceil(backlog * avg_duration / max(target_drain_seconds, 1.0))
+    target = math.ceil(needed_total / max(worker_count, 1))
+
+    # 처리할 작업보다 많은 프로세스는 필요 없음
+    target = min(target, backlog)
+
+    # 에이전트 rate limit 여유량 이상으로 늘리지 않음
+    if agent_headroom >= 0:
+        target = min(target, active + agent_headroom)
+
+    return max(min_concurrency, min(max_concurrency, target))
+
+class QueueDepthAutoscaler(Autoscaler):
+    """main-queue 길이 기반으로 풀 프로세스 수를 조절하는 Celery 오토스케일러
+
+    celery_app.conf.worker_autoscaler로 등록하고 `--autoscale=MAX,MIN`으로 실행합니다.
+    축소는 유휴 프로세스만 종료하므로(pool.shrink) 처리 중인 작업은 끝까지 실행됩니다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.hostname = getattr(self.worker, "hostname", None) or socket.gethostname()
+        self._target = self.min_concurrency
+        self._last_poll = 0.0
+        self._last_scale = float("-inf")
+
+    def _poll_target(self) -> int:
+        redis = get_redis()
+        now = time.time()
+
+        pipe = redis.pipeline()
+        pipe.zadd(WORKERS_KEY, {self.hostname: now})
+        pipe.zremrangebyscore(WORKERS_KEY, "-inf", now - settings.AUTOSCALE_POLL_INTERVAL * 3)
+        pipe.zcard(WORKERS_KEY)
+        worker_count = pipe.execute()[-1]
+
+        headroom = -1
+        if settings.AGENT_MAX_CONCURRENT_REQUESTS > 0:
+            headroom = max(0, settings.AGENT_MAX_CONCURRENT_REQUESTS - metrics.get_agent_inflight(redis))
+
+        return compute_target_concurrency(
+            queue_depth=metrics.get_backlog_depth(get_broker_redis()),
+            active=self.qty,
+            avg_duration=metrics.get_average_job_duration(redis),
+            agent_headroom=headroom,
+            min_concurrency=self.min_concurrency,
+            max_concurrency=self.max_concurrency,
+            target_drain_seconds=settings.AUTOSCALE_TARGET_DRAIN_SECONDS,
+            worker_count=worker_count
+        )
+
+    def _maybe_scale(self, req=None):
+        now = time.monotonic()
+        if now - self._last_poll >= settings.AUTOSCALE_POLL_INTERVAL:
+            self._last_poll = now
+            try:
+                self._target = self._poll_target()
+            except Exception as e:
+                # Redis 장애 시 현재 목표값 유지
+                logger.warning(f"Autoscaler failed to read queue metrics: {str(e)}")
+
+        procs = self.processes
+        since_last_scale = now - self._last_scale
+        if self._target > procs and since_last_scale >= settings.AUTOSCALE_UP_COOLDOWN:
+            self._last_scale = now
+            self.scale_up(self._target - procs)
+            return True
+        if self._target < procs and since_last_scale >= settings.AUTOSCALE_DOWN_COOLDOWN:
+            self._last_scale = now
+            self.scale_down(procs - self._target)
+            return True
+
+    def scale_down(self, n):
+        # 기본 구현은 마지막 확장 이후 keepalive를 요구하지만 쿨다운은 _maybe_scale에서 처리
+        return self._shrink(n)
+
+    def info(self):
+        info = super().info()
+        info["target"] = self._target
+        return info
@@ -0,0 +1,88 @@
+import asyncio
+import contextlib
+import contextvars
+import logging
+import time
+from typing import Optional
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CANCEL_KEY = "job:{job_id}:cancel"
+
+class JobCancelled(Exception):
+    """작업 취소 요청으로 처리를 중단할 때 발생하는 예외"""
+
+def request_cancel(redis, job_id: str):
+    """작업 취소를 요청합니다 (처리 중인 워커가 확인하는 플래그)."""
+    redis.set(CANCEL_KEY.format(job_id=job_id), "1", ex=settings.CANCEL_FLAG_TTL)
+
+def is_cancel_requested(redis, job_id: str) -> bool:
+    """작업 취소 요청 여부를 반환합니다."""
+    return redis.get(CANCEL_KEY.format(job_id=job_id)) == "1"
+
+class CancellationToken:
+    """작업 하나의 취소 요청을 확인하는 토큰 (Redis 조회는 CANCEL_CHECK_INTERVAL마다 한 번)"""
+
+    def __init__(self, redis, job_id: str):
+        self.redis = redis
+        self.job_id = job_id
+        self.cancelled = False
+        self._last_check = float("-inf")
+
+    def is_requested(self) -> bool:
+        if self.cancelled:
+            return True
+        now = time.monotonic()
+        if now - self._last_check < settings.CANCEL_CHECK_INTERVAL:
+            return False
+        self._last_check = now
+        try:
+            self.cancelled = is_cancel_requested(self.redis, self.job_id)
+        except Exception as e:
+            # Redis 장애로 처리 자체가 중단되지 않도록 함
+            logger.warning(f"Failed to check cancellation for job {self.job_id}: {str(e)}")
+        return self.cancelled
+
+    def check(self):
+        """취소가 요청되었으면 JobCancelled를 발생시킵니다."""
+        if self.is_requested():
+            raise JobCancelled(f"Job {self.job_id} was cancelled")
+
+_current_token: contextvars.ContextVar[Optional[CancellationToken]] = contextvars.ContextVar(
+    "cancellation_token", default=None
+)
+
+@contextlib.contextmanager
+def cancellation_scope(token: CancellationToken):
+    """블록 안의 checkpoint() 호출이 주어진 토큰을 확인하도록 합니다."""
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
+
+def checkpoint():
+    """현재 작업이 취소되었으면 JobCancelled를 발생시킵니다.
+
+    텍스트 추출처럼 오래 걸리는 동기 루프 안에서 호출합니다. 토큰이 없으면 아무 일도 하지 않습니다.
+    """
+    token = _current_token.get()
+    if token is not None:
+        token.check()
+
+async def run_cancellable(coro, token: CancellationToken):
+    """코루틴을 실행하다가 취소가 요청되면 즉시 중단하고 JobCancelled를 발생시킵니다.
+
+    진행 중인 aiohttp 요청도 태스크 취소와 함께 중단됩니다.
+    """
+    task = asyncio.ensure_future(coro)
+    while True:
+        done, _ = await asyncio.wait({task}, timeout=settings.CANCEL_CHECK_INTERVAL)
+        if done:
+            return task.result()
+        if token.is_requested():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+            raise JobCancelled(f"Job {token.job_id} was cancelled")
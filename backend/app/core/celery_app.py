@@ -10,12 +10,44 @@ celery_app = Celery(
     "worker",
     broker=broker_url,
     backend=result_backend,
-    include=['app.tasks.process_guideline']  # 태스크 모듈 명시적 포함
+    include=['app.tasks.process_guideline', 'app.tasks.packing', 'app.tasks.maintenance', 'app.tasks.stages']  # 태스크 모듈 명시적 포함
 )
 
+# 기본 작업 큐
+MAIN_QUEUE = "main-queue"
+# 단계별 파이프라인 큐 (STAGED_PIPELINE, 단계마다 워커를 따로 띄움)
+EXTRACT_QUEUE = "extract-queue"
+AGENT_QUEUE = "agent-queue"
+PERSIST_QUEUE = "persist-queue"
+STAGE_QUEUES = (EXTRACT_QUEUE, AGENT_QUEUE, PERSIST_QUEUE)
+# 주기 정리 작업 큐 (문서 대기열이 밀리거나 회로가 열려 main-queue 소비가 멈춰도 계속 실행)
+MAINTENANCE_QUEUE = "maintenance"
+
+def job_lane() -> str:
+    """새 문서 작업이 처음 들어가는 큐 (STAGED_PIPELINE이면 추출 단계 큐)"""
+    return EXTRACT_QUEUE if settings.STAGED_PIPELINE else MAIN_QUEUE
+
 # 태스크 라우팅 설정
 celery_app.conf.task_routes = {
-    "app.tasks.process_guideline.process_guideline": {"queue": "main-queue"}  # 전체 경로로 수정
+    "app.tasks.process_guideline.process_guideline": {"queue": MAIN_QUEUE},  # 전체 경로로 수정
+    "app.tasks.packing.process_pack": {"queue": MAIN_QUEUE},
+    "app.tasks.maintenance.sweep_blobs": {"queue": MAINTENANCE_QUEUE},
+    "app.tasks.maintenance.replay_dead_letters": {"queue": MAINTENANCE_QUEUE},
+    "app.tasks.stages.extract_stage": {"queue": EXTRACT_QUEUE},
+    "app.tasks.stages.agent_stage": {"queue": AGENT_QUEUE},
+    "app.tasks.stages.persist_stage": {"queue": PERSIST_QUEUE}
+}
+
+# 주기 작업 (celery beat)
+celery_app.conf.beat_schedule = {
+    "sweep-blobs": {
+        "task": "app.tasks.maintenance.sweep_blobs",
+        "schedule": settings.BLOB_SWEEP_INTERVAL
+    },
+    "replay-dead-letters": {
+        "task": "app.tasks.maintenance.replay_dead_letters",
+        "schedule": settings.DLQ_REPLAY_INTERVAL
+    }
 }
 
 # 태스크 설정
@@ -31,7 +63,8 @@ celery_app.conf.update(
     task_queue_max_priority=10,
     task_default_priority=5,
     worker_prefetch_multiplier=1,
-    worker_concurrency=1,  # 동시 작업 수 제한
+    worker_concurrency=1,  # 동시 작업 수 제한 (--autoscale 사용 시 오토스케일러가 조절)
+    worker_autoscaler='app.core.autoscale:QueueDepthAutoscaler',  # 대기열 길이 기반 오토스케일
     task_track_started=True,  # 작업 시작 추적
     task_time_limit=3600,  # 작업 시간 제한 (1시간)
     task_soft_time_limit=3000  # 소프트 시간 제한 (50분)
@@ -0,0 +1,122 @@
+import logging
+import threading
+import time
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+class CircuitBreaker:
+    """여러 워커가 Redis로 상태를 공유하는 서킷 브레이커
+
+    - closed: 요청 허용. FAILURE_WINDOW 안에 FAILURE_THRESHOLD번 실패하면 open
+    - open: 요청 차단. RESET_TIMEOUT이 지나면 하나의 워커만 시험 요청(half-open)
+    - 시험 요청이 성공하면 closed, 실패하면 다시 open
+    """
+
+    def __init__(self, redis, name: str):
+        self.redis = redis
+        self.name = name
+        self.state_key = f"breaker:{name}"
+        self.failures_key = f"breaker:{name}:failures"
+        self.probe_key = f"breaker:{name}:probe"
+
+    def _opened_at(self) -> float:
+        return float(self.redis.hget(self.state_key, "opened_at") or 0)
+
+    def state(self) -> str:
+        """현재 상태를 반환합니다."""
+        data = self.redis.hgetall(self.state_key)
+        if data.get("state") != OPEN:
+            return CLOSED
+        if time.time() - float(data.get("opened_at", 0)) >= settings.BREAKER_RESET_TIMEOUT:
+            return HALF_OPEN
+        return OPEN
+
+    def retry_after(self) -> float:
+        """요청을 다시 시도할 수 있을 때까지 남은 시간(초)을 반환합니다."""
+        remaining = settings.BREAKER_RESET_TIMEOUT - (time.time() - self._opened_at())
+        return max(remaining, 0.0)
+
+    def is_blocked(self) -> bool:
+        """지금은 요청할 수 없는지 반환합니다 (open이거나, half-open인데 다른 워커가 시험 요청 중).
+
+        시험 요청 자리를 얻지는 않으므로 작업 시작 전에 미리 확인하는 데 사용합니다.
+        """
+        state = self.state()
+        return state == OPEN or (state == HALF_OPEN and self.redis.get(self.probe_key) is not None)
+
+    def allow_request(self) -> bool:
+        """요청을 보내도 되는지 반환합니다 (half-open에서는 하나의 시험 요청만 허용)."""
+        state = self.state()
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN:
+            return bool(self.redis.set(self.probe_key, "1", nx=True, ex=settings.BREAKER_PROBE_TIMEOUT))
+        return False
+
+    def record_success(self):
+        """요청 성공을 기록합니다."""
+        if self.redis.hget(self.state_key, "state") == OPEN:
+            logger.info(f"Circuit breaker {self.name} closed")
+        pipe = self.redis.pipeline()
+        pipe.hset(self.state_key, mapping={"state": CLOSED, "opened_at": 0})
+        pipe.delete(self.failures_key, self.probe_key)
+        pipe.execute()
+
+    def release_probe(self):
+        """결과를 알 수 없이 끝난 half-open 시험 요청의 자리를 반납합니다 (다른 워커가 다시 시험할 수 있음)."""
+        self.redis.delete(self.probe_key)
+
+    def record_failure(self):
+        """일시적 실패를 기록하고, 한도를 넘으면 회로를 엽니다."""
+        pipe = self.redis.pipeline()
+        pipe.incr(self.failures_key)
+        pipe.expire(self.failures_key, settings.BREAKER_FAILURE_WINDOW)
+        failures = pipe.execute()[0]
+
+        # half-open 시험 요청이 실패했거나 실패 한도를 넘으면 회로를 (다시) 엶
+        was_probe = self.redis.delete(self.probe_key)
+        if was_probe or failures >= settings.BREAKER_FAILURE_THRESHOLD:
+            logger.warning(f"Circuit breaker {self.name} opened after {failures} failures")
+            self.redis.hset(self.state_key, mapping={"state": OPEN, "opened_at": time.time()})
+
+class ConsumerGate(threading.Thread):
+    """회로가 열려 있는 동안 워커의 큐 소비를 멈추는 백그라운드 스레드
+
+    회로가 열리면 cancel_consumer로 큐 소비를 중단하고, 닫히거나 시험 요청이 가능해지면 다시 소비합니다.
+    대기열의 작업은 실패로 처리되지 않고 브로커에 남아 있습니다.
+    """
+
+    def __init__(self, app, breaker_factory, queue: str, hostname: str):
+        super().__init__(name="breaker-consumer-gate", daemon=True)
+        self.app = app
+        self.breaker_factory = breaker_factory
+        self.queue = queue
+        self.hostname = hostname
+        self.paused = False
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(settings.BREAKER_GATE_INTERVAL):
+            try:
+                self.tick()
+            except Exception as e:
+                logger.warning(f"Consumer gate check failed: {str(e)}")
+
+    def tick(self):
+        is_open = self.breaker_factory().state() == OPEN
+        if is_open and not self.paused:
+            logger.warning(f"Pausing consumption of {self.queue} on {self.hostname}: circuit open")
+            self.app.control.cancel_consumer(self.queue, destination=[self.hostname])
+            self.paused = True
+        elif not is_open and self.paused:
+            logger.info(f"Resuming consumption of {self.queue} on {self.hostname}")
+            self.app.control.add_consumer(self.queue, destination=[self.hostname])
+            self.paused = False
+
+    def stop(self):
+        self._stop_event.set()
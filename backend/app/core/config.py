@@ -12,6 +12,8 @@ class Settings(BaseSettings):
     REDIS_HOST: str = "redis"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
+    REDIS_SOCKET_TIMEOUT: float = 1.0
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 1.0
     
     # 데이터베이스 설정
     DATABASE_URL: str = DATABASE_URL
@@ -26,7 +28,138 @@ class Settings(BaseSettings):
     
     # Agent API 설정
     AGENT_API_URL: str = "http://agent:8001"
-    
+
+    AGENT_REQUEST_TIMEOUT: float = 600.0  # 에이전트 요청 타임아웃 (초)
+
+    # 에이전트 재시도 설정 (일시적 오류만 재시도)
+    AGENT_MAX_RETRIES: int = 5
+    AGENT_RETRY_BASE_DELAY: float = 5.0
+    AGENT_RETRY_MAX_DELAY: float = 300.0
+    AGENT_STAGE_MAX_ATTEMPTS: int = 3  # 출력 형식이 잘못된 단계(요약/체크리스트)만 다시 실행하는 최대 횟수
+
+    # 에이전트 파이프라인 (작업별로 pipeline 파라미터로 바꿀 수 있음)
+    AGENT_PIPELINE: str = "sequential"  # sequential: 요약 후 체크리스트, parallel: 요약과 체크리스트를 동시에 실행
+    AGENT_RECONCILE: bool = False  # parallel 파이프라인 뒤에 체크리스트를 요약과 대조하는 보정 단계 실행
+
+    # 문서 크기별 모델 티어 ("이름=모델:최대 입력 토큰:타임아웃(초)", 비어 있으면 에이전트에 지정된 모델 사용)
+    # 예: "fast=gemini-2.0-flash-lite:2000:120,standard=gemini-2.0-flash:100000:600,long=gemini-1.5-pro:2000000:1800"
+    AGENT_MODEL_TIERS: str = ""
+    AGENT_MODEL_PRICES: str = ""  # 티어별 비용 계산용 100만 토큰당 가격 (예: "gemini-2.0-flash=0.10/0.40")
+
+    # 유사 문서 감지 설정 (MinHash LSH 색인, 완료된 작업만 색인)
+    NEAR_DUP_POLICY: str = "off"  # off: 사용 안 함, mark: 유사 문서로 표시만, reuse: 유사 문서의 결과 재사용
+    NEAR_DUP_THRESHOLD: float = 0.9  # 유사 문서로 판단하는 최소 유사도 (추정 Jaccard, 0.7 미만은 후보 검색에서 놓칠 수 있음)
+    NEAR_DUP_MAX_DOCUMENTS: int = 1_000_000  # 색인에 남기는 최대 작업 수 (넘으면 가장 먼저 색인한 작업부터 정리)
+    NEAR_DUP_RETENTION: int = 90 * 86400  # 색인 보관 기간 (초, 0이면 기간으로 정리하지 않음)
+
+    # 문서 새 버전의 섹션 단위 재처리 설정
+    SECTION_MAX_CHARS: int = 4000  # 제목으로 나뉘지 않는 긴 본문을 나누는 섹션 크기
+    SECTION_SUMMARY_TTL: int = 90 * 86400  # 다음 버전이 재사용할 작업별 섹션 요약의 보관 기간 (초)
+    SECTION_CACHE_ALL_JOBS: bool = True  # 이전 버전이 없는 작업도 섹션 요약을 만들어 첫 새 버전이 재사용
+
+    # 단계별 파이프라인 설정 (추출/에이전트/저장을 큐를 나눠 처리하고, 단계마다 워커 풀과 동시성을 따로 설정)
+    STAGED_PIPELINE: bool = False
+    STAGE_PAYLOAD_TTL: int = 86400  # 단계 사이에 Redis로 넘기는 추출 텍스트와 결과의 보관 시간
+    STAGE_METRICS_WINDOW: int = 300  # 단계별 처리량/이용률 계산 윈도우 (초)
+    # 이용률 계산에 쓰는 단계별 워커 동시성 (각 워커의 --concurrency와 맞춤)
+    EXTRACT_CONCURRENCY: int = 2
+    AGENT_CONCURRENCY: int = 8
+    PERSIST_CONCURRENCY: int = 2
+
+    # 짧은 문서 묶음 처리 설정 (여러 문서를 에이전트 한 번의 실행으로 처리)
+    PACKING_ENABLED: bool = False
+    PACK_MAX_DOCS: int = 8  # 한 번에 묶는 최대 문서 수
+    PACK_MAX_WAIT: float = 2.0  # 묶음을 모으며 기다리는 최대 시간 (초, 작업당 추가 지연 상한)
+    PACK_MAX_TOKENS: int = 1500  # 묶음 처리 대상 문서의 최대 토큰 수 (추정치)
+    PACK_CHARS_PER_TOKEN: float = 2.0  # 토큰 수 추정에 쓰는 토큰당 글자 수 (한국어 기준)
+    PACK_TEXT_TTL: int = 3600  # 묶음을 기다리는 문서 텍스트의 보관 시간
+
+    # 에이전트 서킷 브레이커 설정 (워커 간 Redis로 공유)
+    BREAKER_FAILURE_THRESHOLD: int = 5  # FAILURE_WINDOW 안의 실패 횟수
+    BREAKER_FAILURE_WINDOW: int = 60
+    BREAKER_RESET_TIMEOUT: float = 30.0  # 회로가 열린 뒤 시험 요청까지 대기 시간
+    BREAKER_PROBE_TIMEOUT: int = 600
+    BREAKER_GATE_INTERVAL: float = 5.0  # 워커가 회로 상태를 확인해 큐 소비를 멈추는 간격
+
+    # 관리자 API 설정 (비어 있으면 관리자 엔드포인트 비활성화)
+    ADMIN_TOKEN: str = ""
+
+    # 프로파일링 설정
+    PROFILE_SAMPLE_RATE: float = 0.0  # 자동으로 프로파일링할 작업 비율 (0~1)
+    PROFILE_DIR: str = "profiles"
+    PROFILE_TOP_FUNCTIONS: int = 50
+    PROFILE_TOP_ALLOCATIONS: int = 30
+    PROFILE_TRACEMALLOC_FRAMES: int = 10
+
+    # 처리 지표 설정
+    METRICS_DURATION_SAMPLES: int = 100  # 평균 처리 시간 계산에 쓰는 최근 작업 수
+    METRICS_THROUGHPUT_WINDOW: int = 900  # 처리량 계산 윈도우 (초)
+    DEFAULT_JOB_DURATION: float = 60.0  # 기록이 없을 때 가정하는 작업 처리 시간 (초)
+    AGENT_INFLIGHT_STALE_SECONDS: int = 3600
+
+    # 워커 오토스케일 설정 (celery --autoscale=MAX,MIN과 함께 사용)
+    AGENT_MAX_CONCURRENT_REQUESTS: int = 0  # 에이전트 동시 호출 한도 (0이면 제한 없음)
+    AUTOSCALE_QUEUE: str = "main-queue"
+    AUTOSCALE_TARGET_DRAIN_SECONDS: float = 600.0  # 대기열을 비우는 목표 시간
+    AUTOSCALE_POLL_INTERVAL: float = 5.0
+    AUTOSCALE_UP_COOLDOWN: float = 10.0
+    AUTOSCALE_DOWN_COOLDOWN: float = 120.0
+
+    # 업로드 설정
+    UPLOAD_DIR: str = "uploads"
+
+    # 업로드 파일 저장소 설정 (내용의 SHA-256으로 저장해 같은 파일은 한 번만 보관)
+    BLOB_STORE_BACKEND: str = "local"
+    BLOB_STORE_DIR: str = "uploads/blobs"
+    BLOB_RETENTION_SECONDS: int = 7 * 86400  # 참조하는 미완료 작업이 없어진 뒤 보관 기간
+    BLOB_SWEEP_INTERVAL: int = 3600  # 보관 기간이 지난 파일 정리 주기 (celery beat)
+
+    # 텍스트 추출 백엔드 설정
+    EXTRACTOR_BACKENDS: str = ""  # 형식별 백엔드 고정 (예: "pdf=pdftotext,docx=python-docx"), 비어 있으면 보정 결과 사용
+    EXTRACTOR_MIN_QUALITY: float = 0.95  # 보정 시 백엔드가 만족해야 하는 최소 추출 품질 (가장 많이 추출한 백엔드 대비)
+    EXTRACTOR_CALIBRATION_TTL: float = 60.0  # 보정 결과를 프로세스에 캐시하는 시간 (초)
+    EXTRACTOR_COMMAND_TIMEOUT: float = 300.0  # 외부 추출 명령 타임아웃 (초)
+    TXT_DETECT_SAMPLE_BYTES: int = 65536  # TXT 인코딩 감지에 사용하는 앞부분 표본 크기
+
+    # 작업 접수 제어 설정 (0이면 해당 검사 비활성화)
+    ADMISSION_CACHE_TTL: float = 2.0  # 부하 지표 캐시 시간 (초)
+    ADMISSION_MAX_QUEUE_DEPTH: int = 0
+    ADMISSION_MAX_BACKLOG_SECONDS: float = 0
+    ADMISSION_MIN_FREE_DISK_MB: int = 0
+    ADMISSION_DISK_RETRY_AFTER: int = 300
+    ADMISSION_MAX_RETRY_AFTER: int = 3600
+    CLIENT_QUOTA_PER_MINUTE: int = 0  # 클라이언트별 분당 접수 한도
+
+    # Idempotency-Key 기록 유지 시간 (초)
+    IDEMPOTENCY_TTL: int = 86400
+
+    # 작업 취소 설정
+    CANCEL_CHECK_INTERVAL: float = 1.0  # 워커가 취소 요청을 확인하는 간격 (초)
+    CANCEL_FLAG_TTL: int = 86400
+
+    # 작업 마감 시각과 클라이언트 이탈에 따른 부하 차단 (0이면 비활성화)
+    JOB_DEFAULT_DEADLINE: int = 0  # deadline을 주지 않은 작업의 마감 시간 (접수 후 초)
+    JOB_ABANDON_AFTER: int = 0  # 클라이언트가 이 시간(초) 동안 상태를 확인하지 않은 대기 작업은 이탈로 간주
+    JOB_ABANDON_POLICY: str = "deprioritize"  # deprioritize: 한 번 우선순위를 낮춰 다시 대기, skip: 바로 건너뜀
+    JOB_LIVENESS_INTERVAL: float = 30.0  # WebSocket으로 구독 중인 작업의 확인 시각을 갱신하는 간격 (초)
+
+    # 실패한 작업의 dead-letter 저장소와 재처리 설정
+    DEAD_LETTER_RETENTION: int = 30 * 86400  # 실패한 작업 기록 보관 기간 (초)
+    DLQ_REPLAY_RATE: float = 0.5  # 재처리 작업을 일반 대기열에 등록하는 속도 (초당 작업 수)
+    DLQ_REPLAY_INTERVAL: int = 10  # 재처리 대기열을 확인하는 주기 (celery beat, 초)
+    DLQ_REPLAY_MAX_BATCH: int = 500  # 요청 한 번에 재처리 대기열에 넣을 수 있는 작업 수
+
+    # 완료된 작업의 상태 응답 캐시 설정
+    JOB_RESPONSE_CACHE_TTL: int = 86400  # Redis에 보관하는 직렬화된 응답 (초)
+    JOB_RESPONSE_CACHE_SIZE: int = 1024  # 프로세스 메모리에 보관하는 응답 수
+
+    BULK_STATUS_MAX_IDS: int = 1000  # POST /jobs/status 한 번에 조회할 수 있는 작업 수
+
+    # 작업 상태 WebSocket 설정
+    WS_MAX_SUBSCRIPTIONS: int = 500  # 연결 하나가 구독할 수 있는 작업 수
+    WS_MAX_PENDING_MESSAGES: int = 1000  # 클라이언트가 받지 못한 메시지가 이만큼 쌓이면 연결 종료
+    WS_RECONNECT_DELAY: float = 1.0
+
     class Config:
         case_sensitive = True
         env_file = ".env"
@@ -10,8 +10,33 @@ from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 프로세스당 하나의 엔진 (첫 세션 생성 시 만들어짐)
+_engine = None
+
+def get_engine():
+    """프로세스 공용 데이터베이스 엔진을 반환합니다."""
+    global _engine
+    if _engine is None:
+        _engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+    return _engine
+
+def dispose_engine():
+    """데이터베이스 엔진의 연결 풀을 정리합니다."""
+    global _engine
+    if _engine is not None:
+        _engine.dispose()
+        _engine = None
+        SessionLocal.configure(bind=None)
+
+class _LazySessionmaker(sessionmaker):
+    """첫 세션 생성 시점에 엔진을 바인딩하는 sessionmaker"""
+
+    def __call__(self, **local_kw):
+        if self.kw.get("bind") is None:
+            self.configure(bind=get_engine())
+        return super().__call__(**local_kw)
+
+SessionLocal = _LazySessionmaker(autocommit=False, autoflush=False)
 
 Base = declarative_base()
 
@@ -20,4 +45,4 @@ def get_db():
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
@@ -0,0 +1,212 @@
+"""실패한 작업의 dead-letter 저장소
+
+재시도 끝에 실패한 작업을 오류 종류, 시도 횟수, 실패한 단계와 함께 기록하고, 관리자가 고른 작업을
+재처리 대기열에 넣으면 주기 작업(maintenance.replay_dead_letters)이 DLQ_REPLAY_RATE 속도로 다시 등록합니다.
+
+오류 종류(--error-class)는 상위 클래스로도 찾을 수 있고(예: TransientError로 AgentUnavailableError),
+--transient는 재시도 분류(is_transient)가 일시적 오류인 작업(타임아웃, 연결 오류 포함)만 고릅니다.
+
+사용 예:
+    python -m app.core.dead_letters list --since 2026-10-19T09:00 --transient
+    python -m app.core.dead_letters replay --since 2026-10-19T09:00 --until 2026-10-19T10:00 --transient --dry-run
+"""
+import argparse
+import json
+import logging
+import time
+from datetime import datetime
+from typing import Iterable, List, Optional
+from app.core.config import settings
+from app.core.retry import is_transient
+from app.storage.refs import BLOB_REFS_KEY, release_blob
+
+logger = logging.getLogger(__name__)
+
+# 실패한 작업 ID (점수: 실패 시각)
+DEAD_LETTERS_KEY = "dead_letters"
+# 실패한 작업의 재처리 정보
+DEAD_LETTER_KEY = "dead_letter:{job_id}"
+# 재처리를 기다리는 작업 ID (점수: 대기열에 넣은 시각)
+REPLAY_QUEUE_KEY = "dead_letters:replay"
+# 업로드 파일 참조에 기록하는 dead-letter의 참조 ID
+# (실패한 작업의 참조는 바로 해제되므로, 기록이 남아 있는 동안 파일이 정리되지 않도록 따로 참조함)
+BLOB_HOLDER_PREFIX = "dlq:"
+
+def record(
+    redis,
+    job_id: str,
+    stage: str,
+    error: Exception,
+    attempts: int,
+    filename: str,
+    blob: Optional[str] = None,
+    parent_job_id: Optional[str] = None,
+    pipeline: Optional[str] = None
+):
+    """실패한 작업을 다시 처리하는 데 필요한 정보와 함께 기록합니다."""
+    now = time.time()
+    fields = {
+        "job_id": job_id,
+        "stage": stage,
+        "error_class": type(error).__name__,
+        # 상위 클래스 이름과 재시도 분류도 함께 기록해 구체적인 예외 종류를 몰라도 찾을 수 있게 함
+        "error_classes": ",".join(cls.__name__ for cls in type(error).__mro__[:-2]),
+        "transient": int(is_transient(error)),
+        "error": str(error),
+        "attempts": attempts,
+        "filename": filename,
+        "blob": blob,
+        "parent_job_id": parent_job_id,
+        "pipeline": pipeline,
+        "failed_at": datetime.fromtimestamp(now).isoformat()
+    }
+    key = DEAD_LETTER_KEY.format(job_id=job_id)
+    pipe = redis.pipeline()
+    pipe.delete(key)
+    pipe.hset(key, mapping={name: value for name, value in fields.items() if value is not None})
+    pipe.expire(key, settings.DEAD_LETTER_RETENTION)
+    pipe.zadd(DEAD_LETTERS_KEY, {job_id: now})
+    if blob:
+        pipe.sadd(BLOB_REFS_KEY.format(digest=blob), blob_holder(job_id))
+    # 보관 기간이 지난 항목은 목록에서도 정리
+    pipe.zremrangebyscore(DEAD_LETTERS_KEY, "-inf", now - settings.DEAD_LETTER_RETENTION)
+    pipe.execute()
+
+def blob_holder(job_id: str) -> str:
+    return f"{BLOB_HOLDER_PREFIX}{job_id}"
+
+def holder_job_id(holder: str) -> Optional[str]:
+    """파일 참조 ID가 dead-letter의 참조이면 실패한 작업 ID를 반환합니다."""
+    return holder[len(BLOB_HOLDER_PREFIX):] if holder.startswith(BLOB_HOLDER_PREFIX) else None
+
+def _to_entry(data: dict) -> dict:
+    return {
+        "jobId": data["job_id"],
+        "filename": data.get("filename"),
+        "stage": data.get("stage"),
+        "errorClass": data.get("error_class"),
+        "errorClasses": data["error_classes"].split(",") if data.get("error_classes") else [data.get("error_class")],
+        "transient": data["transient"] == "1" if "transient" in data else None,
+        "error": data.get("error"),
+        "attempts": int(data.get("attempts", 0)),
+        "failedAt": data.get("failed_at"),
+        "parentJobId": data.get("parent_job_id"),
+        "pipeline": data.get("pipeline"),
+        "blob": data.get("blob"),
+        "replayQueuedAt": data.get("replay_queued_at"),
+        "replayedAs": data.get("replayed_as"),
+        "replayError": data.get("replay_error")
+    }
+
+def _load(redis, job_ids: List[str]) -> List[dict]:
+    pipe = redis.pipeline(transaction=False)
+    for job_id in job_ids:
+        pipe.hgetall(DEAD_LETTER_KEY.format(job_id=job_id))
+    return [_to_entry(data) for data in pipe.execute() if data]
+
+def find(
+    redis,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    error_class: Optional[str] = None,
+    job_ids: Optional[Iterable[str]] = None,
+    limit: Optional[int] = None,
+    transient: Optional[bool] = None
+) -> List[dict]:
+    """실패 시각 구간, 오류 종류(상위 클래스 포함), 재시도 분류, 작업 ID로 실패한 작업을 오래된 순으로 찾습니다."""
+    low = since.timestamp() if since else "-inf"
+    high = until.timestamp() if until else "+inf"
+    candidates = redis.zrangebyscore(DEAD_LETTERS_KEY, low, high)
+    if job_ids is not None:
+        wanted = set(job_ids)
+        candidates = [job_id for job_id in candidates if job_id in wanted]
+
+    entries = []
+    for entry in _load(redis, candidates):
+        if error_class and error_class not in entry["errorClasses"]:
+            continue
+        if transient is not None and entry["transient"] != transient:
+            continue
+        entries.append(entry)
+        if limit is not None and len(entries) >= limit:
+            break
+    return entries
+
+def is_replayable(entry: dict) -> bool:
+    """이미 재처리했거나 재처리 대기 중인 작업은 다시 넣지 않습니다."""
+    return not entry["replayedAs"] and not entry["replayQueuedAt"]
+
+def queue_replay(redis, entries: List[dict]) -> List[str]:
+    """작업들을 재처리 대기열에 넣고 넣은 작업 ID를 반환합니다."""
+    entries = [entry for entry in entries if is_replayable(entry)]
+    if not entries:
+        return []
+    now = time.time()
+    queued_at = datetime.fromtimestamp(now).isoformat()
+    pipe = redis.pipeline()
+    for i, entry in enumerate(entries):
+        # 고른 순서(오래된 실패부터)대로 재처리
+        pipe.zadd(REPLAY_QUEUE_KEY, {entry["jobId"]: now + i * 1e-6}, nx=True)
+        pipe.hset(DEAD_LETTER_KEY.format(job_id=entry["jobId"]), "replay_queued_at", queued_at)
+    pipe.execute()
+    return [entry["jobId"] for entry in entries]
+
+def take_replays(redis, count: int) -> List[dict]:
+    """재처리 대기열에서 가장 먼저 넣은 작업을 최대 count개 꺼냅니다."""
+    popped = redis.zpopmin(REPLAY_QUEUE_KEY, count)
+    return _load(redis, [job_id for job_id, _ in popped])
+
+def mark_replayed(redis, job_id: str, new_job_id: str, blob: Optional[str] = None):
+    """재처리한 작업을 기록하고, 새 작업이 참조하게 된 업로드 파일의 dead-letter 참조를 해제합니다."""
+    redis.hset(DEAD_LETTER_KEY.format(job_id=job_id), mapping={
+        "replayed_as": new_job_id,
+        "replayed_at": datetime.now().isoformat()
+    })
+    if blob:
+        release_blob(redis, blob, blob_holder(job_id))
+
+def mark_replay_failed(redis, job_id: str, reason: str):
+    """재처리할 수 없는 작업은 이유를 남기고 다시 고를 수 있게 대기 표시를 지웁니다."""
+    key = DEAD_LETTER_KEY.format(job_id=job_id)
+    pipe = redis.pipeline()
+    pipe.hset(key, "replay_error", reason)
+    pipe.hdel(key, "replay_queued_at")
+    pipe.execute()
+
+def get_summary(redis) -> dict:
+    return {
+        "total": redis.zcard(DEAD_LETTERS_KEY),
+        "replayQueue": redis.zcard(REPLAY_QUEUE_KEY),
+        "replayRate": settings.DLQ_REPLAY_RATE
+    }
+
+def main():
+    from app.core.redis_client import get_redis
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=("list", "replay"))
+    parser.add_argument("--since", type=datetime.fromisoformat, help="이 시각 이후 실패한 작업 (ISO 8601)")
+    parser.add_argument("--until", type=datetime.fromisoformat, help="이 시각 이전 실패한 작업 (ISO 8601)")
+    parser.add_argument("--error-class", help="오류 종류, 상위 클래스 포함 (예: AgentUnavailableError, PermanentError)")
+    parser.add_argument("--transient", action="store_true", help="재시도 분류가 일시적 오류인 작업만 (에이전트 장애, 타임아웃, 연결 오류)")
+    parser.add_argument("--job-id", action="append", dest="job_ids", help="작업 ID (여러 번 지정 가능)")
+    parser.add_argument("--limit", type=int, default=settings.DLQ_REPLAY_MAX_BATCH)
+    parser.add_argument("--dry-run", action="store_true", help="재처리 대기열에 넣지 않고 대상만 출력")
+    args = parser.parse_args()
+
+    redis = get_redis()
+    entries = find(redis, args.since, args.until, args.error_class, args.job_ids, args.limit, True if args.transient else None)
+    if args.command == "list":
+        print(json.dumps({"deadLetters": entries, **get_summary(redis)}, indent=2, ensure_ascii=False))
+        return
+
+    targets = [entry for entry in entries if is_replayable(entry)]
+    queued = [entry["jobId"] for entry in targets] if args.dry_run else queue_replay(redis, targets)
+    print(json.dumps({
+        "dryRun": args.dry_run,
+        "queued": queued,
+        "estimatedSeconds": len(queued) / settings.DLQ_REPLAY_RATE if settings.DLQ_REPLAY_RATE > 0 else None
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+import logging
+import math
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional
+from app.core.config import settings
+from app.core import estimates
+from app.core.estimates import PENDING_JOBS_KEY
+from app.core.metrics import COUNTERS_KEY
+
+logger = logging.getLogger(__name__)
+
+# 클라이언트가 대기 중인 작업의 상태를 마지막으로 확인한 시각 (점수: 확인 시각)
+LAST_SEEN_KEY = "jobs:last_seen"
+
+# 작업을 건너뛴 이유
+SKIP_DEADLINE = "deadline"
+SKIP_ABANDONED = "abandoned"
+
+# 이탈한 작업을 다시 등록할 때의 우선순위 (Redis 브로커는 숫자가 클수록 나중에 처리)
+DEPRIORITIZED_PRIORITY = 9
+
+def parse_deadline(value: Optional[str]) -> Optional[datetime]:
+    """deadline(지금부터의 초 또는 ISO 8601 시각)을 마감 시각으로 바꿉니다.
+
+    값이 없으면 JOB_DEFAULT_DEADLINE을 사용하고, 형식이 잘못되었거나 이미 지난 시각이면 ValueError를 발생시킵니다.
+    """
+    now = datetime.now()
+    if value is None:
+        if settings.JOB_DEFAULT_DEADLINE <= 0:
+            return None
+        return now + timedelta(seconds=settings.JOB_DEFAULT_DEADLINE)
+
+    try:
+        seconds = float(value)
+    except ValueError:
+        deadline = datetime.fromisoformat(value)
+        if deadline.tzinfo is not None:
+            deadline = deadline.astimezone().replace(tzinfo=None)
+    else:
+        if not math.isfinite(seconds):
+            raise ValueError("deadline must be finite")
+        try:
+            deadline = now + timedelta(seconds=seconds)
+        except OverflowError:
+            raise ValueError("deadline out of range")
+    if deadline <= now:
+        raise ValueError("deadline must be in the future")
+    return deadline
+
+def mark_job(redis, job_id: str, deadline: Optional[datetime]):
+    """접수된 작업의 마감 시각과 클라이언트 확인 시각을 기록합니다."""
+    pipe = redis.pipeline()
+    pipe.zadd(LAST_SEEN_KEY, {job_id: time.time()})
+    if deadline is not None:
+        pipe.hset(f"job:{job_id}", "deadline_at", deadline.isoformat())
+    pipe.execute()
+
+def touch(redis, job_ids: Iterable[str]):
+    """클라이언트가 작업 상태를 확인했음을 기록합니다 (아직 처리되지 않은 작업만 갱신)."""
+    now = time.time()
+    seen = {job_id: now for job_id in job_ids}
+    if seen:
+        redis.zadd(LAST_SEEN_KEY, seen, xx=True)
+
+def forget(redis, job_id: str):
+    """처리를 시작했거나 끝난 작업은 더 이상 확인 시각을 추적하지 않습니다."""
+    redis.zrem(LAST_SEEN_KEY, job_id)
+
+def shed_reason(redis, job_id: str) -> Optional[str]:
+    """대기열 맨 앞에 온 작업을 처리하지 않을 이유를 반환합니다 (마감 시각 초과 또는 클라이언트 이탈)."""
+    pipe = redis.pipeline(transaction=False)
+    pipe.hget(f"job:{job_id}", "deadline_at")
+    pipe.zscore(LAST_SEEN_KEY, job_id)
+    deadline_at, last_seen = pipe.execute()
+
+    if deadline_at and datetime.fromisoformat(deadline_at) <= datetime.now():
+        return SKIP_DEADLINE
+    if settings.JOB_ABANDON_AFTER > 0 and last_seen is not None \
+            and time.time() - float(last_seen) > settings.JOB_ABANDON_AFTER:
+        return SKIP_ABANDONED
+    return None
+
+def record_skip(redis, job_id: str, reason: str):
+    """건너뛴 작업 수와 그 작업을 처리했다면 걸렸을 예상 시간(절약한 처리 용량)을 기록합니다."""
+    job_data = redis.hgetall(f"job:{job_id}")
+    saved = 0.0
+    if job_data.get("format") and job_data.get("lane"):
+        size_bytes = job_data.get("size_bytes")
+        saved = estimates.predict_duration(
+            redis, job_data["format"], job_data["lane"],
+            size_bytes=int(size_bytes) if size_bytes else None
+        )
+
+    pipe = redis.pipeline(transaction=False)
+    pipe.hincrbyfloat(COUNTERS_KEY, f"jobs_skipped:{reason}", 1)
+    pipe.hincrbyfloat(COUNTERS_KEY, "shed_saved_seconds", saved)
+    pipe.zrem(PENDING_JOBS_KEY, job_id)
+    pipe.zrem(LAST_SEEN_KEY, job_id)
+    pipe.execute()
+
+def get_shedding_stats(counters: dict) -> Dict[str, object]:
+    """누적 카운터에서 건너뛴 작업 수, 우선순위를 낮춘 작업 수, 절약한 처리 시간을 모읍니다."""
+    return {
+        "skipped": {
+            reason: counters.get(f"jobs_skipped:{reason}", 0.0)
+            for reason in (SKIP_DEADLINE, SKIP_ABANDONED)
+        },
+        "deprioritized": counters.get("jobs_deprioritized", 0.0),
+        "savedSeconds": counters.get("shed_saved_seconds", 0.0)
+    }
@@ -0,0 +1,138 @@
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+from app.core import metrics
+from app.core.celery_app import STAGE_QUEUES
+
+logger = logging.getLogger(__name__)
+
+# 대기 중인 작업의 접수 순서 (점수: 접수 시각)
+PENDING_JOBS_KEY = "jobs:pending"
+# 형식/레인별 처리 시간 회귀 모델의 충분 통계량
+MODEL_KEY = "estimate:model:{fmt}:{lane}"
+
+# 회귀에 사용하는 특징: 추출 전에는 파일 크기, 추출 후에는 문자 수
+FEATURES = ("bytes", "chars")
+# 제곱합의 정밀도 손실을 줄이기 위해 특징을 1000 단위로 나눠 저장
+FEATURE_SCALE = 1000.0
+
+def mark_enqueued(redis, job_id: str, fmt: str, lane: str, size_bytes: int):
+    """접수된 작업의 특징과 대기 순서를 기록합니다."""
+    now = time.time()
+    pipe = redis.pipeline()
+    pipe.zadd(PENDING_JOBS_KEY, {job_id: now})
+    pipe.hset(f"job:{job_id}", mapping={
+        "format": fmt,
+        "lane": lane,
+        "size_bytes": size_bytes,
+        "enqueued_at": datetime.fromtimestamp(now).isoformat()
+    })
+    pipe.execute()
+
+def mark_started(redis, job_id: str):
+    """작업이 대기열에서 빠졌음을 기록합니다."""
+    redis.zrem(PENDING_JOBS_KEY, job_id)
+
+def mark_requeued(redis, job_id: str, ready_at: float):
+    """재시도나 회로 차단으로 다시 대기하게 된 작업을 다시 실행될 시각 순서로 대기 목록에 넣습니다."""
+    redis.zadd(PENDING_JOBS_KEY, {job_id: ready_at})
+
+def record_features(redis, job_id: str, chars: int):
+    """텍스트 추출 후 알게 된 작업 특징을 기록합니다."""
+    redis.hset(f"job:{job_id}", "chars", chars)
+
+def record_duration(redis, fmt: str, lane: str, duration: float, size_bytes: Optional[int] = None, chars: Optional[int] = None):
+    """작업 처리 시간을 형식/레인별 온라인 선형 회귀 모델에 반영합니다."""
+    pipe = redis.pipeline()
+    key = MODEL_KEY.format(fmt=fmt, lane=lane)
+    for name, x in zip(FEATURES, (size_bytes, chars)):
+        if x is None:
+            continue
+        x = x / FEATURE_SCALE
+        pipe.hincrbyfloat(key, f"{name}:n", 1)
+        pipe.hincrbyfloat(key, f"{name}:sx", x)
+        pipe.hincrbyfloat(key, f"{name}:sy", duration)
+        pipe.hincrbyfloat(key, f"{name}:sxx", x * x)
+        pipe.hincrbyfloat(key, f"{name}:sxy", x * duration)
+    pipe.execute()
+
+def _predict(stats: dict, name: str, x: float) -> Optional[float]:
+    n = float(stats.get(f"{name}:n", 0))
+    if n < 1:
+        return None
+    sx = float(stats[f"{name}:sx"])
+    sy = float(stats[f"{name}:sy"])
+    mean_y = sy / n
+    if n < 3:
+        return mean_y
+
+    # 최소제곱 기울기 (x의 분산이 거의 없으면 평균 사용)
+    var_x = float(stats[f"{name}:sxx"]) - sx * sx / n
+    if var_x <= 1e-9:
+        return mean_y
+    slope = (float(stats[f"{name}:sxy"]) - sx * sy / n) / var_x
+    intercept = mean_y - slope * sx / n
+    return max(intercept + slope * x, 0.0)
+
+def _predict_lane(redis, fmt: str, lane: str, size_bytes: Optional[int], chars: Optional[int]) -> Optional[float]:
+    stats = redis.hgetall(MODEL_KEY.format(fmt=fmt, lane=lane))
+    if stats:
+        # 문자 수를 알면 더 정확한 모델을 우선 사용
+        for name, x in (("chars", chars), ("bytes", size_bytes)):
+            if x is None:
+                continue
+            prediction = _predict(stats, name, x / FEATURE_SCALE)
+            if prediction is not None:
+                return prediction
+    return None
+
+def predict_duration(redis, fmt: str, lane: str, size_bytes: Optional[int] = None, chars: Optional[int] = None) -> float:
+    """작업의 예상 처리 시간(초)을 반환합니다. 모델이 없으면 최근 평균 처리 시간을 사용합니다.
+
+    단계별 파이프라인 작업(레인이 단계 큐)은 단계 큐마다 기록된 처리 시간 모델의 예측을 합산합니다.
+    """
+    lanes = STAGE_QUEUES if lane in STAGE_QUEUES else (lane,)
+    predictions = [p for p in (_predict_lane(redis, fmt, name, size_bytes, chars) for name in lanes) if p is not None]
+    if predictions:
+        return sum(predictions)
+    return metrics.get_load_snapshot().avg_duration
+
+def _parse_int(value) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+def estimate_job_times(redis, job_id: str, job_data: dict) -> dict:
+    """작업의 예상 시작/완료 시각을 계산합니다 (완료된 작업은 빈 dict)."""
+    status = job_data.get("status")
+    fmt = job_data.get("format")
+    lane = job_data.get("lane")
+    if not fmt or not lane or status not in ("pending", "processing"):
+        return {}
+
+    duration = predict_duration(
+        redis, fmt, lane,
+        size_bytes=_parse_int(job_data.get("size_bytes")),
+        chars=_parse_int(job_data.get("chars"))
+    )
+    now = datetime.now()
+
+    if status == "processing" and job_data.get("started_at"):
+        start_at = datetime.fromisoformat(job_data["started_at"])
+    else:
+        ahead = redis.zrank(PENDING_JOBS_KEY, job_id)
+        if ahead is None:
+            return {}
+        start_at = now + timedelta(seconds=metrics.get_load_snapshot().drain_seconds(ahead))
+        # 재시도를 기다리는 작업은 예약된 시각 전에는 시작하지 않음
+        if job_data.get("next_retry_at"):
+            start_at = max(start_at, datetime.fromisoformat(job_data["next_retry_at"]))
+
+    # 예상 시간을 넘긴 작업은 지금부터 곧 끝나는 것으로 간주
+    completed_at = max(start_at + timedelta(seconds=duration), now)
+    return {
+        "estimatedStartAt": start_at.isoformat(),
+        "estimatedCompletedAt": completed_at.isoformat()
+    }
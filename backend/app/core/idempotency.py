@@ -0,0 +1,39 @@
+import logging
+from typing import Optional
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_KEY = "idempotency:{client_id}:{key}"
+MAX_KEY_LENGTH = 255
+
+# 값이 일치할 때만 삭제 (다른 요청이 다시 예약한 키를 지우지 않도록)
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+def _redis_key(client_id: str, key: str) -> str:
+    return IDEMPOTENCY_KEY.format(client_id=client_id or "-", key=key)
+
+def reserve(redis, client_id: str, key: str, job_id: str) -> Optional[str]:
+    """멱등성 키에 작업 ID를 원자적으로 예약합니다.
+
+    새로 예약했으면 None을, 같은 키로 이미 접수된 작업이 있으면 그 작업 ID를 반환합니다.
+    """
+    redis_key = _redis_key(client_id, key)
+    if redis.set(redis_key, job_id, nx=True, ex=settings.IDEMPOTENCY_TTL):
+        return None
+    existing = redis.get(redis_key)
+    if existing:
+        return existing
+    # SET과 GET 사이에 만료된 경우 한 번 더 예약 시도
+    if redis.set(redis_key, job_id, nx=True, ex=settings.IDEMPOTENCY_TTL):
+        return None
+    return redis.get(redis_key)
+
+def release(redis, client_id: str, key: str, job_id: str):
+    """접수에 실패한 작업의 예약을 해제해 재시도가 새 작업을 만들 수 있게 합니다."""
+    redis.eval(_RELEASE_SCRIPT, 1, _redis_key(client_id, key), job_id)
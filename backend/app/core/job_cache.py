@@ -0,0 +1,91 @@
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 완료된 작업의 직렬화된 상태 응답 (필드: body, etag)
+JOB_RESPONSE_KEY = "job:{job_id}:response"
+
+def serialize(payload: dict) -> str:
+    """상태 응답을 JSON 문자열로 직렬화합니다."""
+    return json.dumps(payload, ensure_ascii=False, default=str, separators=(",", ":"))
+
+def make_etag(data) -> str:
+    """응답 내용(또는 작업 상태)으로 약한 ETag를 만듭니다."""
+    if not isinstance(data, str):
+        data = json.dumps(data, sort_keys=True, default=str)
+    return f'W/"{hashlib.sha1(data.encode()).hexdigest()}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인합니다 (약한 비교)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+class TerminalResponseCache:
+    """완료된 작업의 응답을 프로세스 메모리와 Redis에 보관하는 캐시
+
+    완료/실패/취소된 작업의 응답은 더 이상 바뀌지 않으므로 한 번 직렬화한 결과를 재사용합니다.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _remember(self, job_id: str, entry: Tuple[str, str]):
+        with self._lock:
+            self._entries[job_id] = entry
+            self._entries.move_to_end(job_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get(self, redis, job_id: str) -> Optional[Tuple[str, str]]:
+        """캐시된 (body, etag)를 반환합니다. 없으면 None."""
+        with self._lock:
+            entry = self._entries.get(job_id)
+            if entry is not None:
+                self._entries.move_to_end(job_id)
+                return entry
+
+        cached = redis.hgetall(JOB_RESPONSE_KEY.format(job_id=job_id))
+        if not cached or "body" not in cached:
+            return None
+        entry = (cached["body"], cached.get("etag") or make_etag(cached["body"]))
+        self._remember(job_id, entry)
+        return entry
+
+    def put(self, redis, job_id: str, payload: dict) -> Tuple[str, str]:
+        """완료된 작업의 응답을 직렬화해 저장하고 (body, etag)를 반환합니다."""
+        body = serialize(payload)
+        entry = (body, make_etag(body))
+        self._remember(job_id, entry)
+        try:
+            key = JOB_RESPONSE_KEY.format(job_id=job_id)
+            pipe = redis.pipeline()
+            pipe.hset(key, mapping={"body": entry[0], "etag": entry[1]})
+            pipe.expire(key, settings.JOB_RESPONSE_CACHE_TTL)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to cache response for job {job_id}: {str(e)}")
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+terminal_responses = TerminalResponseCache(settings.JOB_RESPONSE_CACHE_SIZE)
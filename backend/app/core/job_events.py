@@ -0,0 +1,172 @@
+import asyncio
+import contextlib
+import json
+import logging
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태 전이를 알리는 채널 (메시지: {"jobId", "status"})
+JOB_EVENTS_CHANNEL = "jobs:events"
+
+def publish_job_event(redis, job_id: str, status: str):
+    """작업 상태 전이를 API 프로세스들에 알립니다."""
+    redis.publish(JOB_EVENTS_CHANNEL, json.dumps({"jobId": job_id, "status": str(status)}))
+
+class Subscriber:
+    """WebSocket 연결 하나가 받을 메시지 큐와 구독 중인 작업 ID"""
+
+    def __init__(self, max_pending: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self.job_ids: Set[str] = set()
+        self.overflowed = False
+
+    def offer(self, message: dict):
+        """메시지를 전달합니다. 클라이언트가 따라오지 못하면 연결을 끊도록 표시합니다."""
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            # 송신 루프를 깨워 연결을 정리하게 함
+            with contextlib.suppress(asyncio.QueueEmpty):
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+class JobEventHub:
+    """API 프로세스당 하나의 Redis 구독으로 작업 상태 전이를 여러 WebSocket에 나눠 보내는 허브
+
+    상태 전이가 오면 구독자가 있는 작업만 최신 상태를 한 번 읽어 모든 구독자에게 보냅니다.
+    on_heartbeat를 주면 JOB_LIVENESS_INTERVAL마다 구독 중인 작업 ID 목록으로 호출합니다.
+    """
+
+    def __init__(
+        self,
+        load_job: Callable[[str], Awaitable[Optional[dict]]],
+        terminal_statuses: Iterable[str] = (),
+        on_heartbeat: Optional[Callable[[List[str]], None]] = None
+    ):
+        self.load_job = load_job
+        self.terminal_statuses = {str(status) for status in terminal_statuses}
+        self.on_heartbeat = on_heartbeat
+        self._subscribers: Dict[str, Set[Subscriber]] = defaultdict(set)
+        self._listener: Optional[asyncio.Task] = None
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._redis = None
+
+    def _ensure_listener(self):
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+        if self.on_heartbeat is not None and (self._heartbeat is None or self._heartbeat.done()):
+            self._heartbeat = asyncio.create_task(self._beat())
+
+    async def _beat(self):
+        while True:
+            await asyncio.sleep(settings.JOB_LIVENESS_INTERVAL)
+            job_ids = list(self._subscribers)
+            if job_ids:
+                try:
+                    self.on_heartbeat(job_ids)
+                except Exception as e:
+                    logger.warning(f"Job subscription heartbeat failed: {str(e)}")
+
+    async def _listen(self):
+        from redis.asyncio import Redis
+
+        while True:
+            try:
+                if self._redis is None:
+                    self._redis = Redis(
+                        host=settings.REDIS_HOST,
+                        port=settings.REDIS_PORT,
+                        db=settings.REDIS_DB,
+                        decode_responses=True,
+                        socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT
+                    )
+                async with self._redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(JOB_EVENTS_CHANNEL)
+                    async for message in pubsub.listen():
+                        await self._dispatch(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Job event subscription failed, reconnecting: {str(e)}")
+                await asyncio.sleep(settings.WS_RECONNECT_DELAY)
+
+    async def _dispatch(self, data):
+        try:
+            event = json.loads(data)
+            job_id = event["jobId"]
+        except (TypeError, ValueError, KeyError):
+            logger.warning(f"Ignoring malformed job event: {data!r}")
+            return
+
+        subscribers = self._subscribers.get(job_id)
+        if not subscribers:
+            return
+        job = await self.load_job(job_id)
+        if job is None:
+            job = {"jobId": job_id, "status": event.get("status")}
+        for subscriber in list(subscribers):
+            subscriber.offer({"type": "update", "job": job})
+            # 더 이상 전이가 없는 작업은 구독을 자동으로 해제
+            if job.get("status") in self.terminal_statuses:
+                self.unsubscribe(subscriber, [job_id])
+
+    def connect(self) -> Subscriber:
+        """새 연결의 구독자를 만듭니다."""
+        self._ensure_listener()
+        return Subscriber(settings.WS_MAX_PENDING_MESSAGES)
+
+    async def subscribe(self, subscriber: Subscriber, job_ids: Iterable[str]) -> list:
+        """작업들을 구독하고 현재 상태를 스냅샷으로 보냅니다. 구독 한도를 넘은 ID는 반환합니다."""
+        rejected = []
+        for job_id in job_ids:
+            if job_id in subscriber.job_ids:
+                continue
+            if len(subscriber.job_ids) >= settings.WS_MAX_SUBSCRIPTIONS:
+                rejected.append(job_id)
+                continue
+            # 구독 전에 일어난 전이를 놓치지 않도록 등록 후 현재 상태를 보냄
+            subscriber.job_ids.add(job_id)
+            self._subscribers[job_id].add(subscriber)
+            job = await self.load_job(job_id)
+            subscriber.offer({"type": "snapshot", "jobId": job_id, "job": job})
+            if job is None or job.get("status") in self.terminal_statuses:
+                self.unsubscribe(subscriber, [job_id])
+        return rejected
+
+    def unsubscribe(self, subscriber: Subscriber, job_ids: Iterable[str]):
+        """작업 구독을 해제합니다."""
+        for job_id in job_ids:
+            subscriber.job_ids.discard(job_id)
+            subscribers = self._subscribers.get(job_id)
+            if subscribers is not None:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._subscribers[job_id]
+
+    def disconnect(self, subscriber: Subscriber):
+        """연결이 끊긴 구독자의 모든 구독을 해제합니다."""
+        self.unsubscribe(subscriber, list(subscriber.job_ids))
+
+    def subscription_count(self) -> int:
+        return len(self._subscribers)
+
+    async def close(self):
+        """구독 태스크와 Redis 연결을 정리합니다."""
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await self._heartbeat
+            self._heartbeat = None
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await self._listener
+            self._listener = None
+        if self._redis is not None:
+            with contextlib.suppress(Exception):
+                await self._redis.aclose()
+            self._redis = None
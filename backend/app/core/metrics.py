@@ -0,0 +1,172 @@
+import logging
+import shutil
+import threading
+import time
+from app.core.celery_app import STAGE_QUEUES
+from app.core.config import settings
+from app.core.redis_client import get_broker_redis, get_redis
+
+logger = logging.getLogger(__name__)
+
+# Redis 키
+JOB_DURATIONS_KEY = "metrics:job_durations"
+COMPLETIONS_KEY = "metrics:completions:{bucket}"
+AGENT_INFLIGHT_KEY = "metrics:agent_inflight"
+COUNTERS_KEY = "metrics:counters"
+STAGE_RUNS_KEY = "metrics:stages:{bucket}"
+
+# Celery Redis 브로커의 우선순위 큐 구분자와 단계 (kombu 기본값)
+PRIORITY_SEP = "\x06\x16"
+PRIORITY_STEPS = [0, 3, 6, 9]
+
+def _bucket(ts: float) -> int:
+    return int(ts // 60)
+
+def record_job_completion(redis, duration: float):
+    """완료된 작업의 처리 시간과 처리량 카운터를 기록합니다."""
+    bucket_key = COMPLETIONS_KEY.format(bucket=_bucket(time.time()))
+    pipe = redis.pipeline()
+    pipe.lpush(JOB_DURATIONS_KEY, f"{duration:.3f}")
+    pipe.ltrim(JOB_DURATIONS_KEY, 0, settings.METRICS_DURATION_SAMPLES - 1)
+    pipe.incr(bucket_key)
+    pipe.expire(bucket_key, settings.METRICS_THROUGHPUT_WINDOW + 120)
+    pipe.execute()
+
+def get_average_job_duration(redis) -> float:
+    """최근 완료된 작업들의 평균 처리 시간(초)을 반환합니다."""
+    samples = redis.lrange(JOB_DURATIONS_KEY, 0, -1)
+    if not samples:
+        return settings.DEFAULT_JOB_DURATION
+    return sum(float(s) for s in samples) / len(samples)
+
+def get_throughput(redis) -> float:
+    """최근 윈도우 동안의 처리량(작업/초)을 반환합니다."""
+    window = settings.METRICS_THROUGHPUT_WINDOW
+    now = _bucket(time.time())
+    # 현재 분은 아직 진행 중이므로 완료된 분 단위 버킷만 사용
+    buckets = [COMPLETIONS_KEY.format(bucket=now - i) for i in range(1, window // 60 + 1)]
+    counts = redis.mget(buckets)
+    completed = sum(int(c) for c in counts if c)
+    return completed / (len(buckets) * 60)
+
+def incr_counter(redis, name: str, amount: float = 1):
+    """누적 카운터를 증가시킵니다."""
+    redis.hincrbyfloat(COUNTERS_KEY, name, amount)
+
+def get_counters(redis) -> dict:
+    """모든 누적 카운터를 반환합니다."""
+    return {name: float(value) for name, value in redis.hgetall(COUNTERS_KEY).items()}
+
+def record_stage_run(redis, stage: str, busy_seconds: float):
+    """단계별 파이프라인의 단계 실행 한 번과 처리에 쓴 시간을 분 단위 버킷에 기록합니다."""
+    key = STAGE_RUNS_KEY.format(bucket=_bucket(time.time()))
+    pipe = redis.pipeline()
+    pipe.hincrby(key, f"{stage}:tasks", 1)
+    pipe.hincrbyfloat(key, f"{stage}:busy", busy_seconds)
+    pipe.expire(key, settings.STAGE_METRICS_WINDOW + 120)
+    pipe.execute()
+
+def get_stage_stats(redis, concurrency: dict) -> dict:
+    """최근 윈도우 동안 단계별 처리량(작업/초), 평균 사용 중인 워커 수, 이용률을 반환합니다.
+
+    이용률은 평균 사용 중인 워커 수를 단계의 워커 동시성으로 나눈 값입니다.
+    """
+    now = _bucket(time.time())
+    # 현재 분은 아직 진행 중이므로 완료된 분 단위 버킷만 사용
+    buckets = range(1, settings.STAGE_METRICS_WINDOW // 60 + 1)
+    pipe = redis.pipeline()
+    for i in buckets:
+        pipe.hgetall(STAGE_RUNS_KEY.format(bucket=now - i))
+    totals = {stage: {"tasks": 0.0, "busy": 0.0} for stage in concurrency}
+    for values in pipe.execute():
+        for field, value in values.items():
+            stage, _, name = field.rpartition(":")
+            total = totals.setdefault(stage, {"tasks": 0.0, "busy": 0.0})
+            total[name] = total.get(name, 0.0) + float(value)
+
+    seconds = len(buckets) * 60
+    stats = {}
+    for stage, total in totals.items():
+        busy = total["busy"] / seconds
+        slots = concurrency.get(stage)
+        stats[stage] = {
+            "throughput": total["tasks"] / seconds,
+            "avgBusyWorkers": busy,
+            "utilization": busy / slots if slots else None
+        }
+    return stats
+
+def get_queue_depth(redis, queue: str = "main-queue") -> int:
+    """브로커 큐에 대기 중인 메시지 수를 반환합니다 (우선순위 큐 포함)."""
+    pipe = redis.pipeline()
+    for pri in PRIORITY_STEPS:
+        pipe.llen(f"{queue}{PRIORITY_SEP}{pri}" if pri else queue)
+    return sum(pipe.execute())
+
+def get_backlog_depth(redis) -> int:
+    """처리를 기다리는 문서 작업 메시지 수 (STAGED_PIPELINE이면 단계별 큐의 합)"""
+    queues = STAGE_QUEUES if settings.STAGED_PIPELINE else (settings.AUTOSCALE_QUEUE,)
+    return sum(get_queue_depth(redis, queue) for queue in queues)
+
+def agent_call_started(redis, job_id: str):
+    """에이전트 호출 시작을 기록합니다 (rate limit 여유량 계산용)."""
+    redis.zadd(AGENT_INFLIGHT_KEY, {job_id: time.time()})
+
+def agent_call_finished(redis, job_id: str):
+    """에이전트 호출 종료를 기록합니다."""
+    redis.zrem(AGENT_INFLIGHT_KEY, job_id)
+
+def get_agent_inflight(redis) -> int:
+    """진행 중인 에이전트 호출 수를 반환합니다 (비정상 종료로 남은 항목은 제외)."""
+    stale_before = time.time() - settings.AGENT_INFLIGHT_STALE_SECONDS
+    redis.zremrangebyscore(AGENT_INFLIGHT_KEY, "-inf", stale_before)
+    return redis.zcard(AGENT_INFLIGHT_KEY)
+
+class LoadSnapshot:
+    """대기열 길이, 처리량, 디스크 여유 공간의 프로세스 내 캐시 (API 요청마다 Redis를 조회하지 않기 위함)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.fetched_at = float("-inf")
+        self.queue_depth = 0
+        self.throughput = 0.0
+        self.avg_duration = settings.DEFAULT_JOB_DURATION
+        self.free_disk_bytes = None
+
+    def refresh_if_stale(self):
+        if time.monotonic() - self.fetched_at < settings.ADMISSION_CACHE_TTL:
+            return
+        with self.lock:
+            if time.monotonic() - self.fetched_at < settings.ADMISSION_CACHE_TTL:
+                return
+            # 실패해도 다음 갱신까지 재시도하지 않도록 먼저 시각을 기록
+            self.fetched_at = time.monotonic()
+            try:
+                redis = get_redis()
+                self.queue_depth = get_backlog_depth(get_broker_redis())
+                self.throughput = get_throughput(redis)
+                self.avg_duration = get_average_job_duration(redis)
+            except Exception as e:
+                logger.warning(f"Failed to refresh load metrics: {str(e)}")
+            try:
+                self.free_disk_bytes = shutil.disk_usage(settings.UPLOAD_DIR).free
+            except OSError:
+                self.free_disk_bytes = None
+
+    def note_admitted(self):
+        # 다음 갱신 전까지 새로 접수된 작업도 대기열 길이에 반영 (스레드 풀에서 동시에 호출됨)
+        with self.lock:
+            self.queue_depth += 1
+
+    def drain_seconds(self, jobs: int) -> float:
+        """jobs개의 작업을 처리하는 데 걸리는 예상 시간(초)을 반환합니다."""
+        if self.throughput > 0:
+            return jobs / self.throughput
+        return jobs * self.avg_duration
+
+_load_snapshot = LoadSnapshot()
+
+def get_load_snapshot() -> LoadSnapshot:
+    """캐시된 부하 지표를 반환합니다 (만료 시 갱신)."""
+    _load_snapshot.refresh_if_stale()
+    return _load_snapshot
@@ -0,0 +1,137 @@
+import contextlib
+import contextvars
+import logging
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from app.core.config import settings
+from app.core.metrics import COUNTERS_KEY
+
+logger = logging.getLogger(__name__)
+
+# 에이전트가 요청 모델을 바꿀 때 읽는 세션 상태 키 (guideline_agent의 before_model_callback)
+MODEL_STATE_KEY = "model"
+
+DEFAULT_TIER = "default"
+
+@dataclass
+class ModelTier:
+    name: str
+    model: str  # 비어 있으면 에이전트에 지정된 모델 사용
+    max_input_tokens: float
+    timeout: float
+
+@dataclass
+class TierUsage:
+    """한 작업이 티어에서 사용한 토큰 수 (에이전트 응답의 usageMetadata 합계)"""
+    tier: ModelTier
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+def parse_tiers(value: str) -> List[ModelTier]:
+    """"이름=모델:최대 입력 토큰:타임아웃" 목록을 최대 입력 토큰 순으로 반환합니다."""
+    tiers = []
+    for item in value.split(","):
+        name, sep, spec = item.partition("=")
+        if not sep:
+            continue
+        try:
+            model, max_tokens, timeout = spec.strip().split(":")
+            tiers.append(ModelTier(name.strip(), model.strip(), float(max_tokens), float(timeout)))
+        except ValueError:
+            logger.warning(f"Ignoring invalid model tier: {item}")
+    return sorted(tiers, key=lambda tier: tier.max_input_tokens)
+
+def get_tiers() -> List[ModelTier]:
+    tiers = parse_tiers(settings.AGENT_MODEL_TIERS)
+    if not tiers:
+        return [ModelTier(DEFAULT_TIER, "", math.inf, settings.AGENT_REQUEST_TIMEOUT)]
+    return tiers
+
+def select_tier(tokens: int) -> ModelTier:
+    """입력 토큰 수를 처리할 수 있는 가장 작은 티어를 고릅니다. 모두 넘으면 가장 큰 티어를 사용합니다."""
+    tiers = get_tiers()
+    for tier in tiers:
+        if tokens <= tier.max_input_tokens:
+            return tier
+    return tiers[-1]
+
+def _parse_prices(value: str) -> Dict[str, tuple]:
+    prices = {}
+    for item in value.split(","):
+        model, sep, spec = item.partition("=")
+        if not sep:
+            continue
+        try:
+            input_price, output_price = spec.split("/")
+            prices[model.strip()] = (float(input_price), float(output_price))
+        except ValueError:
+            logger.warning(f"Ignoring invalid model price: {item}")
+    return prices
+
+def estimate_cost(usage: TierUsage) -> float:
+    """AGENT_MODEL_PRICES(100만 토큰당 입력/출력 가격)로 사용 비용을 계산합니다. 가격이 없으면 0입니다."""
+    input_price, output_price = _parse_prices(settings.AGENT_MODEL_PRICES).get(usage.tier.model, (0.0, 0.0))
+    return (usage.input_tokens * input_price + usage.output_tokens * output_price) / 1_000_000
+
+_current_usage: contextvars.ContextVar[Optional[TierUsage]] = contextvars.ContextVar("model_tier", default=None)
+
+@contextlib.contextmanager
+def model_tier_scope(tier: ModelTier):
+    """블록 안의 에이전트 세션과 요청이 주어진 티어의 모델과 타임아웃을 사용하도록 합니다."""
+    usage = TierUsage(tier)
+    reset = _current_usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _current_usage.reset(reset)
+
+def current_usage() -> Optional[TierUsage]:
+    return _current_usage.get()
+
+def note_usage(events: List[dict]):
+    """에이전트 이벤트의 토큰 사용량을 현재 티어 사용량에 더합니다."""
+    usage = current_usage()
+    if usage is None:
+        return
+    for event in events:
+        metadata = event.get("usageMetadata") or {}
+        usage.input_tokens += metadata.get("promptTokenCount") or 0
+        usage.output_tokens += metadata.get("candidatesTokenCount") or 0
+
+def record_job_tier(redis, job_id: str, tier: ModelTier):
+    """작업에 사용한 모델 티어를 기록합니다."""
+    redis.hset(f"job:{job_id}", mapping={"model_tier": tier.name, "model": tier.model})
+
+def record_tier_usage(redis, usage: TierUsage, jobs: int, seconds: float):
+    """티어별 작업 수, 에이전트 처리 시간, 토큰 수, 비용을 누적 카운터에 기록합니다."""
+    name = usage.tier.name
+    pipe = redis.pipeline(transaction=False)
+    pipe.hincrbyfloat(COUNTERS_KEY, f"tier_jobs:{name}", jobs)
+    pipe.hincrbyfloat(COUNTERS_KEY, f"tier_runs:{name}", 1)
+    pipe.hincrbyfloat(COUNTERS_KEY, f"tier_agent_seconds:{name}", seconds)
+    pipe.hincrbyfloat(COUNTERS_KEY, f"tier_input_tokens:{name}", usage.input_tokens)
+    pipe.hincrbyfloat(COUNTERS_KEY, f"tier_output_tokens:{name}", usage.output_tokens)
+    pipe.hincrbyfloat(COUNTERS_KEY, f"tier_cost_usd:{name}", estimate_cost(usage))
+    pipe.execute()
+
+_STAT_NAMES = {
+    "tier_jobs": "jobs",
+    "tier_runs": "runs",
+    "tier_agent_seconds": "agentSeconds",
+    "tier_input_tokens": "inputTokens",
+    "tier_output_tokens": "outputTokens",
+    "tier_cost_usd": "costUsd",
+}
+
+def get_tier_stats(counters: dict) -> Dict[str, dict]:
+    """누적 카운터에서 티어별 평균 지연 시간과 작업당 비용을 계산합니다."""
+    stats = {}
+    for key, value in counters.items():
+        metric, sep, name = key.partition(":")
+        if sep and metric in _STAT_NAMES:
+            stats.setdefault(name, dict.fromkeys(_STAT_NAMES.values(), 0.0))[_STAT_NAMES[metric]] = value
+    for values in stats.values():
+        values["avgAgentSeconds"] = values["agentSeconds"] / values["runs"] if values["runs"] else None
+        values["costPerJobUsd"] = values["costUsd"] / values["jobs"] if values["jobs"] else None
+    return stats
@@ -0,0 +1,197 @@
+import argparse
+import base64
+import json
+import struct
+import time
+import zlib
+from array import array
+from dataclasses import dataclass
+from typing import List, Optional
+from app.core.config import settings
+
+# MinHash 서명 크기와 LSH 밴드 구성 (바꾸면 기존 색인과 호환되지 않음)
+SIGNATURE_SIZE = 128
+BANDS = 16
+ROWS = SIGNATURE_SIZE // BANDS
+# 바이트 단위 shingle 길이 (한글 5자 정도)
+SHINGLE_BYTES = 15
+
+# 밴드별 해시 (필드: 밴드 값의 해시, 값: 그 밴드를 가진 가장 최근 작업 ID)
+BAND_KEY = "neardup:band:{band}"
+# 작업별 서명 (필드: 작업 ID, 값: 서명 바이트)
+SIGNATURES_KEY = "neardup:signatures"
+# 색인된 작업 ID (점수: 색인 시각), 오래된 작업부터 정리하는 데 사용
+INDEXED_KEY = "neardup:indexed"
+# 색인할 때마다 정리하는 최대 작업 수
+PRUNE_BATCH = 100
+
+_BUCKET_BITS = SIGNATURE_SIZE.bit_length() - 1
+_EMPTY = 0xFFFFFFFF
+
+@dataclass
+class NearDuplicate:
+    job_id: str
+    similarity: float
+
+def _normalize(text: str) -> bytes:
+    # 공백과 대소문자 차이는 무시
+    return " ".join(text.split()).lower().encode("utf-8")
+
+def compute_signature(text: str) -> Optional[List[int]]:
+    """텍스트의 MinHash 서명을 계산합니다 (빈 텍스트는 None).
+
+    shingle마다 해시를 한 번만 계산하는 one permutation hashing을 사용하고,
+    빈 구간은 오른쪽의 가장 가까운 값으로 채웁니다 (densification).
+    """
+    data = _normalize(text)
+    if not data:
+        return None
+    shingles = {data[i:i + SHINGLE_BYTES] for i in range(max(len(data) - SHINGLE_BYTES + 1, 1))}
+
+    mins = [_EMPTY] * SIGNATURE_SIZE
+    mask = SIGNATURE_SIZE - 1
+    for shingle in shingles:
+        h = zlib.crc32(shingle)
+        bucket = h & mask
+        value = h >> _BUCKET_BITS
+        if value < mins[bucket]:
+            mins[bucket] = value
+
+    signature = list(mins)
+    for i in range(SIGNATURE_SIZE):
+        offset = 1
+        while signature[i] == _EMPTY and offset < SIGNATURE_SIZE:
+            source = mins[(i + offset) % SIGNATURE_SIZE]
+            if source != _EMPTY:
+                # 같은 값이 여러 구간에 복사되어도 구간마다 구분되도록 거리를 더함
+                signature[i] = (source + offset * 0x9E3779B1) & 0x7FFFFFFF | 0x80000000
+            offset += 1
+    return signature
+
+def similarity(a: List[int], b: List[int]) -> float:
+    """두 서명으로 추정한 Jaccard 유사도"""
+    return sum(x == y for x, y in zip(a, b)) / SIGNATURE_SIZE
+
+def band_fields(signature: List[int]) -> List[str]:
+    return [
+        format(zlib.crc32(struct.pack(f"<{ROWS}I", *signature[band * ROWS:(band + 1) * ROWS])), "08x")
+        for band in range(BANDS)
+    ]
+
+def _pack(signature: List[int]) -> str:
+    return base64.b64encode(array("I", signature).tobytes()).decode("ascii")
+
+def _unpack(data: str) -> List[int]:
+    values = array("I")
+    values.frombytes(base64.b64decode(data))
+    return values.tolist()
+
+def find_near_duplicate(redis, signature: List[int], threshold: float, exclude: Optional[str] = None) -> Optional[NearDuplicate]:
+    """색인된 작업 중 유사도가 threshold 이상인 가장 유사한 작업을 찾습니다.
+
+    밴드가 하나라도 같은 작업을 후보로 모은 뒤 서명으로 유사도를 확인합니다 (Redis 왕복 2번).
+    """
+    pipe = redis.pipeline(transaction=False)
+    for band, field in enumerate(band_fields(signature)):
+        pipe.hget(BAND_KEY.format(band=band), field)
+    candidates = {job_id for job_id in pipe.execute() if job_id}
+    candidates.discard(exclude)
+    if not candidates:
+        return None
+
+    candidates = sorted(candidates)
+    best = None
+    for job_id, data in zip(candidates, redis.hmget(SIGNATURES_KEY, candidates)):
+        if not data:
+            continue
+        score = similarity(signature, _unpack(data))
+        if score >= threshold and (best is None or score > best.similarity):
+            best = NearDuplicate(job_id=job_id, similarity=score)
+    return best
+
+def index_document(redis, job_id: str, signature: List[int]):
+    """완료된 작업의 서명을 색인에 추가합니다. 같은 밴드의 이전 작업은 가장 최근 작업으로 대체됩니다.
+
+    색인 크기는 NEAR_DUP_MAX_DOCUMENTS와 NEAR_DUP_RETENTION으로 제한하며, 넘친 작업은 추가할 때 함께 정리합니다.
+    """
+    now = time.time()
+    pipe = redis.pipeline(transaction=False)
+    pipe.hset(SIGNATURES_KEY, job_id, _pack(signature))
+    for band, field in enumerate(band_fields(signature)):
+        pipe.hset(BAND_KEY.format(band=band), field, job_id)
+    pipe.zadd(INDEXED_KEY, {job_id: now})
+    pipe.zcard(INDEXED_KEY)
+    size = pipe.execute()[-1]
+    prune(redis, size, now)
+
+def prune(redis, size: int, now: float):
+    """보관 기간이 지났거나 최대 작업 수를 넘은 작업을 가장 먼저 색인한 것부터 최대 PRUNE_BATCH개 지웁니다."""
+    stale = []
+    if settings.NEAR_DUP_RETENTION > 0:
+        stale = redis.zrangebyscore(INDEXED_KEY, "-inf", now - settings.NEAR_DUP_RETENTION, start=0, num=PRUNE_BATCH)
+    overflow = min(size - settings.NEAR_DUP_MAX_DOCUMENTS, PRUNE_BATCH)
+    if overflow > len(stale):
+        stale = redis.zrange(INDEXED_KEY, 0, overflow - 1)
+    if stale:
+        remove_documents(redis, stale)
+
+def remove_documents(redis, job_ids: List[str]):
+    """작업들의 서명과, 아직 그 작업을 가리키는 밴드 필드를 색인에서 지웁니다."""
+    owned = []
+    pipe = redis.pipeline(transaction=False)
+    for job_id, data in zip(job_ids, redis.hmget(SIGNATURES_KEY, job_ids)):
+        if not data:
+            continue
+        for band, field in enumerate(band_fields(_unpack(data))):
+            pipe.hget(BAND_KEY.format(band=band), field)
+            owned.append((band, field, job_id))
+    owners = pipe.execute()
+
+    # 읽은 뒤 다른 작업이 같은 밴드를 덮어쓰면 그 필드가 지워질 수 있지만, 후보 하나를 놓칠 뿐 잘못 찾지는 않음
+    pipe = redis.pipeline(transaction=False)
+    for (band, field, job_id), owner in zip(owned, owners):
+        if owner == job_id:
+            pipe.hdel(BAND_KEY.format(band=band), field)
+    pipe.hdel(SIGNATURES_KEY, *job_ids)
+    pipe.zrem(INDEXED_KEY, *job_ids)
+    pipe.execute()
+
+def backfill_indexed(redis, batch: int = 1000) -> int:
+    """색인 시각 기록(INDEXED_KEY)이 없는 작업을 추가하고 추가한 수를 반환합니다.
+
+    INDEXED_KEY가 생기기 전에 색인된 작업은 prune이 찾지 못해 계속 남으므로 한 번 실행합니다.
+    실제 색인 시각을 알 수 없으므로 가장 오래된 기록과 같은 시각으로 넣어 넘친 작업을 정리할 때 먼저 지우고,
+    보관 기간은 그 시각(기록이 없으면 지금)부터 셉니다.
+    """
+    oldest = redis.zrange(INDEXED_KEY, 0, 0, withscores=True)
+    score = oldest[0][1] if oldest else time.time()
+    added = 0
+    job_ids = []
+    for job_id, _ in redis.hscan_iter(SIGNATURES_KEY, count=batch):
+        job_ids.append(job_id)
+        if len(job_ids) >= batch:
+            added += _add_missing(redis, job_ids, score)
+            job_ids = []
+    if job_ids:
+        added += _add_missing(redis, job_ids, score)
+    return added
+
+def _add_missing(redis, job_ids: List[str], score: float) -> int:
+    pipe = redis.pipeline(transaction=False)
+    for job_id in job_ids:
+        pipe.zadd(INDEXED_KEY, {job_id: score}, nx=True)
+    return sum(pipe.execute())
+
+def main():
+    from app.core.redis_client import get_redis
+
+    parser = argparse.ArgumentParser(description="유사 문서 색인 관리")
+    parser.add_argument("--backfill", action="store_true", help="색인 시각 기록이 없는 작업을 정리 대상에 추가")
+    args = parser.parse_args()
+    if not args.backfill:
+        parser.error("실행할 작업을 지정하세요 (--backfill)")
+
+    print(json.dumps({"added": backfill_indexed(get_redis())}, indent=2))
+
+if __name__ == "__main__":
+    main()
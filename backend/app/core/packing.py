@@ -0,0 +1,47 @@
+import json
+import math
+from typing import List, Optional
+from app.core.config import settings
+
+# 묶음 처리를 기다리는 작업 목록 (접수 순서)
+PACK_BUFFER_KEY = "pack:buffer"
+# 묶음을 기다리는 작업의 추출된 텍스트
+PACK_TEXT_KEY = "pack:text:{job_id}"
+
+def estimate_tokens(text: str) -> int:
+    """텍스트의 토큰 수를 글자 수로 추정합니다."""
+    return math.ceil(len(text) / settings.PACK_CHARS_PER_TOKEN)
+
+def is_packable(text: str) -> bool:
+    return settings.PACKING_ENABLED and settings.PACK_MAX_DOCS > 1 and estimate_tokens(text) <= settings.PACK_MAX_TOKENS
+
+def add_to_pack(redis, entry: dict, text: str) -> int:
+    """작업을 묶음 대기 목록에 추가하고 목록 길이를 반환합니다.
+
+    entry에는 job_id와 작업을 마무리하는 데 필요한 정보(filename, blob, started_at)를 담습니다.
+    """
+    pipe = redis.pipeline()
+    pipe.set(PACK_TEXT_KEY.format(job_id=entry["job_id"]), text, ex=settings.PACK_TEXT_TTL)
+    pipe.rpush(PACK_BUFFER_KEY, json.dumps(entry))
+    return pipe.execute()[-1]
+
+def take_pack(redis, max_docs: Optional[int] = None) -> List[dict]:
+    """대기 목록 앞에서 최대 max_docs개 작업을 꺼내고 각 작업의 텍스트를 채워 반환합니다."""
+    max_docs = max_docs or settings.PACK_MAX_DOCS
+    pipe = redis.pipeline()  # MULTI로 실행되어 여러 워커가 같은 작업을 꺼내지 않음
+    pipe.lrange(PACK_BUFFER_KEY, 0, max_docs - 1)
+    pipe.ltrim(PACK_BUFFER_KEY, max_docs, -1)
+    entries = [json.loads(item) for item in pipe.execute()[0]]
+    if not entries:
+        return []
+
+    keys = [PACK_TEXT_KEY.format(job_id=entry["job_id"]) for entry in entries]
+    pipe = redis.pipeline()
+    pipe.mget(keys)
+    pipe.delete(*keys)
+    for entry, text in zip(entries, pipe.execute()[0]):
+        entry["text"] = text
+    return entries
+
+def pending_count(redis) -> int:
+    return redis.llen(PACK_BUFFER_KEY)
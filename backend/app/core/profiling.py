@@ -0,0 +1,86 @@
+import cProfile
+import contextlib
+import io
+import logging
+import os
+import pstats
+import random
+import tracemalloc
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 작업별로 저장되는 프로파일 산출물 파일명
+PROFILE_ARTIFACTS = {
+    "cpu.prof": "application/octet-stream",
+    "cpu.txt": "text/plain",
+    "tracemalloc.txt": "text/plain",
+}
+
+def should_profile(requested: bool = False) -> bool:
+    """작업을 프로파일링할지 결정합니다 (명시적 요청 또는 샘플링)."""
+    if requested:
+        return True
+    rate = settings.PROFILE_SAMPLE_RATE
+    return rate > 0 and random.random() < rate
+
+def get_profile_dir(job_id: str) -> str:
+    """작업의 프로파일 산출물 디렉토리 경로를 반환합니다."""
+    return os.path.join(settings.PROFILE_DIR, job_id)
+
+def list_profile_artifacts(job_id: str) -> list:
+    """저장된 프로파일 산출물 목록을 반환합니다."""
+    profile_dir = get_profile_dir(job_id)
+    if not os.path.isdir(profile_dir):
+        return []
+    return [name for name in PROFILE_ARTIFACTS if os.path.exists(os.path.join(profile_dir, name))]
+
+@contextlib.contextmanager
+def _capture(job_id: str):
+    profile_dir = get_profile_dir(job_id)
+    os.makedirs(profile_dir, exist_ok=True)
+
+    # 이미 다른 곳에서 tracemalloc을 켠 경우에는 끄지 않음
+    started_tracemalloc = not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start(settings.PROFILE_TRACEMALLOC_FRAMES)
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        if started_tracemalloc:
+            tracemalloc.stop()
+
+        try:
+            profiler.dump_stats(os.path.join(profile_dir, "cpu.prof"))
+
+            stream = io.StringIO()
+            stats = pstats.Stats(profiler, stream=stream)
+            stats.sort_stats("cumulative").print_stats(settings.PROFILE_TOP_FUNCTIONS)
+            with open(os.path.join(profile_dir, "cpu.txt"), "w", encoding="utf-8") as f:
+                f.write(stream.getvalue())
+
+            top_stats = snapshot.statistics("lineno")[:settings.PROFILE_TOP_ALLOCATIONS]
+            with open(os.path.join(profile_dir, "tracemalloc.txt"), "w", encoding="utf-8") as f:
+                f.write(f"peak: {peak / 1024 / 1024:.2f} MiB\n")
+                for stat in top_stats:
+                    f.write(f"{stat}\n")
+
+            logger.info(f"Saved profile artifacts for job {job_id} to {profile_dir}")
+        except Exception as e:
+            # 프로파일 저장 실패가 작업 결과에 영향을 주지 않도록 함
+            logger.error(f"Failed to save profile for job {job_id}: {str(e)}")
+
+def profile_job(job_id: str, enabled: bool):
+    """작업의 CPU 프로파일과 메모리 할당 상위 항목을 수집하는 컨텍스트 매니저를 반환합니다.
+
+    프로파일링 대상이 아닌 작업은 nullcontext를 사용하므로 추가 비용이 없습니다.
+    """
+    if not enabled:
+        return contextlib.nullcontext()
+    return _capture(job_id)
@@ -0,0 +1,51 @@
+from redis import ConnectionPool, Redis
+from app.core.config import settings
+
+# 프로세스당 하나의 Redis 연결 풀 (첫 사용 시 생성)
+_redis = None
+_broker_redis = None
+
+def get_redis() -> Redis:
+    """프로세스 공용 Redis 클라이언트를 반환합니다."""
+    global _redis
+    if _redis is None:
+        pool = ConnectionPool(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            decode_responses=True,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT
+        )
+        _redis = Redis(connection_pool=pool)
+    return _redis
+
+def get_broker_redis() -> Redis:
+    """Celery 브로커 Redis 클라이언트를 반환합니다 (큐 길이 조회용)."""
+    global _broker_redis
+    if _broker_redis is None:
+        _broker_redis = Redis.from_url(
+            settings.CELERY_BROKER_URL,
+            decode_responses=True,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT
+        )
+    return _broker_redis
+
+def close_redis():
+    """Redis 연결 풀을 정리합니다."""
+    global _redis, _broker_redis
+    if _redis is not None:
+        _redis.connection_pool.disconnect()
+        _redis = None
+    if _broker_redis is not None:
+        _broker_redis.connection_pool.disconnect()
+        _broker_redis = None
+
+class _RedisProxy:
+    """첫 속성 접근 시점에 공용 Redis 클라이언트로 위임하는 프록시"""
+
+    def __getattr__(self, name):
+        return getattr(get_redis(), name)
+
+redis_client = _RedisProxy()
@@ -0,0 +1,30 @@
+import asyncio
+import random
+import aiohttp
+from app.core.config import settings
+
+class TransientError(Exception):
+    """재시도하면 성공할 수 있는 일시적 오류"""
+
+class PermanentError(Exception):
+    """재시도해도 성공하지 않는 오류"""
+
+def is_transient(error: Exception) -> bool:
+    """오류가 재시도 대상인지 분류합니다. 분류되지 않은 오류는 영구 오류로 취급합니다."""
+    if isinstance(error, PermanentError):
+        return False
+    return isinstance(error, (
+        TransientError,
+        aiohttp.ClientConnectionError,
+        aiohttp.ServerTimeoutError,
+        asyncio.TimeoutError,
+        ConnectionError
+    ))
+
+def backoff_delay(attempt: int) -> float:
+    """attempt번째 재시도까지 기다릴 시간(초)을 지터를 더한 지수 백오프로 계산합니다.
+
+    여러 워커가 동시에 재시도하지 않도록 지연의 절반은 무작위로 정합니다 (equal jitter).
+    """
+    delay = min(settings.AGENT_RETRY_MAX_DELAY, settings.AGENT_RETRY_BASE_DELAY * (2 ** attempt))
+    return delay / 2 + random.uniform(0, delay / 2)
@@ -0,0 +1,90 @@
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Dict, List
+from app.core.config import settings
+
+# 작업별 섹션 요약 (필드: 섹션 해시, 값: 섹션 요약), 새 버전 작업이 이전 버전의 요약을 재사용
+SECTIONS_KEY = "job:{job_id}:sections"
+
+# 섹션 제목으로 보는 짧은 줄 (제1조, 제2장, 1., 1.2, Ⅰ., 가., 마크다운 제목)
+_HEADING = re.compile(
+    r"^(?:제\s*\d+\s*[조장절편관]|\d+(?:\.\d+)*\.?\s|[ⅠⅡⅢⅣⅤⅥⅦⅧⅨⅩ]+\.|[가-하]\.\s|#{1,6}\s)"
+)
+_HEADING_MAX_CHARS = 60
+# 이보다 짧은 섹션은 앞 섹션에 합침 (번호 목록이 섹션으로 잘게 나뉘지 않도록)
+_SECTION_MIN_CHARS = 200
+
+@dataclass
+class Section:
+    title: str
+    text: str
+
+    @property
+    def digest(self) -> str:
+        # 공백 차이는 같은 섹션으로 취급
+        return hashlib.sha256(" ".join(self.text.split()).encode("utf-8")).hexdigest()[:32]
+
+def _is_heading(line: str) -> bool:
+    return len(line) <= _HEADING_MAX_CHARS and bool(_HEADING.match(line))
+
+def _split_long(section: Section) -> List[Section]:
+    """SECTION_MAX_CHARS보다 긴 섹션을 줄 단위로 나눕니다."""
+    if len(section.text) <= settings.SECTION_MAX_CHARS:
+        return [section]
+    parts, current, size = [], [], 0
+    for line in section.text.split("\n"):
+        if current and size + len(line) > settings.SECTION_MAX_CHARS:
+            parts.append("\n".join(current))
+            current, size = [], 0
+        current.append(line)
+        size += len(line) + 1
+    parts.append("\n".join(current))
+    return [Section(f"{section.title} ({i})" if section.title else "", part) for i, part in enumerate(parts, 1)]
+
+def split_sections(text: str) -> List[Section]:
+    """텍스트를 제목 줄 기준으로 섹션으로 나눕니다. 제목이 없는 문서는 길이 기준으로 나눕니다."""
+    sections: List[Section] = []
+    title, lines = "", []
+    for line in text.split("\n"):
+        stripped = line.strip()
+        if stripped and _is_heading(stripped) and (lines or title):
+            sections.append(Section(title, "\n".join(lines).strip()))
+            title, lines = stripped, []
+        elif stripped and _is_heading(stripped):
+            title = stripped
+        else:
+            lines.append(line)
+    sections.append(Section(title, "\n".join(lines).strip()))
+
+    merged: List[Section] = []
+    for section in sections:
+        if not section.text and not section.title:
+            continue
+        if merged and len(section.text) < _SECTION_MIN_CHARS:
+            previous = merged[-1]
+            merged[-1] = Section(previous.title, f"{previous.text}\n{section.title}\n{section.text}".strip())
+        else:
+            merged.append(section)
+    return [part for section in merged for part in _split_long(section)]
+
+def load_section_summaries(redis, job_id: str, digests: List[str]) -> Dict[str, str]:
+    """작업에 저장된 섹션 요약 중 주어진 해시의 요약을 반환합니다."""
+    if not digests:
+        return {}
+    values = redis.hmget(SECTIONS_KEY.format(job_id=job_id), digests)
+    return {digest: value for digest, value in zip(digests, values) if value}
+
+def save_section_summaries(redis, job_id: str, summaries: Dict[str, str]):
+    """작업의 섹션 요약을 SECTION_SUMMARY_TTL 동안 보관합니다 (지나면 다음 버전은 모든 섹션을 다시 요약)."""
+    if not summaries:
+        return
+    key = SECTIONS_KEY.format(job_id=job_id)
+    pipe = redis.pipeline()
+    pipe.hset(key, mapping=summaries)
+    pipe.expire(key, settings.SECTION_SUMMARY_TTL)
+    pipe.execute()
+
+def record_section_reuse(redis, job_id: str, total: int, reused: int):
+    """작업의 전체 섹션 수와 이전 버전에서 재사용한 섹션 수를 기록합니다."""
+    redis.hset(f"job:{job_id}", mapping={"sections_total": total, "sections_reused": reused})
@@ -0,0 +1,24 @@
+import json
+from typing import Optional
+from app.core.config import settings
+
+# 단계별 파이프라인에서 단계 사이에 넘기는 데이터 (브로커 메시지에는 작업 ID만 담음)
+STAGE_TEXT_KEY = "stage:text:{job_id}"  # 추출 단계 → 에이전트/저장 단계
+STAGE_RESULT_KEY = "stage:result:{job_id}"  # 에이전트 단계 → 저장 단계
+
+def put_text(redis, job_id: str, text: str):
+    redis.set(STAGE_TEXT_KEY.format(job_id=job_id), text, ex=settings.STAGE_PAYLOAD_TTL)
+
+def get_text(redis, job_id: str) -> Optional[str]:
+    return redis.get(STAGE_TEXT_KEY.format(job_id=job_id))
+
+def put_result(redis, job_id: str, result: dict):
+    redis.set(STAGE_RESULT_KEY.format(job_id=job_id), json.dumps(result, ensure_ascii=False), ex=settings.STAGE_PAYLOAD_TTL)
+
+def get_result(redis, job_id: str) -> Optional[dict]:
+    value = redis.get(STAGE_RESULT_KEY.format(job_id=job_id))
+    return json.loads(value) if value else None
+
+def clear(redis, job_id: str):
+    """작업이 끝나면(완료, 실패, 취소) 단계 사이 데이터를 지웁니다."""
+    redis.delete(STAGE_TEXT_KEY.format(job_id=job_id), STAGE_RESULT_KEY.format(job_id=job_id))
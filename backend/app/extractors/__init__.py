@@ -0,0 +1,14 @@
+from app.extractors.registry import (
+    CALIBRATION_KEY,
+    Backend,
+    ExtractionResult,
+    UnsupportedFormatError,
+    detect_format,
+    extract,
+    get_backends,
+    register,
+    supported_formats,
+)
+
+# 기본 백엔드 등록 (등록 순서가 기본 우선순위)
+from app.extractors import pdf, word, text  # noqa: E402,F401
@@ -0,0 +1,68 @@
+import logging
+import os
+import time
+from collections import defaultdict
+from typing import Dict, Iterable
+from app.core.config import settings
+from app.extractors.registry import CALIBRATION_KEY, detect_format, get_backends
+
+logger = logging.getLogger(__name__)
+
+def _content_chars(text: str) -> int:
+    # 공백 처리 방식이 달라도 품질을 비교할 수 있도록 공백을 제외한 문자 수 사용
+    return sum(1 for c in text if not c.isspace())
+
+def calibrate(paths: Iterable[str], repeat: int = 1) -> Dict[str, dict]:
+    """샘플 파일로 형식별 백엔드의 속도와 추출 품질을 측정하고 가장 빠른 백엔드를 고릅니다.
+
+    품질은 파일마다 가장 많이 추출한 백엔드 대비 추출한 문자 수의 비율이며,
+    EXTRACTOR_MIN_QUALITY 이상인 백엔드 중 처리량(MB/s)이 가장 높은 것을 고릅니다.
+    """
+    by_format = defaultdict(list)
+    for path in paths:
+        by_format[detect_format(path)].append(path)
+
+    report = {}
+    for fmt, files in sorted(by_format.items()):
+        backends = get_backends(fmt)
+        stats = {b.name: {"seconds": 0.0, "bytes": 0, "quality": [], "errors": 0} for b in backends}
+        for path in files:
+            size = os.path.getsize(path)
+            chars = {}
+            for backend in backends:
+                try:
+                    start = time.perf_counter()
+                    for _ in range(repeat):
+                        text = backend.func(path)
+                    stats[backend.name]["seconds"] += (time.perf_counter() - start) / repeat
+                    stats[backend.name]["bytes"] += size
+                    chars[backend.name] = _content_chars(text)
+                except Exception as e:
+                    logger.warning(f"Extractor {backend.name} failed on {path}: {str(e)}")
+                    stats[backend.name]["errors"] += 1
+                    chars[backend.name] = 0
+            best = max(chars.values(), default=0)
+            for name, count in chars.items():
+                stats[name]["quality"].append(count / best if best else 1.0)
+
+        results = {}
+        for name, s in stats.items():
+            quality = sum(s["quality"]) / len(s["quality"]) if s["quality"] else 0.0
+            results[name] = {
+                "mb_per_s": s["bytes"] / s["seconds"] / 1e6 if s["seconds"] else 0.0,
+                "quality": quality,
+                "errors": s["errors"]
+            }
+        eligible = [
+            name for name, r in results.items()
+            if r["quality"] >= settings.EXTRACTOR_MIN_QUALITY and not r["errors"]
+        ]
+        chosen = max(eligible, key=lambda name: results[name]["mb_per_s"]) if eligible else None
+        report[fmt] = {"backend": chosen, "files": len(files), "results": results}
+    return report
+
+def save_calibration(redis, report: Dict[str, dict]):
+    """보정 결과를 워커들이 공유하도록 Redis에 저장합니다."""
+    choices = {fmt: r["backend"] for fmt, r in report.items() if r["backend"]}
+    if choices:
+        redis.hset(CALIBRATION_KEY, mapping=choices)
@@ -0,0 +1,34 @@
+import shutil
+import subprocess
+import time
+from app.core.cancellation import checkpoint
+from app.core.config import settings
+
+def command_available(name: str):
+    """외부 명령이 설치되어 있는지 확인하는 함수를 반환합니다 (백엔드 available 인자용)."""
+    return lambda: shutil.which(name) is not None
+
+def run_command(args: list) -> str:
+    """외부 추출 명령을 실행하고 표준 출력을 UTF-8로 반환합니다.
+
+    실행 중에도 작업 취소를 확인하며, 취소되거나 시간이 초과되면 프로세스를 종료합니다.
+    """
+    proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    deadline = time.monotonic() + settings.EXTRACTOR_COMMAND_TIMEOUT
+    try:
+        while True:
+            try:
+                stdout, stderr = proc.communicate(timeout=settings.CANCEL_CHECK_INTERVAL)
+                break
+            except subprocess.TimeoutExpired:
+                checkpoint()
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"{args[0]} timed out")
+    except BaseException:
+        proc.kill()
+        proc.communicate()
+        raise
+
+    if proc.returncode != 0:
+        raise RuntimeError(f"{args[0]} failed ({proc.returncode}): {stderr.decode(errors='replace').strip()}")
+    return stdout.decode("utf-8", errors="replace")
@@ -0,0 +1,22 @@
+import importlib.util
+from app.core.cancellation import checkpoint
+from app.extractors.command import command_available, run_command
+from app.extractors.registry import register
+
+@register("pdf", "pypdf2", available=lambda: importlib.util.find_spec("PyPDF2") is not None)
+def extract_with_pypdf2(file_path: str) -> str:
+    """PyPDF2로 페이지별 텍스트를 추출합니다."""
+    import PyPDF2  # 무거운 의존성은 사용 시점에 임포트
+
+    pages = []
+    with open(file_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        for page in pdf_reader.pages:
+            checkpoint()
+            pages.append(page.extract_text())
+    return "\n".join(pages)
+
+@register("pdf", "pdftotext", available=command_available("pdftotext"))
+def extract_with_pdftotext(file_path: str) -> str:
+    """poppler의 pdftotext로 텍스트를 추출합니다 (큰 PDF에서 PyPDF2보다 빠름)."""
+    return run_command(["pdftotext", "-enc", "UTF-8", "-q", file_path, "-"])
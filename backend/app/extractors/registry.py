@@ -0,0 +1,142 @@
+import logging
+import os
+import time
+import zipfile
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+from app.core.cancellation import JobCancelled
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 보정 벤치마크가 고른 형식별 백엔드 (필드: 형식, 값: 백엔드 이름)
+CALIBRATION_KEY = "extractor:calibration"
+
+@dataclass
+class ExtractionResult:
+    text: str
+    backend: str
+    format: str
+
+class UnsupportedFormatError(ValueError):
+    """추출할 수 있는 백엔드가 없는 파일 형식"""
+
+class Backend:
+    """형식 하나를 처리하는 텍스트 추출 백엔드
+
+    func(file_path)는 추출한 텍스트를 반환하고, available()은 필요한 라이브러리나 명령이 설치되어 있는지 반환합니다.
+    """
+
+    def __init__(self, fmt: str, name: str, func: Callable[[str], str], available: Optional[Callable[[], bool]] = None):
+        self.format = fmt
+        self.name = name
+        self.func = func
+        self._available = available
+        self._is_available: Optional[bool] = None
+
+    def is_available(self) -> bool:
+        if self._is_available is None:
+            try:
+                self._is_available = self._available() if self._available else True
+            except Exception:
+                self._is_available = False
+        return self._is_available
+
+    def __repr__(self):
+        return f"Backend({self.format}:{self.name})"
+
+_backends: Dict[str, List[Backend]] = defaultdict(list)
+
+def register(fmt: str, name: str, available: Optional[Callable[[], bool]] = None):
+    """형식별 추출 백엔드를 등록하는 데코레이터 (등록 순서가 기본 우선순위)"""
+    def decorator(func):
+        _backends[fmt] = [b for b in _backends[fmt] if b.name != name]
+        _backends[fmt].append(Backend(fmt, name, func, available))
+        return func
+    return decorator
+
+def get_backends(fmt: str, available_only: bool = True) -> List[Backend]:
+    """형식에 등록된 백엔드를 기본 우선순위 순서로 반환합니다."""
+    return [b for b in _backends.get(fmt, []) if not available_only or b.is_available()]
+
+def supported_formats() -> List[str]:
+    return sorted(fmt for fmt in _backends if get_backends(fmt))
+
+def detect_format(file_path: str, filename: Optional[str] = None) -> str:
+    """확장자로 형식을 정합니다. DOCX를 .doc로 저장한 파일은 docx로 취급합니다.
+
+    저장소 경로처럼 확장자가 없는 파일은 원본 파일명(filename)의 확장자를 사용합니다.
+    """
+    fmt = os.path.splitext(filename or file_path)[1].lower().lstrip(".")
+    if fmt == "doc" and zipfile.is_zipfile(file_path):
+        return "docx"
+    return fmt
+
+def _configured_backends() -> Dict[str, str]:
+    pinned = {}
+    for item in settings.EXTRACTOR_BACKENDS.split(","):
+        fmt, sep, name = item.partition("=")
+        if sep:
+            pinned[fmt.strip().lower()] = name.strip()
+    return pinned
+
+_calibration: Dict[str, str] = {}
+_calibration_loaded_at = float("-inf")
+
+def _calibrated_backends() -> Dict[str, str]:
+    global _calibration, _calibration_loaded_at
+    now = time.monotonic()
+    if now - _calibration_loaded_at >= settings.EXTRACTOR_CALIBRATION_TTL:
+        _calibration_loaded_at = now
+        try:
+            from app.core.redis_client import get_redis
+            _calibration = get_redis().hgetall(CALIBRATION_KEY)
+        except Exception as e:
+            logger.warning(f"Failed to load extractor calibration: {str(e)}")
+    return _calibration
+
+def reset_calibration_cache():
+    """캐시한 보정 결과를 비워 다음 추출 때 Redis에서 다시 읽게 합니다."""
+    global _calibration, _calibration_loaded_at
+    _calibration = {}
+    _calibration_loaded_at = float("-inf")
+
+def ordered_backends(fmt: str) -> List[Backend]:
+    """설정으로 고정한 백엔드, 보정 결과, 기본 우선순위 순서로 시도할 백엔드를 반환합니다."""
+    backends = get_backends(fmt)
+    preferred = _configured_backends().get(fmt) or _calibrated_backends().get(fmt)
+    if preferred:
+        backends.sort(key=lambda b: b.name != preferred)
+    return backends
+
+def extract(file_path: str, fmt: Optional[str] = None) -> ExtractionResult:
+    """파일에서 텍스트를 추출합니다.
+
+    우선 백엔드가 실패하거나 빈 텍스트를 반환하면 다음 백엔드로 넘어가며, 결과에 실제로 사용한 백엔드를 기록합니다.
+    """
+    fmt = fmt or detect_format(file_path)
+    backends = ordered_backends(fmt)
+    if not backends:
+        if fmt == "doc":
+            raise UnsupportedFormatError("DOC(Word 97-2003) 파일을 읽을 수 있는 추출기가 없습니다. DOCX로 변환해 업로드해 주세요.")
+        raise UnsupportedFormatError(f"지원하지 않는 파일 형식입니다: .{fmt}")
+
+    result = None
+    last_error = None
+    for backend in backends:
+        try:
+            text = backend.func(file_path).strip()
+        except JobCancelled:
+            raise
+        except Exception as e:
+            logger.warning(f"Extractor {backend.name} failed on {file_path}: {str(e)}")
+            last_error = e
+            continue
+        result = ExtractionResult(text=text, backend=backend.name, format=fmt)
+        if text:
+            return result
+
+    if result is not None:
+        return result
+    raise last_error
@@ -0,0 +1,91 @@
+import codecs
+import importlib.util
+import io
+import logging
+from typing import Optional
+from app.core.cancellation import checkpoint
+from app.core.config import settings
+from app.extractors.registry import register
+
+logger = logging.getLogger(__name__)
+
+# 긴 BOM부터 확인 (UTF-32 LE BOM은 UTF-16 LE BOM으로 시작)
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+# BOM이 없을 때 표본에 엄격하게 시도하는 인코딩 (한국어 문서가 대부분이므로 UTF-8 다음 CP949, CP949는 EUC-KR의 상위 집합)
+_CANDIDATES = ("utf-8", "cp949")
+_CHUNK_SIZE = 1 << 20
+
+def _decodes(sample: bytes, encoding: str, complete: bool) -> bool:
+    # 표본 끝에서 잘린 멀티바이트 문자는 오류로 보지 않음
+    try:
+        codecs.getincrementaldecoder(encoding)("strict").decode(sample, final=complete)
+        return True
+    except UnicodeDecodeError:
+        return False
+
+def detect_encoding(sample: bytes, complete: bool = False) -> Optional[str]:
+    """표본으로 인코딩을 추정합니다: BOM, 엄격한 UTF-8 검사, CP949, 마지막으로 chardet 순서입니다."""
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+    for encoding in _CANDIDATES:
+        if _decodes(sample, encoding, complete):
+            return encoding
+
+    import chardet  # 무거운 의존성은 사용 시점에 임포트
+    return chardet.detect(sample)["encoding"]
+
+def decode_file(file_path: str, encoding: str, errors: str = "strict") -> str:
+    """파일을 청크 단위로 한 번에 읽어 디코딩합니다 (줄바꿈은 \\n으로 통일)."""
+    out = io.StringIO()
+    with open(file_path, "r", encoding=encoding, errors=errors, newline=None) as file:
+        while True:
+            chunk = file.read(_CHUNK_SIZE)
+            if not chunk:
+                break
+            out.write(chunk)
+            checkpoint()
+    return out.getvalue()
+
+@register("txt", "txt-stream")
+def extract_with_sampled_encoding(file_path: str) -> str:
+    """앞부분 표본으로 인코딩을 정하고 파일을 스트리밍으로 한 번만 디코딩합니다.
+
+    표본 뒤에서 디코딩 오류가 나면 다음 후보 인코딩으로 다시 읽고, 모두 실패하면 잘못된 바이트를 치환합니다.
+    """
+    with open(file_path, "rb") as file:
+        sample = file.read(settings.TXT_DETECT_SAMPLE_BYTES)
+        complete = not file.read(1)
+
+    encoding = detect_encoding(sample, complete) or "utf-8"
+    tried = []
+    for candidate in dict.fromkeys((encoding,) + _CANDIDATES):
+        if candidate != encoding and not _decodes(sample, candidate, complete):
+            continue
+        tried.append(candidate)
+        try:
+            return decode_file(file_path, candidate)
+        except UnicodeDecodeError as e:
+            logger.info(f"{file_path} is not valid {candidate} past the sample: {str(e)}")
+
+    logger.warning(f"{file_path} could not be decoded strictly with {tried}, replacing invalid bytes")
+    return decode_file(file_path, encoding, errors="replace")
+
+@register("txt", "chardet", available=lambda: importlib.util.find_spec("chardet") is not None)
+def extract_with_chardet(file_path: str) -> str:
+    """chardet으로 파일 전체의 인코딩을 감지해 텍스트 파일을 읽습니다."""
+    import chardet  # 무거운 의존성은 사용 시점에 임포트
+
+    with open(file_path, 'rb') as file:
+        raw_data = file.read()
+        detected = chardet.detect(raw_data)
+        encoding = detected['encoding']
+
+    with open(file_path, 'r', encoding=encoding) as file:
+        return file.read()
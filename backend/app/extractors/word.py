@@ -0,0 +1,124 @@
+import importlib.util
+import io
+import re
+import zipfile
+from xml.etree.ElementTree import iterparse
+from app.core.cancellation import checkpoint
+from app.extractors.command import command_available, run_command
+from app.extractors.registry import register
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_BODY, _P, _T, _TAB, _BR, _CR, _TC, _TR = (
+    f"{W}body", f"{W}p", f"{W}t", f"{W}tab", f"{W}br", f"{W}cr", f"{W}tc", f"{W}tr"
+)
+_HEADER_FOOTER = re.compile(r"word/(header|footer)(\d*)\.xml$")
+# 취소 확인 간격 (문단 수)
+_CHECKPOINT_EVERY = 500
+
+def iter_part_lines(stream):
+    """document.xml/header.xml/footer.xml 하나를 스트리밍으로 읽어 문단과 표의 행을 문서 순서대로 반환합니다.
+
+    표는 행마다 셀을 " | "로 이어 한 줄로 만들고, 처리가 끝난 최상위 요소는 바로 해제해 메모리를 일정하게 유지합니다.
+    """
+    depth = 0
+    container = None      # 처리한 자식 요소를 해제할 요소 (본문은 w:body, 머리글/바닥글은 루트)
+    container_depth = 0
+    run = []              # 현재 문단의 텍스트 조각
+    cells = []            # 열린 표 셀마다 [문단 텍스트, ...] (중첩 표는 스택)
+    rows = []             # 열린 표 행마다 [셀 텍스트, ...]
+    paragraphs = 0
+
+    for event, elem in iterparse(stream, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if container is None and (elem.tag == _BODY or (depth == 1 and elem.tag != f"{W}document")):
+                container, container_depth = elem, depth
+            elif elem.tag == _TR:
+                rows.append([])
+            elif elem.tag == _TC:
+                cells.append([])
+            continue
+
+        depth -= 1
+        tag = elem.tag
+        if tag == _T:
+            run.append(elem.text or "")
+        elif tag == _TAB:
+            run.append("\t")
+        elif tag in (_BR, _CR):
+            run.append("\n")
+        elif tag == _P:
+            text = "".join(run)
+            run = []
+            paragraphs += 1
+            if paragraphs % _CHECKPOINT_EVERY == 0:
+                checkpoint()
+            if cells:
+                cells[-1].append(text)
+            elif text:
+                yield text
+        elif tag == _TC:
+            cell = " ".join(t for t in cells.pop() if t)
+            if rows:
+                rows[-1].append(cell)
+        elif tag == _TR:
+            row = rows.pop()
+            line = " | ".join(row)
+            if cells:
+                # 중첩 표는 바깥 셀의 내용으로 합침
+                cells[-1].append(line)
+            elif any(row):
+                yield line
+
+        # 컨테이너의 자식 요소 처리가 끝나면 해제
+        if container is not None and depth == container_depth:
+            container.clear()
+
+@register("docx", "docx-stream")
+def extract_with_docx_stream(file_path: str) -> str:
+    """DOCX를 압축 해제하며 스트리밍으로 읽어 본문 문단, 표, 머리글/바닥글을 추출합니다.
+
+    문서 전체를 메모리에 올리는 python-docx와 달리 메모리 사용량이 문서 크기와 거의 무관합니다.
+    """
+    out = io.StringIO()
+    with zipfile.ZipFile(file_path) as zf:
+        parts = sorted(
+            (m.group(1), int(m.group(2) or 0), name)
+            for name in zf.namelist()
+            for m in [_HEADER_FOOTER.match(name)] if m
+        )
+
+        def write_parts(kind: str):
+            # 구역마다 반복되는 같은 머리글/바닥글은 한 번만 포함
+            seen = set()
+            for part_kind, _, name in parts:
+                if part_kind != kind:
+                    continue
+                with zf.open(name) as stream:
+                    text = "\n".join(iter_part_lines(stream))
+                if text and text not in seen:
+                    seen.add(text)
+                    out.write(text)
+                    out.write("\n")
+
+        write_parts("header")
+        with zf.open("word/document.xml") as stream:
+            for line in iter_part_lines(stream):
+                out.write(line)
+                out.write("\n")
+        write_parts("footer")
+    return out.getvalue()
+
+@register("docx", "python-docx", available=lambda: importlib.util.find_spec("docx") is not None)
+def extract_with_python_docx(file_path: str) -> str:
+    """python-docx로 본문 문단을 추출합니다."""
+    import docx  # 무거운 의존성은 사용 시점에 임포트
+
+    doc = docx.Document(file_path)
+    checkpoint()
+    return "\n".join(paragraph.text for paragraph in doc.paragraphs)
+
+@register("doc", "antiword", available=command_available("antiword"))
+def extract_with_antiword(file_path: str) -> str:
+    """antiword로 DOC(Word 97-2003) 파일의 텍스트를 추출합니다."""
+    return run_command(["antiword", "-m", "UTF-8.txt", file_path])
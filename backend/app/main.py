@@ -2,13 +2,12 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
-from app.api import jobs
-from app.core.database import Base, SessionLocal, get_db
+from contextlib import asynccontextmanager
+from app.api import jobs, admin
+from app.core.database import dispose_engine
+from app.core.redis_client import close_redis
 import logging
 import time
-import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
 # 로깅 설정
 logging.basicConfig(
@@ -17,20 +16,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# 테스트 환경과 일반 환경의 DB 연결 분리
-if os.environ.get("TESTING", "0") == "1":
-    from app.core.test_config import test_settings
-    DATABASE_URL = test_settings.DATABASE_URL
-else:
-    from app.core.config import settings
-    DATABASE_URL = settings.DATABASE_URL
-
-# 데이터베이스 엔진 생성
-engine = create_engine(DATABASE_URL)
-
-# 테스트 환경이 아닐 때만 테이블 생성
-if os.environ.get("TESTING", "0") != "1":
-    Base.metadata.create_all(bind=engine)
+# DB 엔진과 Redis 연결 풀은 첫 사용 시 생성되며, 스키마는 alembic 마이그레이션으로 관리
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await jobs.job_events.close()
+    dispose_engine()
+    close_redis()
 
 app = FastAPI(
     title="Document Processing API",
@@ -48,7 +40,8 @@ app = FastAPI(
     """,
     version="1.0.0",
     docs_url=None,  # 기본 Swagger UI 비활성화
-    redoc_url=None  # 기본 ReDoc UI 비활성화
+    redoc_url=None,  # 기본 ReDoc UI 비활성화
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -104,4 +97,5 @@ async def custom_swagger_ui_html():
     )
 
 # 라우터 등록 (prefix 제거)
-app.include_router(jobs.router, tags=["jobs"]) 
\ No newline at end of file
+app.include_router(jobs.router, tags=["jobs"])
+app.include_router(admin.router, tags=["admin"]) 
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Enum, JSON, ForeignKey
 from sqlalchemy.sql import func
 from datetime import datetime
 import enum
@@ -9,6 +9,8 @@ class JobStatus(str, enum.Enum):
     PROCESSING = "processing"
     COMPLETED = "completed"
     FAILED = "failed"
+    CANCELLED = "cancelled"
+    SKIPPED = "skipped"  # 마감 시각이 지났거나 클라이언트가 떠나 처리하지 않은 작업
 
 class Job(Base):
     __tablename__ = "jobs"
@@ -17,4 +19,5 @@ class Job(Base):
     status = Column(Enum(JobStatus), default=JobStatus.PENDING)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    result = Column(JSON, nullable=True) 
\ No newline at end of file
+    result = Column(JSON, nullable=True)
+    parent_job_id = Column(String, ForeignKey("jobs.id"), nullable=True, index=True)  # 이전 버전 문서의 작업 
\ No newline at end of file
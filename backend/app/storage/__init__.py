@@ -0,0 +1,16 @@
+from typing import Optional
+from app.core.config import settings
+from app.storage.base import BlobInfo, BlobNotFound, BlobStore, StoredBlob
+from app.storage.local import LocalBlobStore
+from app.storage.refs import acquire_blob, release_blob
+
+_store: Optional[BlobStore] = None
+
+def get_blob_store() -> BlobStore:
+    """설정된 업로드 파일 저장소를 반환합니다."""
+    global _store
+    if _store is None:
+        if settings.BLOB_STORE_BACKEND != "local":
+            raise ValueError(f"Unknown blob store backend: {settings.BLOB_STORE_BACKEND}")
+        _store = LocalBlobStore(settings.BLOB_STORE_DIR)
+    return _store
@@ -0,0 +1,62 @@
+import contextlib
+import mmap
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator
+
+_DIGEST = re.compile(r"^[0-9a-f]{64}$")
+
+@dataclass
+class BlobInfo:
+    digest: str      # 내용의 SHA-256 (16진수)
+    size: int
+    created: bool    # False면 같은 내용의 파일이 이미 있어 재사용
+
+@dataclass
+class StoredBlob:
+    digest: str
+    size: int
+    modified_at: float  # 마지막으로 저장되거나 재사용된 시각 (epoch 초)
+
+class BlobNotFound(FileNotFoundError):
+    """저장소에 없는 파일"""
+
+def check_digest(digest: str):
+    """경로 조작을 막기 위해 SHA-256 형식만 허용합니다."""
+    if not _DIGEST.match(digest or ""):
+        raise ValueError(f"Invalid blob digest: {digest!r}")
+
+class BlobStore(ABC):
+    """내용의 SHA-256으로 파일을 저장하는 저장소 인터페이스
+
+    같은 내용은 한 번만 저장되며, 워커는 open_path/open_mmap으로 로컬 경로나 mmap을 받습니다.
+    S3 호환 저장소는 open_path에서 임시 파일로 내려받는 방식으로 구현할 수 있습니다.
+    """
+
+    @abstractmethod
+    def put(self, fileobj: BinaryIO) -> BlobInfo:
+        """파일 객체의 내용을 저장하고 다이제스트를 반환합니다."""
+
+    @abstractmethod
+    def exists(self, digest: str) -> bool:
+        ...
+
+    @abstractmethod
+    def open_path(self, digest: str) -> contextlib.AbstractContextManager:
+        """블록 안에서 유효한 로컬 파일 경로를 제공하는 컨텍스트 매니저를 반환합니다."""
+
+    @abstractmethod
+    def delete(self, digest: str) -> int:
+        """파일을 삭제하고 해제한 바이트 수를 반환합니다 (없으면 0)."""
+
+    @abstractmethod
+    def iter_blobs(self) -> Iterator[StoredBlob]:
+        """저장된 모든 파일을 나열합니다."""
+
+    @contextlib.contextmanager
+    def open_mmap(self, digest: str):
+        """파일을 읽기 전용 mmap으로 엽니다."""
+        with self.open_path(digest) as path, open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
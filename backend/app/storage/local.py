@@ -0,0 +1,85 @@
+import contextlib
+import hashlib
+import logging
+import os
+import tempfile
+from typing import BinaryIO, Iterator
+from app.storage.base import BlobInfo, BlobNotFound, BlobStore, StoredBlob, check_digest
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 1 << 20
+
+class LocalBlobStore(BlobStore):
+    """공유 볼륨의 디렉토리에 {root}/{앞 2자리}/{sha256} 형태로 저장하는 저장소"""
+
+    def __init__(self, root: str):
+        self.root = root
+        self.tmp_dir = os.path.join(root, "tmp")
+
+    def path_for(self, digest: str) -> str:
+        check_digest(digest)
+        return os.path.join(self.root, digest[:2], digest)
+
+    def put(self, fileobj: BinaryIO) -> BlobInfo:
+        os.makedirs(self.tmp_dir, exist_ok=True)
+        sha256 = hashlib.sha256()
+        size = 0
+        # 해시를 계산하며 임시 파일에 쓴 뒤 최종 경로로 원자적으로 이동
+        fd, tmp_path = tempfile.mkstemp(dir=self.tmp_dir)
+        try:
+            with os.fdopen(fd, "wb") as out:
+                while True:
+                    chunk = fileobj.read(_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    sha256.update(chunk)
+                    out.write(chunk)
+                    size += len(chunk)
+
+            digest = sha256.hexdigest()
+            final_path = self.path_for(digest)
+            if os.path.exists(final_path):
+                # 보관 기간 계산을 위해 재사용 시각 갱신
+                os.utime(final_path)
+                return BlobInfo(digest=digest, size=size, created=False)
+
+            os.makedirs(os.path.dirname(final_path), exist_ok=True)
+            os.chmod(tmp_path, 0o444)
+            os.replace(tmp_path, final_path)
+            return BlobInfo(digest=digest, size=size, created=True)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def exists(self, digest: str) -> bool:
+        return os.path.exists(self.path_for(digest))
+
+    @contextlib.contextmanager
+    def open_path(self, digest: str):
+        path = self.path_for(digest)
+        if not os.path.exists(path):
+            raise BlobNotFound(f"Blob not found: {digest}")
+        yield path
+
+    def delete(self, digest: str) -> int:
+        path = self.path_for(digest)
+        try:
+            size = os.path.getsize(path)
+            os.unlink(path)
+            return size
+        except FileNotFoundError:
+            return 0
+
+    def iter_blobs(self) -> Iterator[StoredBlob]:
+        if not os.path.isdir(self.root):
+            return
+        for prefix in sorted(os.listdir(self.root)):
+            directory = os.path.join(self.root, prefix)
+            if len(prefix) != 2 or not os.path.isdir(directory):
+                continue
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith(prefix) and len(entry.name) == 64:
+                        stat = entry.stat()
+                        yield StoredBlob(digest=entry.name, size=stat.st_size, modified_at=stat.st_mtime)
@@ -0,0 +1,27 @@
+import time
+
+# 파일을 참조하는 미완료 작업 ID 집합
+BLOB_REFS_KEY = "blob:{digest}:refs"
+# 파일 메타데이터 (size, last_released_at)
+BLOB_META_KEY = "blob:{digest}"
+
+def acquire_blob(redis, digest: str, job_id: str, size: int):
+    """작업이 파일을 참조한다고 기록합니다. 참조가 남아 있는 파일은 정리되지 않습니다."""
+    pipe = redis.pipeline()
+    pipe.sadd(BLOB_REFS_KEY.format(digest=digest), job_id)
+    pipe.hset(BLOB_META_KEY.format(digest=digest), "size", size)
+    pipe.execute()
+
+def release_blob(redis, digest: str, job_id: str):
+    """작업이 끝나 파일 참조를 해제합니다. 보관 기간은 마지막 해제 시각부터 계산합니다."""
+    pipe = redis.pipeline()
+    pipe.srem(BLOB_REFS_KEY.format(digest=digest), job_id)
+    pipe.hset(BLOB_META_KEY.format(digest=digest), "last_released_at", time.time())
+    pipe.execute()
+
+def get_blob_refs(redis, digest: str) -> set:
+    return redis.smembers(BLOB_REFS_KEY.format(digest=digest))
+
+def forget_blob(redis, digest: str):
+    """삭제한 파일의 참조 정보를 지웁니다."""
+    redis.delete(BLOB_REFS_KEY.format(digest=digest), BLOB_META_KEY.format(digest=digest))
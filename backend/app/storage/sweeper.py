@@ -0,0 +1,90 @@
+"""보관 기간이 지난 업로드 파일을 정리합니다.
+
+celery beat가 BLOB_SWEEP_INTERVAL마다 app.tasks.maintenance.sweep_blobs로 실행하며, 직접 실행할 수도 있습니다.
+
+사용 예:
+    python -m app.storage.sweeper --dry-run
+    python -m app.storage.sweeper --retention 0       # 참조가 없는 파일을 바로 삭제
+"""
+import argparse
+import json
+import logging
+import time
+from typing import Optional
+from app.core.dead_letters import DEAD_LETTER_KEY, holder_job_id
+from app.models.job import JobStatus
+from app.storage.base import BlobStore
+from app.storage.refs import BLOB_META_KEY, forget_blob, get_blob_refs, release_blob
+
+logger = logging.getLogger(__name__)
+
+# 파일 참조를 해제해도 되는 작업 상태
+_FINISHED_STATUSES = {JobStatus.COMPLETED.value, JobStatus.FAILED.value, JobStatus.CANCELLED.value}
+
+def _live_refs(redis, digest: str) -> list:
+    """참조 중 아직 끝나지 않은 작업과 남아 있는 dead-letter만 남기고, 나머지 참조(해제 누락, 만료된 기록)는 정리합니다."""
+    job_ids = sorted(get_blob_refs(redis, digest))
+    if not job_ids:
+        return []
+    pipe = redis.pipeline()
+    for job_id in job_ids:
+        failed_job_id = holder_job_id(job_id)
+        if failed_job_id:
+            pipe.hget(DEAD_LETTER_KEY.format(job_id=failed_job_id), "job_id")
+        else:
+            pipe.hget(f"job:{job_id}", "status")
+    live = []
+    for job_id, status in zip(job_ids, pipe.execute()):
+        if status in _FINISHED_STATUSES or (status is None and holder_job_id(job_id)):
+            release_blob(redis, digest, job_id)
+        else:
+            live.append(job_id)
+    return live
+
+def sweep(store: BlobStore, redis, retention: float, dry_run: bool = False, now: Optional[float] = None) -> dict:
+    """미완료 작업이 참조하지 않고 보관 기간이 지난 파일을 삭제합니다.
+
+    보관 기간은 마지막 참조 해제 시각과 마지막 업로드 시각 중 늦은 쪽부터 계산하므로,
+    방금 같은 내용이 다시 업로드된 파일은 참조가 기록되기 전이라도 삭제되지 않습니다.
+    """
+    now = time.time() if now is None else now
+    stats = {"scanned": 0, "referenced": 0, "retained": 0, "deleted": 0, "bytesFreed": 0}
+
+    for blob in store.iter_blobs():
+        stats["scanned"] += 1
+        if _live_refs(redis, blob.digest):
+            stats["referenced"] += 1
+            continue
+
+        released_at = float(redis.hget(BLOB_META_KEY.format(digest=blob.digest), "last_released_at") or 0)
+        if now - max(released_at, blob.modified_at) < retention:
+            stats["retained"] += 1
+            continue
+
+        if not dry_run:
+            # 확인 직후 새 작업이 참조를 추가했으면 삭제하지 않음
+            if get_blob_refs(redis, blob.digest):
+                stats["referenced"] += 1
+                continue
+            stats["bytesFreed"] += store.delete(blob.digest)
+            forget_blob(redis, blob.digest)
+        stats["deleted"] += 1
+        logger.info(f"{'Would delete' if dry_run else 'Deleted'} blob {blob.digest} ({blob.size} bytes)")
+
+    return stats
+
+def main():
+    from app.core.config import settings
+    from app.core.redis_client import get_redis
+    from app.storage import get_blob_store
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--retention", type=float, default=settings.BLOB_RETENTION_SECONDS, help="보관 기간 (초)")
+    parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상만 출력")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    print(json.dumps(sweep(get_blob_store(), get_redis(), args.retention, args.dry_run), indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Literal, Type
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from app.core.retry import PermanentError
+
+class AgentOutputError(PermanentError):
+    """에이전트 단계의 출력이 스키마와 맞지 않는 경우"""
+
+    def __init__(self, stage: str, message: str):
+        super().__init__(f"{stage} 단계 출력 형식 오류: {message}")
+        self.stage = stage
+
+class SummaryOutput(BaseModel):
+    """요약 에이전트의 출력 형식"""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    topic: str = Field(min_length=1)
+    purpose: str = ""
+    key_points: List[str] = Field(min_length=1)
+
+    def render(self) -> str:
+        """기존 응답과 같은 텍스트 요약으로 변환합니다."""
+        lines = [f"[주제] {self.topic}"]
+        if self.purpose:
+            lines.append(f"[목적] {self.purpose}")
+        lines.append("[주요 내용]")
+        lines.extend(f"{i}. {point}" for i, point in enumerate(self.key_points, 1))
+        return "\n".join(lines)
+
+class ChecklistItem(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    text: str = Field(min_length=1)
+    priority: Literal["high", "medium", "low"]
+    category: str = ""
+
+class ChecklistOutput(BaseModel):
+    """체크리스트 에이전트의 출력 형식"""
+    items: List[ChecklistItem] = Field(min_length=1)
+
+class BatchDocument(BaseModel):
+    """묶음 처리 에이전트가 문서마다 반환하는 결과"""
+    id: str
+    summary: SummaryOutput
+    checklist: ChecklistOutput
+
+class SectionSummary(BaseModel):
+    """섹션 요약 에이전트가 섹션마다 반환하는 요약"""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    id: str
+    summary: str = Field(min_length=1)
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    app: str             # 이 단계만 실행하는 에이전트 앱
+    author: str          # 파이프라인 이벤트의 작성자
+    output_key: str      # 결과가 저장되는 세션 상태 키
+    schema: Type[BaseModel]
+
+# 실행 순서대로 (체크리스트 단계는 요약 결과를 참고)
+STAGES = (
+    Stage("summary", "guideline_summary", "summary_agent", "summary", SummaryOutput),
+    Stage("checklist", "guideline_checklist", "checklist_agent", "checklist", ChecklistOutput),
+)
+SUMMARY_STAGE, CHECKLIST_STAGE = STAGES
+# 병렬 파이프라인 뒤에 체크리스트를 요약과 대조해 보정하는 단계 (선택)
+RECONCILE_STAGE = Stage("reconcile", "guideline_reconcile", "reconcile_agent", "checklist", ChecklistOutput)
+
+# 여러 문서를 한 번에 요약하고 체크리스트를 만드는 묶음 처리 앱
+BATCH_APP = "guideline_batch"
+BATCH_AUTHOR = "batch_agent"
+BATCH_OUTPUT_KEY = "documents"
+
+# 섹션별로 요약하는 앱 (새 버전 문서의 바뀐 섹션만 요약)
+SECTIONS_APP = "guideline_sections"
+SECTIONS_AUTHOR = "sections_agent"
+SECTIONS_OUTPUT_KEY = "sections"
+
+_CODE_FENCE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+def _load_json(stage_name: str, value: Any) -> Any:
+    if value is None or value == "":
+        raise AgentOutputError(stage_name, "출력이 없습니다.")
+    try:
+        if isinstance(value, str):
+            return json.loads(_CODE_FENCE.sub("", value.strip()))
+        return value
+    except ValueError as e:
+        raise AgentOutputError(stage_name, f"JSON이 아닙니다 ({str(e)})")
+
+def decode_stage_output(stage: Stage, value: Any) -> BaseModel:
+    """단계 출력(JSON 문자열 또는 객체)을 스키마로 검증해 반환합니다."""
+    value = _load_json(stage.name, value)
+    try:
+        return stage.schema.model_validate(value)
+    except ValidationError as e:
+        error = e.errors()[0]
+        location = ".".join(str(part) for part in error["loc"]) or "(root)"
+        raise AgentOutputError(stage.name, f"{location}: {error['msg']}")
+
+def _decode_items(stage_name: str, value: Any, key: str, schema: Type[BaseModel]) -> Dict[str, Any]:
+    # 항목별로 검증해 형식이 잘못된 항목만 결과에서 뺌
+    value = _load_json(stage_name, value)
+    items = value.get(key) if isinstance(value, dict) else value
+    if not isinstance(items, list):
+        raise AgentOutputError(stage_name, f"{key} 배열이 없습니다.")
+
+    decoded = {}
+    for item in items:
+        try:
+            item = schema.model_validate(item)
+        except ValidationError:
+            continue
+        decoded.setdefault(item.id, item)
+    return decoded
+
+def decode_batch_output(value: Any) -> Dict[str, BatchDocument]:
+    """묶음 처리 출력을 문서 ID별 결과로 변환합니다. 형식이 잘못된 문서는 결과에서 빠집니다."""
+    return _decode_items("batch", value, BATCH_OUTPUT_KEY, BatchDocument)
+
+def decode_sections_output(value: Any) -> Dict[str, str]:
+    """섹션 요약 출력을 섹션 ID별 요약으로 변환합니다. 형식이 잘못된 섹션은 결과에서 빠집니다."""
+    return {
+        section_id: section.summary
+        for section_id, section in _decode_items("sections", value, SECTIONS_OUTPUT_KEY, SectionSummary).items()
+    }
@@ -0,0 +1,97 @@
+from app.core.celery_app import celery_app, job_lane
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.redis_client import redis_client
+from app.core import dead_letters, metrics
+from app.core.circuit_breaker import CLOSED
+from app.core.estimates import mark_enqueued
+from app.models.job import Job, JobStatus
+from app.storage import acquire_blob, get_blob_store, release_blob
+from app.storage.refs import BLOB_META_KEY
+from app.storage.sweeper import sweep
+from app.tasks.process_guideline import get_agent_breaker
+from typing import Optional
+import logging
+import math
+import os
+import uuid
+
+logger = logging.getLogger(__name__)
+
+@celery_app.task(name="app.tasks.maintenance.sweep_blobs", ignore_result=True)
+def sweep_blobs():
+    """보관 기간이 지난 업로드 파일을 정리하는 주기 작업"""
+    stats = sweep(get_blob_store(), redis_client, settings.BLOB_RETENTION_SECONDS)
+    logger.info(f"Blob sweep finished: {stats}")
+    try:
+        metrics.incr_counter(redis_client, "blobs_deleted", stats["deleted"])
+        metrics.incr_counter(redis_client, "blob_bytes_freed", stats["bytesFreed"])
+    except Exception as e:
+        logger.warning(f"Failed to record blob sweep metrics: {str(e)}")
+    return stats
+
+def replay_dead_letter(entry: dict) -> Optional[str]:
+    """실패한 작업을 같은 파일과 옵션으로 새 작업으로 등록하고 새 작업 ID를 반환합니다.
+
+    업로드 파일이 이미 정리되었으면 등록하지 않고 None을 반환합니다.
+    """
+    digest = entry["blob"]
+    job_id = str(uuid.uuid4())
+    if not digest:
+        dead_letters.mark_replay_failed(redis_client, entry["jobId"], "No uploaded file")
+        return None
+    # 참조를 먼저 기록해 확인 직후 파일이 정리되지 않도록 함
+    size = int(redis_client.hget(BLOB_META_KEY.format(digest=digest), "size") or 0)
+    acquire_blob(redis_client, digest, job_id, size)
+    if not get_blob_store().exists(digest):
+        release_blob(redis_client, digest, job_id)
+        dead_letters.mark_replay_failed(redis_client, entry["jobId"], "Uploaded file no longer available")
+        return None
+
+    with SessionLocal() as db:
+        db.add(Job(id=job_id, status=JobStatus.PENDING, parent_job_id=entry["parentJobId"]))
+        db.commit()
+    redis_client.hset(f"job:{job_id}", mapping={
+        "blob": digest,
+        "replay_of": entry["jobId"],
+        **({"parent_job_id": entry["parentJobId"]} if entry["parentJobId"] else {})
+    })
+    # 재처리 작업은 기다리는 클라이언트가 없으므로 이탈 여부를 추적하지 않음
+    mark_enqueued(redis_client, job_id, os.path.splitext(entry["filename"])[1].lower().lstrip("."), job_lane(), size)
+    celery_app.send_task(
+        "app.tasks.stages.extract_stage" if settings.STAGED_PIPELINE else "app.tasks.process_guideline.process_guideline",
+        args=[job_id, entry["filename"]],
+        kwargs={"blob": digest, "parent_job_id": entry["parentJobId"], "pipeline": entry["pipeline"]},
+        task_id=job_id
+    )
+    dead_letters.mark_replayed(redis_client, entry["jobId"], job_id, digest)
+    return job_id
+
+@celery_app.task(name="app.tasks.maintenance.replay_dead_letters", ignore_result=True)
+def replay_dead_letters():
+    """재처리 대기열의 실패한 작업을 DLQ_REPLAY_RATE 속도로 일반 대기열에 다시 등록하는 주기 작업
+
+    에이전트 서킷 브레이커가 닫혀 있을 때만 등록해 재처리가 장애를 다시 일으키지 않도록 합니다.
+    """
+    if get_agent_breaker().state() != CLOSED:
+        logger.info("Circuit not closed, postponing dead-letter replay")
+        return
+    # 주기마다 최소 한 작업은 등록
+    count = max(math.floor(settings.DLQ_REPLAY_RATE * settings.DLQ_REPLAY_INTERVAL), 1)
+
+    replayed = 0
+    for entry in dead_letters.take_replays(redis_client, count):
+        try:
+            new_job_id = replay_dead_letter(entry)
+        except Exception as e:
+            logger.error(f"Failed to replay job {entry['jobId']}: {str(e)}")
+            dead_letters.mark_replay_failed(redis_client, entry["jobId"], str(e))
+            continue
+        if new_job_id:
+            logger.info(f"Replayed failed job {entry['jobId']} as {new_job_id}")
+            replayed += 1
+    if replayed:
+        try:
+            metrics.incr_counter(redis_client, "dead_letter_replays", replayed)
+        except Exception as e:
+            logger.warning(f"Failed to record replay metrics: {str(e)}")
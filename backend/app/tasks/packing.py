@@ -0,0 +1,151 @@
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.core.redis_client import redis_client
+from app.core import deadlines, metrics, model_tiers, packing
+from app.core.cancellation import is_cancel_requested
+from app.core.circuit_breaker import OPEN
+from app.storage import release_blob
+from app.tasks.agent_output import BATCH_APP, BATCH_AUTHOR, BATCH_OUTPUT_KEY, BatchDocument, decode_batch_output
+from app.tasks.process_guideline import (
+    agent_call,
+    create_agent_session,
+    find_agent_output,
+    get_agent_breaker,
+    handle_job_cancelled,
+    handle_job_completed,
+    index_completed_text,
+    record_metric,
+    run_agent,
+    schedule_pack,
+)
+from typing import Dict, List
+import asyncio
+import logging
+import random
+import time
+
+logger = logging.getLogger(__name__)
+
+def build_pack_message(entries: List[dict]) -> str:
+    """여러 문서를 구분자로 나눈 하나의 요청 메시지를 만듭니다. 문서 ID는 묶음 안의 순번입니다."""
+    parts = [f"문서 {len(entries)}개를 처리합니다."]
+    for i, entry in enumerate(entries, 1):
+        parts.append(f"<<<DOC {i}>>>\n{entry['text']}\n<<<END {i}>>>")
+    return "\n\n".join(parts)
+
+async def run_agent_batch(entries: List[dict]) -> Dict[str, BatchDocument]:
+    """묶음 처리 앱을 한 번 실행하고 문서 순번별 결과를 반환합니다."""
+    session_id = await create_agent_session(BATCH_APP)
+    events = await run_agent(BATCH_APP, session_id, build_pack_message(entries))
+    return decode_batch_output(find_agent_output(events, BATCH_AUTHOR, BATCH_OUTPUT_KEY))
+
+def process_alone(entry: dict):
+    """묶음에서 결과를 얻지 못한 작업을 단독 처리로 다시 등록합니다 (접수 때의 처리 옵션과 우선순위 유지)."""
+    record_metric(metrics.incr_counter, "pack_fallbacks")
+    deprioritized = entry.get("deprioritized", False)
+    celery_app.send_task(
+        "app.tasks.process_guideline.process_guideline",
+        args=[entry["job_id"], entry["filename"]],
+        kwargs={
+            "blob": entry["blob"],
+            "pack": False,
+            "profile": entry.get("profile", False),
+            "pipeline": entry.get("pipeline"),
+            "deprioritized": deprioritized
+        },
+        task_id=entry["job_id"],
+        priority=deadlines.DEPRIORITIZED_PRIORITY if deprioritized else None
+    )
+
+def finish_entry(entry: dict, document: BatchDocument):
+    result = {
+        "summary": document.summary.render(),
+        "checklist": [item.model_dump() for item in document.checklist.items]
+    }
+    handle_job_completed(entry["job_id"], entry["filename"], result, entry["started_at"])
+    index_completed_text(entry["job_id"], entry["text"])
+    if entry["blob"]:
+        record_metric(release_blob, entry["blob"], entry["job_id"])
+
+def record_pack_savings(redis, completed: int):
+    """묶음 처리로 절약한 비용을 기록합니다.
+
+    단독 처리는 작업마다 세션 1개와 LLM 호출 2번(요약, 체크리스트)이 필요하고, 묶음은 세션 1개와 호출 1번입니다.
+    """
+    pipe = redis.pipeline()
+    metrics.incr_counter(pipe, "pack_runs")
+    metrics.incr_counter(pipe, "packed_jobs", completed)
+    metrics.incr_counter(pipe, "pack_sessions_saved", completed - 1)
+    metrics.incr_counter(pipe, "pack_llm_calls_saved", 2 * completed - 1)
+    pipe.execute()
+
+@celery_app.task(bind=True, name="app.tasks.packing.process_pack", ignore_result=True)
+def process_pack(self):
+    """묶음 대기 목록의 짧은 문서들을 에이전트 한 번의 실행으로 처리하는 Celery 작업
+
+    형식이 잘못되었거나 결과에서 빠진 문서, 에이전트 오류로 처리하지 못한 묶음은 단독 처리로 다시 등록합니다.
+    """
+    breaker = get_agent_breaker()
+    if breaker.state() == OPEN:
+        delay = max(breaker.retry_after(), settings.BREAKER_GATE_INTERVAL) + random.uniform(0, settings.BREAKER_GATE_INTERVAL)
+        raise self.retry(countdown=delay, max_retries=None)
+
+    entries = packing.take_pack(redis_client)
+    if not entries:
+        return
+
+    # 남은 작업은 다음 묶음으로 예약 (목록이 가득 찼으면 바로)
+    remaining = packing.pending_count(redis_client)
+    if remaining:
+        schedule_pack(0 if remaining >= settings.PACK_MAX_DOCS else settings.PACK_MAX_WAIT)
+
+    batch = []
+    for entry in entries:
+        if is_cancel_requested(redis_client, entry["job_id"]):
+            handle_job_cancelled(entry["job_id"])
+            if entry["blob"]:
+                record_metric(release_blob, entry["blob"], entry["job_id"])
+        elif entry["text"] is None:
+            process_alone(entry)
+        else:
+            batch.append(entry)
+    if not batch:
+        return
+    # half-open 시험 요청 자리는 에이전트 요청 직전에 얻음
+    # (이미 꺼낸 작업은 목록에 되돌리지 않고 단독 처리로 넘겨 각 작업이 회로 상태에 따라 미루도록 함)
+    if not breaker.allow_request():
+        for entry in batch:
+            process_alone(entry)
+        return
+
+    # 묶음 전체 크기에 맞는 모델 티어로 처리
+    tier = model_tiers.select_tier(sum(packing.estimate_tokens(entry["text"]) for entry in batch))
+    logger.info(f"Processing pack of {len(batch)} jobs with tier {tier.name}: {[entry['job_id'] for entry in batch]}")
+    started = time.monotonic()
+    try:
+        with agent_call(breaker), model_tiers.model_tier_scope(tier) as usage:
+            documents = asyncio.get_event_loop().run_until_complete(run_agent_batch(batch))
+    except Exception as e:
+        logger.warning(f"Pack processing failed, processing {len(batch)} jobs alone: {str(e)}")
+        for entry in batch:
+            process_alone(entry)
+        return
+    record_metric(model_tiers.record_tier_usage, usage, len(batch), time.monotonic() - started)
+
+    completed = 0
+    for i, entry in enumerate(batch, 1):
+        document = documents.get(str(i))
+        if document is None:
+            logger.warning(f"No valid result for job {entry['job_id']} in pack, processing alone")
+            process_alone(entry)
+            continue
+        try:
+            record_metric(model_tiers.record_job_tier, entry["job_id"], tier)
+            finish_entry(entry, document)
+            completed += 1
+        except Exception as e:
+            logger.error(f"Failed to save packed result for job {entry['job_id']}: {str(e)}")
+            process_alone(entry)
+
+    record_metric(record_pack_savings, completed)
+    logger.info(f"Pack finished: {completed}/{len(batch)} jobs completed")
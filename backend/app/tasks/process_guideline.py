@@ -1,45 +1,81 @@
 from app.core.celery_app import celery_app
 from app.core.database import SessionLocal
+from app.core.redis_client import redis_client
 from app.models.job import Job, JobStatus
 import aiohttp
 import asyncio
+import contextlib
 import json
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 import uuid
 import logging
 import os
-import PyPDF2
-import docx
-import chardet
 from datetime import datetime
-from redis import Redis
 from app.core.config import settings
-import re
-import redis
-import requests
-import io
+from app.core.profiling import profile_job
+from app.core import dead_letters, deadlines, estimates, metrics, model_tiers, near_dup, packing
+from app.core.celery_app import AGENT_QUEUE, MAIN_QUEUE
+from app.core.cancellation import CancellationToken, JobCancelled, cancellation_scope, run_cancellable
+from app.core.job_events import publish_job_event
+from app import extractors
+from app.storage import get_blob_store, release_blob
+from app.core.circuit_breaker import CircuitBreaker, ConsumerGate
+from app.core.retry import PermanentError, TransientError, backoff_delay, is_transient
+from app.tasks.agent_output import (
+    CHECKLIST_STAGE,
+    RECONCILE_STAGE,
+    SECTIONS_APP,
+    SECTIONS_AUTHOR,
+    SECTIONS_OUTPUT_KEY,
+    STAGES,
+    SUMMARY_STAGE,
+    AgentOutputError,
+    ChecklistOutput,
+    Stage,
+    SummaryOutput,
+    decode_sections_output,
+    decode_stage_output,
+)
+from app.core.sections import Section, load_section_summaries, record_section_reuse, save_section_summaries, split_sections
+from celery.exceptions import Retry
+from celery.signals import worker_ready, worker_shutdown
+import random
+import time
 
 logger = logging.getLogger(__name__)
 
 # 에이전트 서버 URL을 설정에서 가져오기
 AGENT_SERVER_URL = settings.AGENT_API_URL
+# 요약과 체크리스트를 차례로 실행하는 파이프라인 앱
+AGENT_APP_NAME = "guideline_agent"
+# 파이프라인별 에이전트 앱 (parallel은 체크리스트가 요약을 기다리지 않고 원문으로 생성)
+PIPELINE_APPS = {
+    "sequential": AGENT_APP_NAME,
+    "parallel": "guideline_parallel",
+}
 
-# Redis 클라이언트 설정
-redis_client = redis.Redis(
-    host=os.getenv("REDIS_HOST", "redis"),
-    port=int(os.getenv("REDIS_PORT", 6379)),
-    db=int(os.getenv("REDIS_DB", 0)),
-    decode_responses=True
-)
+class AgentUnavailableError(TransientError):
+    """에이전트 서버가 일시적으로 응답할 수 없는 경우 (5xx, 429)"""
 
-# Redis 연결 테스트
-try:
-    redis_client.ping()
-except redis.ConnectionError as e:
-    logger.error(f"Failed to connect to Redis: {e}")
-    # 테스트 환경에서는 Redis 연결 실패를 무시
-    if os.environ.get("TESTING", "0") != "1":
-        raise
+class AgentRequestError(PermanentError):
+    """요청 자체가 잘못되었거나 에이전트 결과가 비어 있는 경우"""
+
+def get_agent_breaker() -> CircuitBreaker:
+    return CircuitBreaker(redis_client, "agent")
+
+async def raise_for_agent_status(response, message: str):
+    """에이전트 응답 상태 코드를 일시적/영구 오류로 분류합니다."""
+    if response.status == 200:
+        return
+    error_text = await response.text()
+    if response.status >= 500 or response.status == 429:
+        raise AgentUnavailableError(f"{message} ({response.status}): {error_text}")
+    raise AgentRequestError(f"{message} ({response.status}): {error_text}")
+
+def agent_timeout() -> aiohttp.ClientTimeout:
+    # 모델 티어를 고른 작업은 티어의 타임아웃 사용
+    usage = model_tiers.current_usage()
+    return aiohttp.ClientTimeout(total=usage.tier.timeout if usage else settings.AGENT_REQUEST_TIMEOUT)
 
 def update_job_status(job_id: str, status: JobStatus, data: dict):
     """Redis에 작업 상태를 업데이트합니다."""
@@ -49,8 +85,58 @@ def update_job_status(job_id: str, status: JobStatus, data: dict):
         "updated_at": datetime.now().isoformat()
     }
     redis_client.hset(f"job:{job_id}", mapping=redis_data)
+    try:
+        publish_job_event(redis_client, job_id, JobStatus(status).value)
+    except Exception as e:
+        logger.warning(f"Failed to publish event for job {job_id}: {str(e)}")
     logger.debug(f"Updated Redis data for job {job_id}: {redis_data}")
 
+def record_metric(func, *args):
+    """지표를 기록합니다. 기록 실패가 작업 처리에 영향을 주지 않도록 합니다."""
+    try:
+        func(redis_client, *args)
+    except Exception as e:
+        logger.warning(f"Failed to record metric {func.__name__}: {str(e)}")
+
+def record_breaker(func):
+    """서킷 브레이커에 결과를 기록합니다. Redis 장애가 작업 처리에 영향을 주지 않도록 합니다."""
+    try:
+        func()
+    except Exception as e:
+        logger.warning(f"Failed to update circuit breaker: {str(e)}")
+
+def defer_for_breaker(task, job_id: str, breaker: CircuitBreaker, started: bool = False):
+    """회로가 열려 있으면 작업을 실패로 처리하지 않고 회로가 닫힐 때까지 다시 대기열로 돌려보냅니다.
+
+    started면 이미 처리 중으로 표시한 작업을 다시 대기 상태로 되돌립니다.
+    """
+    delay = max(breaker.retry_after(), settings.BREAKER_GATE_INTERVAL) + random.uniform(0, settings.BREAKER_GATE_INTERVAL)
+    logger.info(f"Circuit open, deferring job {job_id} for {delay:.1f}s")
+    record_metric(metrics.incr_counter, "breaker_deferrals")
+    if started:
+        handle_job_deferred(job_id, delay)
+    raise task.retry(countdown=delay, max_retries=None)
+
+@contextlib.contextmanager
+def agent_call(breaker: CircuitBreaker):
+    """에이전트 요청 구간의 결과를 서킷 브레이커에 기록합니다.
+
+    half-open 시험 요청 자리(allow_request)는 이 구간 직전에 얻고, 어떻게 끝나든 여기서 반납합니다.
+    영구 오류(4xx, 출력 형식 오류)는 에이전트가 응답한 것이므로 성공으로, 일시적 오류는 실패로 기록하고,
+    취소처럼 결과를 알 수 없으면 자리만 반납합니다.
+    """
+    outcome = breaker.release_probe
+    try:
+        yield
+        outcome = breaker.record_success
+    except JobCancelled:
+        raise
+    except Exception as e:
+        outcome = breaker.record_failure if is_transient(e) else breaker.record_success
+        raise
+    finally:
+        record_breaker(outcome)
+
 def handle_job_failure(job_id: str, error: Exception):
     """작업 실패 시 DB와 Redis를 업데이트합니다."""
     # DB 업데이트
@@ -67,134 +153,531 @@ def handle_job_failure(job_id: str, error: Exception):
         "failed_at": datetime.now().isoformat()
     })
 
-def extract_text_from_file(file_path: str) -> str:
-    """파일 형식에 따라 텍스트를 추출합니다."""
-    file_ext = os.path.splitext(file_path)[1].lower()
-    
+def handle_job_completed(job_id: str, filename: str, result: dict, started_at: str):
+    """작업 완료 시 DB와 Redis에 결과를 저장합니다."""
+    with SessionLocal() as db:
+        job = db.query(Job).filter(Job.id == job_id).first()
+        if job:
+            job.status = JobStatus.COMPLETED
+            job.result = result
+            db.commit()
+
+    update_job_status(job_id, JobStatus.COMPLETED, {
+        "summary": result["summary"],
+        "checklist": json.dumps(result["checklist"], ensure_ascii=False),
+        "completed_at": datetime.now().isoformat(),
+        "started_at": started_at,
+        "filename": filename
+    })
+
+def handle_job_cancelled(job_id: str):
+    """작업 취소 시 DB와 Redis를 업데이트합니다."""
+    with SessionLocal() as db:
+        job = db.query(Job).filter(Job.id == job_id).first()
+        if job:
+            job.status = JobStatus.CANCELLED
+            db.commit()
+
+    update_job_status(job_id, JobStatus.CANCELLED, {
+        "cancelled_at": datetime.now().isoformat()
+    })
+
+def handle_job_skipped(job_id: str, reason: str):
+    """마감 시각이 지났거나 클라이언트가 떠난 작업을 처리하지 않고 건너뜀으로 표시합니다."""
+    with SessionLocal() as db:
+        job = db.query(Job).filter(Job.id == job_id).first()
+        if job:
+            job.status = JobStatus.SKIPPED
+            db.commit()
+
+    update_job_status(job_id, JobStatus.SKIPPED, {
+        "skipped_at": datetime.now().isoformat(),
+        "skip_reason": reason
+    })
+    record_metric(deadlines.record_skip, job_id, reason)
+
+def shed_stale_job(task, job_id: str, blob: Optional[str], deprioritized: bool, retry_kwargs: dict) -> Optional[dict]:
+    """대기열 맨 앞에 온 작업이 마감 시각을 넘겼거나 클라이언트가 떠났으면 처리하지 않습니다.
+
+    이탈한 작업은 JOB_ABANDON_POLICY가 deprioritize이면 한 번만 가장 낮은 우선순위로 다시 대기시키고,
+    다시 차례가 왔을 때도 이탈 상태이면 건너뜁니다. 건너뛴 작업의 결과를 반환하고, 처리할 작업이면 None을 반환합니다.
+    """
+    try:
+        reason = deadlines.shed_reason(redis_client, job_id)
+    except Exception as e:
+        # Redis 장애로 처리 자체가 중단되지 않도록 함
+        logger.warning(f"Failed to check deadline for job {job_id}: {str(e)}")
+        return None
+
+    if reason is None:
+        record_metric(deadlines.forget, job_id)
+        return None
+    if reason == deadlines.SKIP_ABANDONED and settings.JOB_ABANDON_POLICY == "deprioritize" \
+            and not deprioritized and not task.request.called_directly:
+        logger.info(f"Client left job {job_id}, deprioritizing")
+        record_metric(metrics.incr_counter, "jobs_deprioritized")
+        raise task.retry(
+            kwargs={**retry_kwargs, "deprioritized": True},
+            countdown=0,
+            priority=deadlines.DEPRIORITIZED_PRIORITY,
+            max_retries=None
+        )
+
+    logger.info(f"Skipping job {job_id}: {reason}")
+    handle_job_skipped(job_id, reason)
+    if blob:
+        record_metric(release_blob, blob, job_id)
+    return {"status": JobStatus.SKIPPED, "reason": reason}
+
+def handle_job_deferred(job_id: str, delay: float):
+    """회로가 열려 처리를 미룬 작업을 다시 대기 상태로 되돌립니다."""
+    with SessionLocal() as db:
+        job = db.query(Job).filter(Job.id == job_id).first()
+        if job:
+            job.status = JobStatus.PENDING
+            db.commit()
+
+    ready_at = time.time() + delay
+    record_metric(estimates.mark_requeued, job_id, ready_at)
+    update_job_status(job_id, JobStatus.PENDING, {
+        "next_retry_at": datetime.fromtimestamp(ready_at).isoformat()
+    })
+
+def handle_job_retry(job_id: str, error: Exception, attempt: int, delay: float):
+    """일시적 오류로 재시도를 예약한 작업을 다시 대기 상태로 되돌립니다."""
+    with SessionLocal() as db:
+        job = db.query(Job).filter(Job.id == job_id).first()
+        if job:
+            job.status = JobStatus.PENDING
+            db.commit()
+
+    ready_at = time.time() + delay
+    record_metric(estimates.mark_requeued, job_id, ready_at)
+    update_job_status(job_id, JobStatus.PENDING, {
+        "retries": attempt,
+        "last_error": str(error),
+        "next_retry_at": datetime.fromtimestamp(ready_at).isoformat()
+    })
+
+def record_extractor(redis, job_id: str, backend: str):
+    """작업에 사용한 텍스트 추출 백엔드를 기록합니다."""
+    redis.hset(f"job:{job_id}", "extractor", backend)
+
+def extract_text_from_file(file_path: str, job_id: Optional[str] = None, filename: Optional[str] = None) -> str:
+    """파일 형식에 맞는 추출 백엔드로 텍스트를 추출하고, 사용한 백엔드를 작업에 기록합니다.
+
+    저장소 경로에는 확장자가 없으므로 형식은 원본 파일명(filename)으로 정합니다.
+    """
     try:
-        if file_ext == '.pdf':
-            return extract_text_from_pdf(file_path)
-        elif file_ext in ['.doc', '.docx']:
-            return extract_text_from_doc(file_path)
-        elif file_ext == '.txt':
-            return extract_text_from_txt(file_path)
-        else:
-            raise ValueError(f"지원하지 않는 파일 형식입니다: {file_ext}")
+        extraction = extractors.extract(file_path, extractors.detect_format(file_path, filename))
     except Exception as e:
         logger.error(f"파일 텍스트 추출 실패: {str(e)}")
         raise
 
-def extract_text_from_pdf(file_path: str) -> str:
-    """PDF 파일에서 텍스트를 추출합니다."""
-    text = ""
-    with open(file_path, 'rb') as file:
-        pdf_reader = PyPDF2.PdfReader(file)
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-    return text.strip()
-
-def extract_text_from_doc(file_path: str) -> str:
-    """DOC/DOCX 파일에서 텍스트를 추출합니다."""
-    doc = docx.Document(file_path)
-    text = ""
-    for paragraph in doc.paragraphs:
-        text += paragraph.text + "\n"
-    return text.strip()
-
-def extract_text_from_txt(file_path: str) -> str:
-    """TXT 파일에서 텍스트를 추출합니다."""
-    with open(file_path, 'rb') as file:
-        raw_data = file.read()
-        detected = chardet.detect(raw_data)
-        encoding = detected['encoding']
-    
-    with open(file_path, 'r', encoding=encoding) as file:
-        return file.read().strip()
+    logger.info(f"Extracted {len(extraction.text)} chars from {file_path} with {extraction.backend}")
+    if job_id:
+        record_metric(record_extractor, job_id, extraction.backend)
+    return extraction.text
 
-async def create_agent_session() -> str:
+def record_near_duplicate(redis, job_id: str, duplicate: near_dup.NearDuplicate):
+    """작업이 어떤 완료 작업과 유사한지 기록합니다."""
+    redis.hset(f"job:{job_id}", mapping={
+        "near_duplicate_of": duplicate.job_id,
+        "near_duplicate_similarity": round(duplicate.similarity, 3)
+    })
+
+def check_near_duplicate(job_id: str, text: str) -> Tuple[Optional[List[int]], Optional[near_dup.NearDuplicate]]:
+    """유사 문서 감지가 켜져 있으면 서명을 계산하고, 색인에서 가장 유사한 완료 작업을 찾아 기록합니다."""
+    if settings.NEAR_DUP_POLICY == "off":
+        return None, None
+    signature = near_dup.compute_signature(text)
+    if signature is None:
+        return None, None
+    try:
+        duplicate = near_dup.find_near_duplicate(redis_client, signature, settings.NEAR_DUP_THRESHOLD, exclude=job_id)
+    except Exception as e:
+        logger.warning(f"Failed to look up near duplicates for job {job_id}: {str(e)}")
+        return signature, None
+
+    if duplicate:
+        logger.info(f"Job {job_id} is a near duplicate of {duplicate.job_id} (similarity {duplicate.similarity:.3f})")
+        record_metric(metrics.incr_counter, "near_dup_matches")
+        record_metric(record_near_duplicate, job_id, duplicate)
+    return signature, duplicate
+
+def reuse_near_duplicate(duplicate: Optional[near_dup.NearDuplicate]) -> Optional[dict]:
+    """reuse 정책이면 유사한 완료 작업의 결과를 반환합니다. 결과를 찾을 수 없으면 None입니다."""
+    if duplicate is None or settings.NEAR_DUP_POLICY != "reuse":
+        return None
+    with SessionLocal() as db:
+        job = db.query(Job).filter(Job.id == duplicate.job_id).first()
+        if not job or job.status != JobStatus.COMPLETED or not isinstance(job.result, dict):
+            return None
+        record_metric(metrics.incr_counter, "near_dup_reused")
+        return job.result
+
+def index_completed_text(job_id: str, text: str):
+    """완료된 작업의 텍스트를 유사 문서 색인에 추가합니다."""
+    if settings.NEAR_DUP_POLICY == "off":
+        return
+    signature = near_dup.compute_signature(text)
+    if signature:
+        record_metric(near_dup.index_document, job_id, signature)
+
+def should_pack(text: str, pack: bool, parent_job_id: Optional[str], pipeline: Optional[str]) -> bool:
+    """묶음 처리할 작업인지 판단합니다.
+
+    새 버전 작업과 파이프라인을 직접 지정한 작업은 묶음 앱(guideline_batch)으로 처리하면
+    요청한 처리 방식이 사라지므로 묶지 않습니다.
+    """
+    return pack and not parent_job_id and pipeline is None and packing.is_packable(text)
+
+def schedule_pack(countdown: float = 0):
+    """묶음 처리 작업을 예약합니다."""
+    celery_app.send_task("app.tasks.packing.process_pack", countdown=countdown)
+
+def enqueue_for_pack(
+    job_id: str,
+    filename: str,
+    blob: Optional[str],
+    started_at: str,
+    text: str,
+    profile: bool = False,
+    pipeline: Optional[str] = None,
+    deprioritized: bool = False
+) -> bool:
+    """작업을 묶음 대기 목록에 넣습니다. 실패하면 False를 반환하고 작업은 단독으로 처리합니다.
+
+    목록의 첫 작업은 PACK_MAX_WAIT 뒤 묶음 처리를 예약하고, 목록이 PACK_MAX_DOCS만큼 차면 바로 처리합니다.
+    profile, pipeline, deprioritized는 묶음에서 빠져 단독으로 다시 처리할 때 그대로 넘깁니다.
+    """
+    entry = {
+        "job_id": job_id,
+        "filename": filename,
+        "blob": blob,
+        "started_at": started_at,
+        "profile": profile,
+        "pipeline": pipeline,
+        "deprioritized": deprioritized
+    }
+    try:
+        length = packing.add_to_pack(redis_client, entry, text)
+    except Exception as e:
+        logger.warning(f"Failed to enqueue job {job_id} for packing, processing alone: {str(e)}")
+        return False
+
+    logger.info(f"Job {job_id} queued for packed processing ({length} waiting)")
+    try:
+        if length % settings.PACK_MAX_DOCS == 0:
+            schedule_pack()
+        elif length == 1:
+            schedule_pack(settings.PACK_MAX_WAIT)
+    except Exception as e:
+        # 이미 목록에 들어간 작업은 다음 묶음 처리 때 함께 처리됨
+        logger.warning(f"Failed to schedule pack processing: {str(e)}")
+    return True
+
+@contextlib.contextmanager
+def open_upload(filename: str, blob: Optional[str] = None):
+    """업로드 파일의 로컬 경로를 제공합니다. 저장소 도입 전에 접수된 작업은 UPLOAD_DIR의 파일을 사용합니다."""
+    if blob:
+        with get_blob_store().open_path(blob) as path:
+            yield path
+        return
+    path = os.path.join(settings.UPLOAD_DIR, filename)
+    if not os.path.exists(path):
+        raise FileNotFoundError("File not found")
+    yield path
+
+async def create_agent_session(app_name: str = AGENT_APP_NAME, state: Optional[dict] = None) -> str:
     """에이전트 서버에 세션을 생성합니다."""
     session_id = str(uuid.uuid4())
     user_id = "u_123"  # 임시 사용자 ID
     
     logger.info(f"Creating agent session with ID: {session_id}")
+    # 에이전트가 세션 상태의 모델로 요청하도록 작업의 모델 티어를 전달
+    usage = model_tiers.current_usage()
+    if usage and usage.tier.model:
+        state = {**(state or {}), model_tiers.MODEL_STATE_KEY: usage.tier.model}
     try:
-        async with aiohttp.ClientSession() as session:
-            url = f"{AGENT_SERVER_URL}/apps/guideline_agent/users/{user_id}/sessions/{session_id}"
-            async with session.post(url, json={"state": {}}) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(f"에이전트 세션 생성 실패: {error_text}")
+        async with aiohttp.ClientSession(timeout=agent_timeout()) as session:
+            url = f"{AGENT_SERVER_URL}/apps/{app_name}/users/{user_id}/sessions/{session_id}"
+            async with session.post(url, json={"state": state or {}}) as response:
+                await raise_for_agent_status(response, "에이전트 세션 생성 실패")
                 return session_id
     except Exception as e:
         logger.error(f"Error creating agent session: {str(e)}")
         raise
 
-async def process_with_agent(session_id: str, content: str) -> Dict[str, Any]:
-    """에이전트를 통해 문서를 처리합니다."""
+def resolve_pipeline(pipeline: Optional[str]) -> str:
+    """작업에 지정된 파이프라인, 없으면 AGENT_PIPELINE 설정을 반환합니다."""
+    pipeline = pipeline or settings.AGENT_PIPELINE
+    if pipeline not in PIPELINE_APPS:
+        logger.warning(f"Unknown agent pipeline {pipeline}, using sequential")
+        return "sequential"
+    return pipeline
+
+async def run_agent_pipeline(content: str, pipeline: Optional[str] = None) -> Dict[str, Any]:
+    """에이전트 세션을 만들고 문서를 처리합니다."""
+    pipeline = resolve_pipeline(pipeline)
+    app_name = PIPELINE_APPS[pipeline]
+    session_id = await create_agent_session(app_name)
+    reconcile = pipeline == "parallel" and settings.AGENT_RECONCILE
+    return await process_with_agent(session_id, content, app_name, reconcile)
+
+async def run_agent(app_name: str, session_id: str, content: str) -> List[dict]:
+    """에이전트 앱을 실행하고 이벤트 목록을 반환합니다."""
     user_id = "u_123"  # 임시 사용자 ID
     
-    try:
-        async with aiohttp.ClientSession() as session:
-            url = f"{AGENT_SERVER_URL}/run"
-            async with session.post(
-                url,
-                json={
-                    "appName": "guideline_agent",
-                    "userId": user_id,
-                    "sessionId": session_id,
-                    "newMessage": {
-                        "role": "user",
-                        "parts": [{"text": content}]
-                    }
-                }
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(f"에이전트 처리 실패: {error_text}")
-                
-                events = await response.json()
-                if not events:
-                    raise Exception("에이전트 응답이 없습니다.")
-                
-                summary = ""
-                checklist = []
-                
-                for event in events:
-                    if not event.get("actions") or not event["actions"].get("stateDelta"):
-                        continue
-                    
-                    state_delta = event["actions"]["stateDelta"]
-                    author = event.get("author", "")
-                    
-                    if author == "summary_agent" and "summary" in state_delta:
-                        summary = state_delta["summary"]
-                    elif author == "checklist_agent" and "checklist" in state_delta:
-                        checklist_text = state_delta["checklist"]
-                        checklist_items = [
-                            re.sub(r'^\d+\.\s*', '', line.strip())
-                            for line in checklist_text.split('\n')
-                            if line.strip() and not line.strip().startswith('[') and not line.strip().endswith(']')
-                        ]
-                        checklist = [item for item in checklist_items if item]
-                
-                if not summary and not checklist:
-                    raise Exception("요약과 체크리스트가 모두 비어있습니다.")
-                
-                return {
-                    "summary": summary,
-                    "checklist": checklist
+    async with aiohttp.ClientSession(timeout=agent_timeout()) as session:
+        url = f"{AGENT_SERVER_URL}/run"
+        async with session.post(
+            url,
+            json={
+                "appName": app_name,
+                "userId": user_id,
+                "sessionId": session_id,
+                "newMessage": {
+                    "role": "user",
+                    "parts": [{"text": content}]
                 }
+            }
+        ) as response:
+            await raise_for_agent_status(response, "에이전트 처리 실패")
+            
+            events = await response.json()
+            if not events:
+                raise AgentRequestError("에이전트 응답이 없습니다.")
+            model_tiers.note_usage(events)
+            return events
+
+def collect_stage_outputs(events: List[dict]) -> Dict[str, Any]:
+    """이벤트의 상태 변경에서 단계별 출력을 모읍니다."""
+    outputs = {}
+    for event in events:
+        if not event.get("actions") or not event["actions"].get("stateDelta"):
+            continue
+        
+        state_delta = event["actions"]["stateDelta"]
+        author = event.get("author", "")
+        for stage in STAGES:
+            if author == stage.author and stage.output_key in state_delta:
+                outputs[stage.name] = state_delta[stage.output_key]
+    return outputs
+
+def find_agent_output(events: List[dict], author: str, key: str) -> Any:
+    """이벤트의 상태 변경에서 작성자가 저장한 출력을 찾습니다."""
+    output = None
+    for event in events:
+        state_delta = (event.get("actions") or {}).get("stateDelta") or {}
+        if event.get("author") == author and key in state_delta:
+            output = state_delta[key]
+    return output
+
+async def run_stage(stage: Stage, content: str, state: dict):
+    """한 단계만 실행하는 앱으로 단계를 다시 실행하고 출력을 검증합니다."""
+    session_id = await create_agent_session(stage.app, state)
+    events = await run_agent(stage.app, session_id, content)
+    return decode_stage_output(stage, find_agent_output(events, stage.author, stage.output_key))
+
+async def retry_stage(stage: Stage, content: str, state: dict, error: AgentOutputError):
+    """출력 형식이 잘못된 단계만 AGENT_STAGE_MAX_ATTEMPTS번까지 다시 실행합니다."""
+    for attempt in range(2, settings.AGENT_STAGE_MAX_ATTEMPTS + 1):
+        logger.warning(f"{str(error)} (retrying stage, attempt {attempt})")
+        record_metric(metrics.incr_counter, f"agent_stage_retries:{stage.name}")
+        try:
+            return await run_stage(stage, content, state)
+        except AgentOutputError as e:
+            error = e
+    raise error
+
+async def run_stage_with_retries(stage: Stage, content: str, state: dict):
+    """단계 하나를 실행하고, 출력 형식이 잘못되면 그 단계만 다시 실행합니다."""
+    try:
+        return await run_stage(stage, content, state)
+    except AgentOutputError as e:
+        return await retry_stage(stage, content, state, e)
+
+def build_sections_message(sections: List[Section]) -> str:
+    """섹션들을 구분자로 나눈 하나의 요청 메시지를 만듭니다. 섹션 ID는 요청 안의 순번입니다."""
+    parts = [f"섹션 {len(sections)}개를 요약합니다."]
+    for i, section in enumerate(sections, 1):
+        body = f"{section.title}\n{section.text}" if section.title else section.text
+        parts.append(f"<<<SECTION {i}>>>\n{body}\n<<<END {i}>>>")
+    return "\n\n".join(parts)
+
+async def summarize_sections(sections: List[Section]) -> Dict[str, str]:
+    """섹션들을 한 번의 실행으로 요약해 섹션 해시별 요약을 반환합니다.
+
+    요약이 빠지거나 형식이 잘못된 섹션만 AGENT_STAGE_MAX_ATTEMPTS번까지 다시 요청합니다.
+    """
+    summaries = {}
+    pending = sections
+    for attempt in range(1, settings.AGENT_STAGE_MAX_ATTEMPTS + 1):
+        if attempt > 1:
+            logger.warning(f"{len(pending)} sections missing from summary output (retrying, attempt {attempt})")
+            record_metric(metrics.incr_counter, "agent_stage_retries:sections")
+        session_id = await create_agent_session(SECTIONS_APP)
+        events = await run_agent(SECTIONS_APP, session_id, build_sections_message(pending))
+        try:
+            decoded = decode_sections_output(find_agent_output(events, SECTIONS_AUTHOR, SECTIONS_OUTPUT_KEY))
+        except AgentOutputError as e:
+            logger.warning(str(e))
+            decoded = {}
+        for i, section in enumerate(pending, 1):
+            if str(i) in decoded:
+                summaries[section.digest] = decoded[str(i)]
+        pending = [section for section in pending if section.digest not in summaries]
+        if not pending:
+            return summaries
+    raise AgentOutputError("sections", f"{len(pending)}개 섹션의 요약이 없습니다.")
+
+async def run_versioned_pipeline(job_id: str, parent_job_id: str, content: str) -> Dict[str, Any]:
+    """이전 버전 문서와 섹션 단위로 비교해 바뀐 섹션만 다시 요약하고, 합친 요약으로 체크리스트를 다시 만듭니다."""
+    sections = split_sections(content)
+    digests = list(dict.fromkeys(section.digest for section in sections))
+    summaries = load_section_summaries(redis_client, parent_job_id, digests)
+    reused = sum(1 for section in sections if section.digest in summaries)
+    changed = list({section.digest: section for section in sections if section.digest not in summaries}.values())
+    if changed:
+        summaries.update(await summarize_sections(changed))
+    # 다음 버전이 재사용할 수 있도록 이 버전의 섹션 요약을 저장
+    save_section_summaries(redis_client, job_id, {digest: summaries[digest] for digest in digests})
+
+    summary = "\n\n".join(
+        f"[{section.title}] {summaries[section.digest]}" if section.title else summaries[section.digest]
+        for section in sections
+    )
+    checklist = await run_stage_with_retries(CHECKLIST_STAGE, summary, {SUMMARY_STAGE.output_key: summary})
+
+    logger.info(f"Job {job_id}: reused {reused}/{len(sections)} sections from {parent_job_id}")
+    record_metric(record_section_reuse, job_id, len(sections), reused)
+    record_metric(metrics.incr_counter, "sections_reused", reused)
+    record_metric(metrics.incr_counter, "sections_summarized", len(changed))
+    return {
+        "summary": summary,
+        "checklist": [item.model_dump() for item in checklist.items],
+        "sections": {"total": len(sections), "reused": reused}
+    }
+
+async def cache_section_summaries(job_id: str, content: str):
+    """일반 작업의 섹션 요약을 만들어 저장합니다 (이 작업을 이전 버전으로 올린 새 버전이 재사용).
+
+    실패해도 작업 결과에는 영향이 없고, 그 경우 새 버전은 모든 섹션을 다시 요약합니다.
+    """
+    sections = list({section.digest: section for section in split_sections(content)}.values())
+    # 섹션이 하나뿐인 문서는 새 버전에서 그 섹션이 바뀌므로 재사용할 것이 없음
+    if len(sections) < 2:
+        return
+    try:
+        save_section_summaries(redis_client, job_id, await summarize_sections(sections))
+        record_metric(metrics.incr_counter, "sections_summarized", len(sections))
+    except Exception as e:
+        logger.warning(f"Failed to cache section summaries for job {job_id}: {str(e)}")
+        record_metric(metrics.incr_counter, "section_cache_failures")
+
+async def run_document_pipeline(job_id: str, content: str, pipeline: Optional[str] = None) -> Dict[str, Any]:
+    """이전 버전이 없는 작업을 처리합니다. SECTION_CACHE_ALL_JOBS면 섹션 요약을 함께 만들어 둡니다."""
+    if not settings.SECTION_CACHE_ALL_JOBS:
+        return await run_agent_pipeline(content, pipeline)
+    result, _ = await asyncio.gather(run_agent_pipeline(content, pipeline), cache_section_summaries(job_id, content))
+    return result
+
+async def reconcile_checklist(summary: SummaryOutput, checklist: ChecklistOutput) -> ChecklistOutput:
+    """병렬로 만든 체크리스트를 요약과 대조해 보정합니다. 보정 출력이 잘못되면 원래 체크리스트를 사용합니다."""
+    state = {
+        SUMMARY_STAGE.output_key: summary.model_dump_json(),
+        CHECKLIST_STAGE.output_key: checklist.model_dump_json()
+    }
+    try:
+        return await run_stage(RECONCILE_STAGE, "요약과 체크리스트를 대조해 체크리스트를 보정해주세요.", state)
+    except AgentOutputError as e:
+        logger.warning(f"{str(e)} (keeping unreconciled checklist)")
+        record_metric(metrics.incr_counter, "agent_reconcile_failures")
+        return checklist
+
+async def process_with_agent(
+    session_id: str,
+    content: str,
+    app_name: str = AGENT_APP_NAME,
+    reconcile: bool = False
+) -> Dict[str, Any]:
+    """에이전트를 통해 문서를 처리합니다.
+
+    파이프라인 앱으로 모든 단계를 한 번에 실행한 뒤 단계별 출력을 스키마로 검증하고,
+    형식이 잘못된 단계가 있으면 작업 전체가 아니라 그 단계만 다시 실행합니다.
+    reconcile이면 체크리스트를 요약과 대조하는 보정 단계를 이어서 실행합니다.
+    """
+    try:
+        events = await run_agent(app_name, session_id, content)
+        raw_outputs = collect_stage_outputs(events)
+        
+        outputs = {}
+        state = {}
+        for stage in STAGES:
+            try:
+                output = decode_stage_output(stage, raw_outputs.get(stage.name))
+            except AgentOutputError as e:
+                output = await retry_stage(stage, content, state, e)
+            outputs[stage.name] = output
+            # 다음 단계를 다시 실행할 때 참고하도록 세션 상태로 전달
+            state[stage.output_key] = output.model_dump_json()
+
+        if reconcile:
+            outputs["checklist"] = await reconcile_checklist(outputs["summary"], outputs["checklist"])
+        
+        return {
+            "summary": outputs["summary"].render(),
+            "checklist": [item.model_dump() for item in outputs["checklist"].items]
+        }
     except Exception as e:
         logger.error(f"Error in process_with_agent: {str(e)}")
         raise
 
-@celery_app.task(name="app.tasks.process_guideline.process_guideline")
-def process_guideline(job_id: str, filename: str):
-    """가이드라인 문서를 처리하는 Celery 작업"""
-    logger.info(f"Starting job processing for job_id: {job_id}, filename: {filename}")
+@celery_app.task(bind=True, name="app.tasks.process_guideline.process_guideline")
+def process_guideline(
+    self,
+    job_id: str,
+    filename: str,
+    profile: bool = False,
+    attempt: int = 0,
+    blob: Optional[str] = None,
+    pack: bool = True,
+    parent_job_id: Optional[str] = None,
+    pipeline: Optional[str] = None,
+    deprioritized: bool = False
+):
+    """가이드라인 문서를 처리하는 Celery 작업
+
+    에이전트의 일시적 오류는 지수 백오프로 최대 AGENT_MAX_RETRIES번 재시도하고,
+    서킷 브레이커가 열려 있으면 처리하지 않고 회로가 닫힐 때까지 미룹니다.
+    blob은 업로드 파일의 저장소 다이제스트이며, 작업이 끝나면(완료, 실패, 취소) 참조를 해제합니다.
+    묶음 처리를 켜면 짧은 문서는 묶음 대기 목록에 넣고 process_pack이 결과를 저장합니다 (pack=False면 단독 처리).
+    parent_job_id가 있으면 이전 버전 작업과 섹션 단위로 비교해 바뀐 섹션만 다시 요약합니다.
+    pipeline은 sequential 또는 parallel이며, 없으면 AGENT_PIPELINE 설정을 따릅니다.
+    마감 시각이 지났거나 클라이언트가 떠난 작업은 처리하지 않고 건너뜁니다 (deprioritized: 이미 우선순위를 낮춘 작업).
+    """
+    logger.info(f"Starting job processing for job_id: {job_id}, filename: {filename}, profile: {profile}, attempt: {attempt}")
+    retry_kwargs = {"profile": profile, "attempt": attempt, "blob": blob, "pack": pack, "parent_job_id": parent_job_id, "pipeline": pipeline}
+    skipped = shed_stale_job(self, job_id, blob, deprioritized, retry_kwargs)
+    if skipped is not None:
+        return skipped
+
+    breaker = get_agent_breaker()
+    # 회로가 열려 있거나 다른 워커가 half-open 시험 요청 중이면 실패로 처리하지 않고 다시 대기열로 돌려보냄
+    # (텍스트 추출과 처리 중 상태 기록 전에 확인하고, 시험 요청 자리는 에이전트 요청 직전에 얻음)
+    if not self.request.called_directly and breaker.is_blocked():
+        defer_for_breaker(self, job_id, breaker)
+
     db = SessionLocal()
+    started = time.monotonic()
+    token = CancellationToken(redis_client, job_id)
+    uploads = contextlib.ExitStack()
     
     try:
+        # 대기 중에 취소된 작업은 처리하지 않음
+        token.check()
+
         # 작업 시작 시 상태 업데이트
         start_time = datetime.now().isoformat()
         update_job_status(job_id, JobStatus.PROCESSING, {
@@ -203,6 +686,7 @@ def process_guideline(job_id: str, filename: str):
             "summary": "",
             "checklist": "[]"
         })
+        record_metric(estimates.mark_started, job_id)
 
         # 작업 상태를 'processing'으로 업데이트
         job = db.query(Job).filter(Job.id == job_id).first()
@@ -213,18 +697,49 @@ def process_guideline(job_id: str, filename: str):
         db.commit()
 
         # 파일 내용 읽기
-        file_path = f"uploads/{filename}"
-        if not os.path.exists(file_path):
-            raise Exception("File not found")
+        file_path = uploads.enter_context(open_upload(filename, blob))
 
-        file_content = extract_text_from_file(file_path)
-        if not file_content.strip():
-            raise Exception("File is empty")
+        # 플래그된 작업만 텍스트 추출과 에이전트 처리 구간을 프로파일링
+        with profile_job(job_id, profile), cancellation_scope(token):
+            file_content = extract_text_from_file(file_path, job_id, filename)
+            if not file_content.strip():
+                raise Exception("File is empty")
+            record_metric(estimates.record_features, job_id, len(file_content))
 
-        # 비동기 작업 실행
-        loop = asyncio.get_event_loop()
-        session_id = loop.run_until_complete(create_agent_session())
-        result = loop.run_until_complete(process_with_agent(session_id, file_content))
+            # 유사한 완료 작업이 있으면 정책에 따라 표시하거나 그 결과를 재사용
+            # (새 버전 작업은 바뀐 섹션을 반영해야 하므로 재사용하지 않음)
+            signature, duplicate = check_near_duplicate(job_id, file_content)
+            result = None if parent_job_id else reuse_near_duplicate(duplicate)
+            reused = result is not None
+
+            # 짧은 문서는 다른 작업과 묶어 에이전트를 한 번만 실행
+            if result is None and should_pack(file_content, pack, parent_job_id, pipeline) \
+                    and enqueue_for_pack(job_id, filename, blob, start_time, file_content, profile, pipeline, deprioritized):
+                return {"status": JobStatus.PROCESSING, "packed": True}
+
+            if result is None:
+                if not self.request.called_directly and not breaker.allow_request():
+                    defer_for_breaker(self, job_id, breaker, started=True)
+                # 비동기 작업 실행 (취소 요청 시 진행 중인 에이전트 요청도 중단)
+                loop = asyncio.get_event_loop()
+                # 문서 크기에 맞는 모델 티어로 처리
+                tier = model_tiers.select_tier(packing.estimate_tokens(file_content))
+                record_metric(model_tiers.record_job_tier, job_id, tier)
+                record_metric(metrics.agent_call_started, job_id)
+                agent_started = time.monotonic()
+                if parent_job_id:
+                    agent_run = run_versioned_pipeline(job_id, parent_job_id, file_content)
+                else:
+                    agent_run = run_document_pipeline(job_id, file_content, pipeline)
+                try:
+                    with agent_call(breaker), model_tiers.model_tier_scope(tier) as usage:
+                        result = loop.run_until_complete(run_cancellable(agent_run, token))
+                finally:
+                    record_metric(metrics.agent_call_finished, job_id)
+                record_metric(model_tiers.record_tier_usage, usage, 1, time.monotonic() - agent_started)
+
+        # 결과 저장 직전에 취소된 경우 결과를 버림
+        token.check()
 
         # 작업 완료 처리
         job.status = JobStatus.COMPLETED
@@ -239,6 +754,18 @@ def process_guideline(job_id: str, filename: str):
             "started_at": start_time,
             "filename": filename
         })
+        duration = time.monotonic() - started
+        record_metric(metrics.record_job_completion, duration)
+        if not reused:
+            record_metric(
+                estimates.record_duration,
+                os.path.splitext(filename)[1].lower().lstrip("."), MAIN_QUEUE, duration,
+                os.path.getsize(file_path), len(file_content)
+            )
+        if signature:
+            record_metric(near_dup.index_document, job_id, signature)
+        if blob:
+            record_metric(release_blob, blob, job_id)
 
         return {
             "status": JobStatus.COMPLETED,
@@ -246,10 +773,56 @@ def process_guideline(job_id: str, filename: str):
             "checklist": result["checklist"]
         }
 
+    except JobCancelled:
+        logger.info(f"Job cancelled: {job_id}")
+        db.rollback()
+        handle_job_cancelled(job_id)
+        if blob:
+            record_metric(release_blob, blob, job_id)
+        return {"status": JobStatus.CANCELLED}
+    except Retry:
+        raise
     except Exception as e:
+        db.rollback()
+        if is_transient(e) and attempt < settings.AGENT_MAX_RETRIES and not self.request.called_directly:
+            delay = backoff_delay(attempt)
+            logger.warning(f"Transient error on job {job_id} (attempt {attempt + 1}), retrying in {delay:.1f}s: {str(e)}")
+            record_metric(metrics.incr_counter, "agent_retries")
+            handle_job_retry(job_id, e, attempt + 1, delay)
+            raise self.retry(
+                kwargs={**retry_kwargs, "attempt": attempt + 1, "deprioritized": deprioritized},
+                countdown=delay,
+                max_retries=None
+            )
+
         logger.error(f"Error processing job {job_id}: {str(e)}")
+        record_metric(metrics.incr_counter, "agent_failures_transient" if is_transient(e) else "agent_failures_permanent")
         handle_job_failure(job_id, e)
+        record_metric(dead_letters.record, job_id, "process", e, attempt + 1, filename, blob, parent_job_id, pipeline)
+        if blob:
+            record_metric(release_blob, blob, job_id)
         raise
     finally:
+        uploads.close()
         db.close()
-        logger.info(f"Job processing finished: {job_id}") 
\ No newline at end of file
+        logger.info(f"Job processing finished: {job_id}") 
+
+# 회로가 열려 있는 동안 소비를 멈추는 큐 (에이전트를 호출하는 작업의 큐)
+GATED_QUEUES = (MAIN_QUEUE, AGENT_QUEUE)
+_consumer_gates: List[ConsumerGate] = []
+
+@worker_ready.connect
+def start_consumer_gate(sender=None, **kwargs):
+    """워커가 뜨면 회로가 열려 있는 동안 큐 소비를 멈추는 스레드를 시작합니다 (워커가 소비하는 큐만)."""
+    task_consumer = getattr(sender, "task_consumer", None)
+    consumed = {queue.name for queue in task_consumer.queues} if task_consumer else {MAIN_QUEUE}
+    for queue in GATED_QUEUES:
+        if queue in consumed:
+            gate = ConsumerGate(celery_app, get_agent_breaker, queue, sender.hostname)
+            gate.start()
+            _consumer_gates.append(gate)
+
+@worker_shutdown.connect
+def stop_consumer_gate(**kwargs):
+    for gate in _consumer_gates:
+        gate.stop()
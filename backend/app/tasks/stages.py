@@ -0,0 +1,255 @@
+# 단계별 파이프라인 (STAGED_PIPELINE): process_guideline의 처리를 추출, 에이전트, 저장 단계로 나눠 큐마다 따로 처리
+# 단계 사이에는 작업 ID와 작은 컨텍스트만 브로커로 넘기고, 추출한 텍스트와 결과는 Redis(stage_payloads)로 넘김
+from app.core.celery_app import celery_app, AGENT_QUEUE, EXTRACT_QUEUE, PERSIST_QUEUE
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.redis_client import redis_client
+from app.core import dead_letters, estimates, metrics, model_tiers, packing, stage_payloads
+from app.core.circuit_breaker import OPEN
+from app.core.cancellation import CancellationToken, JobCancelled, cancellation_scope, run_cancellable
+from app.core.profiling import profile_job
+from app.core.retry import backoff_delay, is_transient
+from app.models.job import Job, JobStatus
+from app.storage import release_blob
+from app.tasks.process_guideline import (
+    agent_call,
+    check_near_duplicate,
+    defer_for_breaker,
+    extract_text_from_file,
+    get_agent_breaker,
+    handle_job_cancelled,
+    handle_job_completed,
+    handle_job_failure,
+    handle_job_retry,
+    index_completed_text,
+    open_upload,
+    record_metric,
+    reuse_near_duplicate,
+    run_document_pipeline,
+    run_versioned_pipeline,
+    shed_stale_job,
+    update_job_status,
+)
+from celery.exceptions import Retry
+from datetime import datetime
+from typing import Optional
+import asyncio
+import contextlib
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+def send_stage(name: str, job_id: str, context: dict):
+    """다음 단계를 해당 단계의 큐에 등록합니다 (큐는 task_routes로 정해짐)."""
+    celery_app.send_task(f"app.tasks.stages.{name}", args=[job_id, context])
+
+@contextlib.contextmanager
+def stage_run(stage: str):
+    """단계 실행 횟수와 처리 시간을 단계별 처리량/이용률 지표로 기록합니다."""
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        record_metric(metrics.record_stage_run, stage, time.monotonic() - started)
+
+def record_stage_duration(context: dict, queue: str, started: float):
+    """단계 처리 시간을 단계 큐 레인의 예상 처리 시간 모델에 반영합니다 (작업 전체 예상은 단계별 합)."""
+    record_metric(
+        estimates.record_duration,
+        os.path.splitext(context["filename"])[1].lower().lstrip("."), queue, time.monotonic() - started,
+        context.get("size_bytes"), context.get("chars")
+    )
+
+def finish_cancelled(job_id: str, context: dict) -> dict:
+    logger.info(f"Job cancelled: {job_id}")
+    handle_job_cancelled(job_id)
+    if context.get("blob"):
+        record_metric(release_blob, context["blob"], job_id)
+    record_metric(stage_payloads.clear, job_id)
+    return {"status": JobStatus.CANCELLED}
+
+def fail_job(job_id: str, context: dict, error: Exception, stage: str, attempt: int = 0):
+    handle_job_failure(job_id, error)
+    record_metric(
+        dead_letters.record, job_id, stage, error, attempt + 1,
+        context["filename"], context.get("blob"), context.get("parent_job_id"), context.get("pipeline")
+    )
+    if context.get("blob"):
+        record_metric(release_blob, context["blob"], job_id)
+    record_metric(stage_payloads.clear, job_id)
+
+def retry_or_fail(task, stage: str, job_id: str, context: dict, attempt: int, error: Exception):
+    """일시적 오류는 단계만 지수 백오프로 다시 실행하고, 그 밖의 오류는 작업을 실패로 처리합니다."""
+    if is_transient(error) and attempt < settings.AGENT_MAX_RETRIES and not task.request.called_directly:
+        delay = backoff_delay(attempt)
+        logger.warning(f"Transient error in {task.name} for job {job_id} (attempt {attempt + 1}), retrying in {delay:.1f}s: {str(error)}")
+        handle_job_retry(job_id, error, attempt + 1, delay)
+        raise task.retry(kwargs={"attempt": attempt + 1}, countdown=delay, max_retries=None)
+
+    logger.error(f"Error in {task.name} for job {job_id}: {str(error)}")
+    fail_job(job_id, context, error, stage, attempt)
+
+@celery_app.task(bind=True, name="app.tasks.stages.extract_stage")
+def extract_stage(
+    self,
+    job_id: str,
+    filename: str,
+    profile: bool = False,
+    blob: Optional[str] = None,
+    parent_job_id: Optional[str] = None,
+    pipeline: Optional[str] = None,
+    deprioritized: bool = False
+):
+    """업로드 파일에서 텍스트를 추출해 Redis에 저장하고 에이전트 단계로 넘깁니다.
+
+    인자는 process_guideline과 같습니다. 묶음 처리는 단계별 파이프라인에서 사용하지 않습니다.
+    마감 시각과 클라이언트 이탈은 대기열 맨 앞인 이 단계에서만 확인합니다.
+    """
+    retry_kwargs = {"profile": profile, "blob": blob, "parent_job_id": parent_job_id, "pipeline": pipeline}
+    skipped = shed_stale_job(self, job_id, blob, deprioritized, retry_kwargs)
+    if skipped is not None:
+        return skipped
+
+    context = {"filename": filename, "blob": blob, "parent_job_id": parent_job_id, "pipeline": pipeline}
+    token = CancellationToken(redis_client, job_id)
+    with stage_run("extract"):
+        started = time.monotonic()
+        try:
+            # 대기 중에 취소된 작업은 처리하지 않음
+            token.check()
+
+            context["started_at"] = datetime.now().isoformat()
+            update_job_status(job_id, JobStatus.PROCESSING, {
+                "filename": filename,
+                "started_at": context["started_at"],
+                "summary": "",
+                "checklist": "[]"
+            })
+            record_metric(estimates.mark_started, job_id)
+            with SessionLocal() as db:
+                job = db.query(Job).filter(Job.id == job_id).first()
+                if not job:
+                    raise Exception("Job not found")
+                job.status = JobStatus.PROCESSING
+                db.commit()
+
+            with open_upload(filename, blob) as file_path, profile_job(job_id, profile), cancellation_scope(token):
+                text = extract_text_from_file(file_path, job_id, filename)
+                if not text.strip():
+                    raise Exception("File is empty")
+                context["size_bytes"] = os.path.getsize(file_path)
+            context["chars"] = len(text)
+            record_metric(estimates.record_features, job_id, len(text))
+            stage_payloads.put_text(redis_client, job_id, text)
+
+            # 유사한 완료 작업의 결과를 재사용하면 에이전트 단계를 건너뜀
+            _, duplicate = check_near_duplicate(job_id, text)
+            result = None if parent_job_id else reuse_near_duplicate(duplicate)
+            record_stage_duration(context, EXTRACT_QUEUE, started)
+            if result is not None:
+                context["reused"] = True
+                stage_payloads.put_result(redis_client, job_id, result)
+                send_stage("persist_stage", job_id, context)
+            else:
+                send_stage("agent_stage", job_id, context)
+            return {"status": JobStatus.PROCESSING, "stage": "extract"}
+        except JobCancelled:
+            return finish_cancelled(job_id, context)
+        except Exception as e:
+            logger.error(f"Error extracting job {job_id}: {str(e)}")
+            fail_job(job_id, context, e, "extract")
+            raise
+
+@celery_app.task(bind=True, name="app.tasks.stages.agent_stage")
+def agent_stage(self, job_id: str, context: dict, attempt: int = 0):
+    """추출된 텍스트를 에이전트로 처리해 결과를 Redis에 저장하고 저장 단계로 넘깁니다.
+
+    에이전트의 일시적 오류는 이 단계만 다시 실행하고, 서킷 브레이커가 열려 있으면 처리하지 않고 미룹니다.
+    """
+    breaker = get_agent_breaker()
+    if not self.request.called_directly and breaker.state() == OPEN:
+        defer_for_breaker(self, job_id, breaker)
+
+    token = CancellationToken(redis_client, job_id)
+    with stage_run("agent"):
+        started = time.monotonic()
+        try:
+            token.check()
+            text = stage_payloads.get_text(redis_client, job_id)
+            if text is None:
+                raise Exception("Extracted text expired")
+            # half-open 시험 요청 자리는 에이전트 요청 직전에 얻음
+            if not self.request.called_directly and not breaker.allow_request():
+                defer_for_breaker(self, job_id, breaker)
+
+            # 문서 크기에 맞는 모델 티어로 처리
+            tier = model_tiers.select_tier(packing.estimate_tokens(text))
+            record_metric(model_tiers.record_job_tier, job_id, tier)
+            record_metric(metrics.agent_call_started, job_id)
+            agent_started = time.monotonic()
+            try:
+                if context.get("parent_job_id"):
+                    agent_run = run_versioned_pipeline(job_id, context["parent_job_id"], text)
+                else:
+                    agent_run = run_document_pipeline(job_id, text, context.get("pipeline"))
+                with agent_call(breaker), model_tiers.model_tier_scope(tier) as usage:
+                    result = asyncio.get_event_loop().run_until_complete(run_cancellable(agent_run, token))
+            finally:
+                record_metric(metrics.agent_call_finished, job_id)
+            record_metric(model_tiers.record_tier_usage, usage, 1, time.monotonic() - agent_started)
+
+            stage_payloads.put_result(redis_client, job_id, result)
+            record_stage_duration(context, AGENT_QUEUE, started)
+            send_stage("persist_stage", job_id, context)
+            return {"status": JobStatus.PROCESSING, "stage": "agent"}
+        except JobCancelled:
+            return finish_cancelled(job_id, context)
+        except Retry:
+            raise
+        except Exception as e:
+            if is_transient(e) and attempt < settings.AGENT_MAX_RETRIES:
+                record_metric(metrics.incr_counter, "agent_retries")
+            else:
+                record_metric(metrics.incr_counter, "agent_failures_transient" if is_transient(e) else "agent_failures_permanent")
+            retry_or_fail(self, "agent", job_id, context, attempt, e)
+            raise
+
+@celery_app.task(bind=True, name="app.tasks.stages.persist_stage")
+def persist_stage(self, job_id: str, context: dict, attempt: int = 0):
+    """에이전트 결과를 DB와 Redis에 저장하고 작업을 마무리합니다 (지표, 유사 문서 색인, 파일 참조 해제)."""
+    token = CancellationToken(redis_client, job_id)
+    with stage_run("persist"):
+        started = time.monotonic()
+        try:
+            # 결과 저장 직전에 취소된 경우 결과를 버림
+            token.check()
+            result = stage_payloads.get_result(redis_client, job_id)
+            if result is None:
+                raise Exception("Agent result expired")
+
+            handle_job_completed(job_id, context["filename"], result, context["started_at"])
+
+            duration = (datetime.now() - datetime.fromisoformat(context["started_at"])).total_seconds()
+            record_metric(metrics.record_job_completion, duration)
+            record_stage_duration(context, PERSIST_QUEUE, started)
+            text = stage_payloads.get_text(redis_client, job_id)
+            if text:
+                index_completed_text(job_id, text)
+            if context.get("blob"):
+                record_metric(release_blob, context["blob"], job_id)
+            record_metric(stage_payloads.clear, job_id)
+
+            return {
+                "status": JobStatus.COMPLETED,
+                "summary": result["summary"],
+                "checklist": result["checklist"]
+            }
+        except JobCancelled:
+            return finish_cancelled(job_id, context)
+        except Retry:
+            raise
+        except Exception as e:
+            retry_or_fail(self, "persist", job_id, context, attempt, e)
+            raise
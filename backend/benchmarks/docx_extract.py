@@ -0,0 +1,87 @@
+"""DOCX 추출 백엔드(docx-stream, python-docx)의 속도와 최대 메모리를 비교하는 벤치마크입니다.
+
+백엔드마다 새 프로세스에서 추출해 최대 RSS(ru_maxrss) 증가량을 측정합니다.
+파일을 주지 않으면 문단과 표가 섞인 큰 문서를 생성해 사용합니다.
+
+사용 예:
+    python benchmarks/docx_extract.py                          # 문단 20,000개 + 표 500개 문서 생성 후 측정
+    python benchmarks/docx_extract.py --paragraphs 100000
+    python benchmarks/docx_extract.py path/to/document.docx --repeat 3
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+BACKENDS = ("docx-stream", "python-docx")
+
+def generate(path: str, paragraphs: int, tables: int):
+    """벤치마크용 DOCX 문서를 생성합니다."""
+    import docx
+
+    doc = docx.Document()
+    doc.sections[0].header.paragraphs[0].text = "가이드라인 머리글"
+    table_every = max(paragraphs // max(tables, 1), 1)
+    for i in range(paragraphs):
+        doc.add_paragraph(f"{i}번째 문단: 개인정보 처리 시 수집 목적과 보관 기간을 명시해야 합니다. " * 2)
+        if tables and i % table_every == 0:
+            table = doc.add_table(rows=4, cols=3)
+            for row in table.rows:
+                for cell in row.cells:
+                    cell.text = "점검 항목 셀"
+    doc.save(path)
+
+def run_backend(name: str, path: str, repeat: int) -> dict:
+    """현재 프로세스에서 백엔드를 실행해 시간과 최대 RSS 증가량을 반환합니다."""
+    from app.extractors import get_backends
+
+    backend = next(b for b in get_backends("docx") if b.name == name)
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = backend.func(path)
+        samples.append(time.perf_counter() - start)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "seconds": min(samples),
+        "peak_rss_mb": (peak - baseline) / 1024,  # Linux에서 ru_maxrss는 KB 단위
+        "chars": len(text)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", nargs="?")
+    parser.add_argument("--paragraphs", type=int, default=20000)
+    parser.add_argument("--tables", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--run-backend", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_backend:
+        print(json.dumps(run_backend(args.run_backend, args.path, args.repeat)))
+        return
+
+    path = args.path
+    if path is None:
+        path = os.path.join(tempfile.mkdtemp(), "benchmark.docx")
+        generate(path, args.paragraphs, args.tables)
+    print(f"file={path} size={os.path.getsize(path) / 1e6:.1f}MB")
+
+    for name in BACKENDS:
+        out = subprocess.run(
+            [sys.executable, __file__, path, "--run-backend", name, "--repeat", str(args.repeat)],
+            capture_output=True, text=True, check=True
+        )
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        print(f"{name:<12} {result['seconds']:7.2f}s  peak_rss=+{result['peak_rss_mb']:.1f}MB  chars={result['chars']}")
+
+if __name__ == "__main__":
+    main()
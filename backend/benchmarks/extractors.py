@@ -0,0 +1,48 @@
+"""텍스트 추출 백엔드의 속도와 품질을 측정해 형식별로 가장 빠른 백엔드를 고르는 보정 벤치마크입니다.
+
+EXTRACTOR_MIN_QUALITY 이상의 품질(가장 많이 추출한 백엔드 대비 문자 수)을 내는 백엔드 중
+처리량이 가장 높은 백엔드를 고르며, --save를 주면 결과를 Redis에 저장해 워커들이 사용합니다.
+
+사용 예:
+    python benchmarks/extractors.py samples/                 # 디렉토리의 모든 샘플 측정
+    python benchmarks/extractors.py a.pdf b.docx --repeat 3
+    python benchmarks/extractors.py samples/ --save          # 선택 결과를 Redis에 저장 (Redis 필요)
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.extractors.calibration import calibrate, save_calibration  # noqa: E402
+
+def _collect(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                full = os.path.join(path, name)
+                if os.path.isfile(full):
+                    yield full
+        else:
+            yield path
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="+", help="샘플 파일 또는 디렉토리")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--save", action="store_true", help="선택한 백엔드를 Redis에 저장")
+    args = parser.parse_args()
+
+    report = calibrate(list(_collect(args.paths)), repeat=args.repeat)
+    for fmt, r in report.items():
+        print(f"[{fmt}] files={r['files']} chosen={r['backend']}")
+        for name, result in sorted(r["results"].items(), key=lambda item: -item[1]["mb_per_s"]):
+            print(f"  {name:<14} {result['mb_per_s']:8.2f} MB/s  quality={result['quality']:.3f}  errors={result['errors']}")
+
+    if args.save:
+        from app.core.redis_client import get_redis
+        save_calibration(get_redis(), report)
+        print("saved")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""ADK api_server를 흉내 내는 가짜 에이전트 서버입니다.
+
+LLM 호출 없이 앱별 단계 구성(순차/병렬 파이프라인, 단계별 앱, 묶음/섹션 처리)과
+지연 시간, 실패율, 동시 호출 한도를 재현하므로 워커 오토스케일이나 재시도 동작을
+로컬 Redis와 함께 시험할 수 있습니다. 응답은 실제 에이전트와 같은 JSON 형식입니다.
+
+사용 예:
+    python benchmarks/fake_agent.py --port 8001 --summary-latency 2 --checklist-latency 1
+    AGENT_API_URL=http://localhost:8001 celery -A app.core.celery_app worker --autoscale=8,1 -Q main-queue
+"""
+import argparse
+import asyncio
+import json
+import random
+import re
+from aiohttp import web
+
+def build_app(args) -> web.Application:
+    state = {"inflight": 0, "requests": 0}
+
+    def latency(base: float) -> float:
+        return max(0.0, base + random.uniform(-args.jitter, args.jitter))
+
+    async def create_session(request: web.Request):
+        return web.json_response({
+            "id": request.match_info["session_id"],
+            "appName": request.match_info["app_name"],
+            "userId": request.match_info["user_id"],
+            "state": {},
+            "events": []
+        })
+
+    def summary_output(text: str) -> dict:
+        return {"topic": f"가짜 요약 ({len(text)}자)", "purpose": "부하 시험", "key_points": [text[:40]]}
+
+    def checklist_output() -> dict:
+        return {"items": [
+            {"text": f"가짜 체크리스트 항목 {i}", "priority": "medium", "category": "검증"}
+            for i in range(1, args.checklist_items + 1)
+        ]}
+
+    def event(author: str, key: str, value, text: str = "") -> dict:
+        return {
+            "author": author,
+            "actions": {"stateDelta": {key: json.dumps(value, ensure_ascii=False)}},
+            "usageMetadata": {"promptTokenCount": len(text) // 2, "candidatesTokenCount": 200}
+        }
+
+    async def run_app(app_name: str, text: str) -> list:
+        """앱별로 실제 파이프라인의 단계 구성과 지연 시간을 흉내 냅니다."""
+        if app_name == "guideline_parallel":
+            # 요약과 체크리스트가 동시에 실행되므로 더 느린 단계만큼 걸림
+            await asyncio.gather(asyncio.sleep(latency(args.summary_latency)), asyncio.sleep(latency(args.checklist_latency)))
+            return [event("summary_agent", "summary", summary_output(text), text), event("checklist_agent", "checklist", checklist_output(), text)]
+        if app_name == "guideline_summary":
+            await asyncio.sleep(latency(args.summary_latency))
+            return [event("summary_agent", "summary", summary_output(text), text)]
+        if app_name == "guideline_checklist":
+            await asyncio.sleep(latency(args.checklist_latency))
+            return [event("checklist_agent", "checklist", checklist_output(), text)]
+        if app_name == "guideline_reconcile":
+            await asyncio.sleep(latency(args.reconcile_latency))
+            return [event("reconcile_agent", "checklist", checklist_output(), text)]
+        if app_name == "guideline_batch":
+            await asyncio.sleep(latency(args.summary_latency + args.checklist_latency))
+            documents = [
+                {"id": doc_id, "summary": summary_output(text), "checklist": checklist_output()}
+                for doc_id in re.findall(r"<<<DOC (\d+)>>>", text)
+            ]
+            return [event("batch_agent", "documents", {"documents": documents}, text)]
+        if app_name == "guideline_sections":
+            await asyncio.sleep(latency(args.summary_latency))
+            sections = [{"id": section_id, "summary": f"가짜 섹션 요약 {section_id}"} for section_id in re.findall(r"<<<SECTION (\d+)>>>", text)]
+            return [event("sections_agent", "sections", {"sections": sections}, text)]
+        # guideline_agent: 요약 후 체크리스트를 차례로 실행
+        await asyncio.sleep(latency(args.summary_latency))
+        summary = event("summary_agent", "summary", summary_output(text), text)
+        await asyncio.sleep(latency(args.checklist_latency))
+        return [summary, event("checklist_agent", "checklist", checklist_output(), text)]
+
+    async def run(request: web.Request):
+        state["requests"] += 1
+        if args.max_concurrency and state["inflight"] >= args.max_concurrency:
+            return web.Response(status=429, text="rate limit exceeded")
+        if random.random() < args.fail_rate:
+            return web.Response(status=503, text="fake agent failure")
+
+        body = await request.json()
+        text = body["newMessage"]["parts"][0]["text"]
+        state["inflight"] += 1
+        try:
+            events = await run_app(body["appName"], text)
+        finally:
+            state["inflight"] -= 1
+        return web.json_response(events)
+
+    async def stats(request: web.Request):
+        return web.json_response(state)
+
+    app = web.Application(client_max_size=256 * 1024 * 1024)
+    app.router.add_post("/apps/{app_name}/users/{user_id}/sessions/{session_id}", create_session)
+    app.router.add_post("/run", run)
+    app.router.add_get("/_stats", stats)
+    return app
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--summary-latency", type=float, default=1.0, help="요약 단계 지연 (초)")
+    parser.add_argument("--checklist-latency", type=float, default=1.0, help="체크리스트 단계 지연 (초)")
+    parser.add_argument("--reconcile-latency", type=float, default=0.3, help="체크리스트 보정 단계 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="지연 시간 변동폭 (초)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="503 응답 비율 (0~1)")
+    parser.add_argument("--max-concurrency", type=int, default=0, help="초과 시 429 응답 (0이면 제한 없음)")
+    parser.add_argument("--checklist-items", type=int, default=5)
+    args = parser.parse_args()
+
+    web.run_app(build_app(args), host=args.host, port=args.port)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""GET /jobs/{job_id} 처리량(requests/sec)을 측정하는 벤치마크입니다.
+
+실행 중인 API 서버에 여러 클라이언트가 같은 작업을 폴링하는 상황을 재현합니다.
+변경 전후 비교는 같은 작업 ID로 이전 커밋과 현재 커밋의 서버를 각각 띄워 측정합니다.
+
+사용 예:
+    python benchmarks/job_status.py --job-id <ID>                      # 일반 폴링
+    python benchmarks/job_status.py --job-id <ID> --conditional        # If-None-Match 폴링 (304)
+    python benchmarks/job_status.py --job-id <ID> --concurrency 64 --duration 20
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import aiohttp
+
+async def _poll(session: aiohttp.ClientSession, url: str, conditional: bool, deadline: float, latencies: list, statuses: dict):
+    etag = None
+    while time.perf_counter() < deadline:
+        headers = {"If-None-Match": etag} if conditional and etag else {}
+        start = time.perf_counter()
+        async with session.get(url, headers=headers) as response:
+            await response.read()
+            etag = response.headers.get("ETag", etag)
+            statuses[response.status] = statuses.get(response.status, 0) + 1
+        latencies.append(time.perf_counter() - start)
+
+async def run(url: str, job_id: str, concurrency: int, duration: float, conditional: bool) -> dict:
+    target = f"{url.rstrip('/')}/jobs/{job_id}"
+    latencies = []
+    statuses = {}
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        # 워밍업 (완료된 작업의 응답 캐시를 채움)
+        async with session.get(target) as response:
+            await response.read()
+            if response.status != 200:
+                raise RuntimeError(f"GET {target} returned {response.status}")
+
+        deadline = time.perf_counter() + duration
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            _poll(session, target, conditional, deadline, latencies, statuses)
+            for _ in range(concurrency)
+        ))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "statuses": statuses
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--job-id", required=True)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--conditional", action="store_true", help="ETag를 기억해 If-None-Match로 폴링")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args.url, args.job_id, args.concurrency, args.duration, args.conditional))
+    mode = "conditional" if args.conditional else "plain"
+    print(f"mode={mode} concurrency={args.concurrency} duration={args.duration}s")
+    print(f"requests={result['requests']} rps={result['rps']:.1f} "
+          f"p50={result['p50_ms']:.2f}ms p99={result['p99_ms']:.2f}ms statuses={result['statuses']}")
+
+if __name__ == "__main__":
+    main()
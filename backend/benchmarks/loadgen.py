@@ -0,0 +1,419 @@
+"""API 서버 한 대가 감당할 수 있는 동시 업로드와 상태 조회 부하를 측정하는 부하 생성기입니다.
+
+표준 라이브러리(asyncio)만 사용하므로 백엔드 의존성을 설치하지 않은 머신에서도 실행할 수 있습니다.
+세 가지 부하를 초당 도착 수(포아송 도착)로 섞어 보냅니다.
+
+- upload: POST /jobs (--upload-sizes 중 무작위 크기의 txt 파일)
+- poll: 업로드한 작업(또는 --job-id) 중 하나를 GET /jobs/{id}
+- stream: GET /jobs/{id}/stream SSE 연결을 열고 작업이 끝나거나 --stream-hold초가 지날 때까지 유지
+
+도착 시각은 미리 정해 두고(개방형 부하) 지연 시간은 예정된 도착 시각부터 측정하므로, 서버가 느려져
+연결을 기다린 시간도 지연 시간에 포함됩니다. 결과로 부하별 처리량, 지연 시간 백분위수, 오류율,
+서버 측 처리 시간(X-Process-Time)을 출력합니다.
+
+도착 기록(JSON Lines, 한 줄에 {"t": 시작 후 초, "op": "upload" | "poll" | "stream", "size": 바이트})을
+--record-trace로 저장하고 --trace로 재생할 수 있습니다.
+
+사용 예:
+    python benchmarks/loadgen.py --duration 60 --upload-rate 2 --poll-rate 50 --stream-rate 1
+    python benchmarks/loadgen.py --upload-rate 5 --upload-sizes 1k,100k,1m --connections 64
+    python benchmarks/loadgen.py --poll-rate 200 --job-id <ID> --duration 30
+    python benchmarks/loadgen.py --upload-rate 2 --poll-rate 20 --record-trace arrivals.jsonl
+    python benchmarks/loadgen.py --trace arrivals.jsonl --speed 2 --json result.json
+"""
+import argparse
+import asyncio
+import json
+import random
+import ssl
+import time
+import uuid
+from collections import Counter
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+OPS = ("upload", "poll", "stream")
+
+SIZE_UNITS = {"k": 1024, "m": 1024 * 1024}
+
+def parse_size(value: str) -> int:
+    value = value.strip().lower()
+    if value and value[-1] in SIZE_UNITS:
+        return int(float(value[:-1]) * SIZE_UNITS[value[-1]])
+    return int(value)
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """정렬된 값의 q 백분위수 (nearest-rank)"""
+    if not values:
+        return None
+    rank = max(int(round(q / 100 * len(values) + 0.5)) - 1, 0)
+    return values[min(rank, len(values) - 1)]
+
+# HTTP/1.1 클라이언트
+
+class Response:
+    def __init__(self, status: int, headers: Dict[str, str], body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+async def read_head(reader: asyncio.StreamReader) -> Tuple[int, Dict[str, str]]:
+    line = await reader.readline()
+    if not line:
+        raise ConnectionResetError("Connection closed by server")
+    status = int(line.split(b" ", 2)[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            return status, headers
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+def has_framed_body(status: int, headers: Dict[str, str]) -> bool:
+    """본문 끝을 알 수 있는 응답인지 (연결을 다시 쓸 수 있는지) 반환합니다."""
+    return status in (204, 304) or status < 200 or "content-length" in headers \
+        or headers.get("transfer-encoding", "").lower() == "chunked"
+
+async def iter_body(reader: asyncio.StreamReader, status: int, headers: Dict[str, str]) -> AsyncIterator[bytes]:
+    if status in (204, 304) or status < 200:
+        return
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                # 트레일러 헤더 건너뛰기
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return
+            yield await reader.readexactly(size)
+            await reader.readexactly(2)
+    elif "content-length" in headers:
+        remaining = int(headers["content-length"])
+        while remaining:
+            chunk = await reader.read(min(remaining, 65536))
+            if not chunk:
+                raise asyncio.IncompleteReadError(b"", remaining)
+            remaining -= len(chunk)
+            yield chunk
+    else:
+        while True:
+            chunk = await reader.read(65536)
+            if not chunk:
+                return
+            yield chunk
+
+class HttpClient:
+    """keep-alive 연결을 최대 connections개까지 재사용하는 HTTP/1.1 클라이언트"""
+
+    def __init__(self, url: str, connections: int):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.ssl = ssl.create_default_context() if parts.scheme == "https" else None
+        self.host_header = parts.netloc
+        self.base_path = parts.path.rstrip("/")
+        self._slots = asyncio.Semaphore(connections)
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+
+    async def connect(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        return await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+
+    def encode_request(self, method: str, path: str, headers: Dict[str, str], body: bytes) -> bytes:
+        lines = [f"{method} {self.base_path}{path} HTTP/1.1", f"Host: {self.host_header}"]
+        if body or method in ("POST", "PUT"):
+            lines.append(f"Content-Length: {len(body)}")
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+    async def request(self, method: str, path: str, headers: Optional[Dict[str, str]] = None, body: bytes = b"") -> Response:
+        data = self.encode_request(method, path, headers or {}, body)
+        async with self._slots:
+            while True:
+                reused = bool(self._idle)
+                reader, writer = self._idle.pop() if reused else await self.connect()
+                try:
+                    writer.write(data)
+                    await writer.drain()
+                    status, response_headers = await read_head(reader)
+                    response_body = b"".join([chunk async for chunk in iter_body(reader, status, response_headers)])
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    writer.close()
+                    # 서버가 닫은 유휴 연결이면 새 연결로 한 번 더 보냄
+                    if reused:
+                        continue
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+                if has_framed_body(status, response_headers) and response_headers.get("connection", "").lower() != "close":
+                    self._idle.append((reader, writer))
+                else:
+                    writer.close()
+                return Response(status, response_headers, response_body)
+
+    def close(self):
+        for _, writer in self._idle:
+            writer.close()
+        self._idle.clear()
+
+# 부하와 통계
+
+class OpStats:
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.server_times: List[float] = []
+        self.statuses: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.skipped = 0  # 조회할 작업이 아직 없어 보내지 않은 요청
+
+    def record(self, latency: float, status: int, headers: Dict[str, str]):
+        self.statuses[status] += 1
+        if status >= 400:
+            self.errors[f"HTTP {status}"] += 1
+        else:
+            self.latencies.append(latency)
+        if "x-process-time" in headers:
+            self.server_times.append(float(headers["x-process-time"]))
+
+    def record_error(self, error: BaseException):
+        self.errors[type(error).__name__] += 1
+
+    def report(self, elapsed: float) -> dict:
+        latencies = sorted(self.latencies)
+        server_times = sorted(self.server_times)
+        total = len(self.latencies) + sum(self.errors.values())
+        return {
+            "requests": total,
+            "ok": len(latencies),
+            "throughput": len(latencies) / elapsed if elapsed else 0.0,
+            "errorRate": sum(self.errors.values()) / total if total else 0.0,
+            "latency": {f"p{q}": percentile(latencies, q) for q in (50, 90, 99)} | {"max": latencies[-1] if latencies else None},
+            "serverTime": {f"p{q}": percentile(server_times, q) for q in (50, 99)},
+            "skipped": self.skipped,
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+            "errors": dict(self.errors)
+        }
+
+class StreamStats(OpStats):
+    def __init__(self):
+        super().__init__()
+        self.first_events: List[float] = []
+        self.events = 0
+        self.finished = 0  # 작업이 끝나 서버가 닫은 연결
+        self.open = 0
+        self.peak_open = 0
+
+    def report(self, elapsed: float) -> dict:
+        report = super().report(elapsed)
+        first_events = sorted(self.first_events)
+        report.update({
+            "firstEvent": {f"p{q}": percentile(first_events, q) for q in (50, 99)},
+            "events": self.events,
+            "finished": self.finished,
+            "peakOpen": self.peak_open
+        })
+        return report
+
+class LoadGenerator:
+    def __init__(self, args):
+        self.args = args
+        self.client = HttpClient(args.url, args.connections)
+        self.sizes = [parse_size(size) for size in args.upload_sizes.split(",")]
+        self.job_ids: List[str] = list(args.job_id or [])
+        self.stats = {"upload": OpStats(), "poll": OpStats(), "stream": StreamStats()}
+        self._documents: Dict[int, bytes] = {}
+        self._uploads = 0
+
+    def document(self, size: int) -> bytes:
+        """크기별 본문 (같은 파일로 취급되지 않도록 업로드마다 첫 줄을 다르게 함)"""
+        if size not in self._documents:
+            line = "제{n}조 개인정보 처리자는 개인정보의 처리 목적을 명확하게 하여야 한다.\n"
+            text = "".join(line.format(n=n) for n in range(size // 60 + 1))
+            self._documents[size] = text.encode("utf-8")[:size].decode("utf-8", "ignore").encode("utf-8")
+        body = self._documents[size]
+        if self.args.same_content:
+            return body
+        return f"부하 테스트 문서 {uuid.uuid4()}\n".encode("utf-8") + body
+
+    def schedule(self) -> List[dict]:
+        """부하별 초당 도착 수로 포아송 도착 시각을 만들거나 --trace의 도착 기록을 읽습니다."""
+        if self.args.trace:
+            with open(self.args.trace, encoding="utf-8") as f:
+                arrivals = [json.loads(line) for line in f if line.strip()]
+            for arrival in arrivals:
+                arrival["t"] = float(arrival["t"]) / self.args.speed
+            return sorted(arrivals, key=lambda arrival: arrival["t"])
+
+        arrivals = []
+        for op in OPS:
+            rate = getattr(self.args, f"{op}_rate")
+            t = 0.0
+            while rate > 0:
+                t += random.expovariate(rate)
+                if t >= self.args.duration:
+                    break
+                arrival = {"t": round(t, 4), "op": op}
+                if op == "upload":
+                    arrival["size"] = random.choice(self.sizes)
+                arrivals.append(arrival)
+        return sorted(arrivals, key=lambda arrival: arrival["t"])
+
+    def pick_job(self) -> Optional[str]:
+        # 최근에 올린 작업일수록 진행 중일 가능성이 높음
+        return random.choice(self.job_ids[-self.args.poll_window:]) if self.job_ids else None
+
+    async def upload(self, scheduled: float, size: int):
+        boundary = uuid.uuid4().hex
+        self._uploads += 1
+        body = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="load-{self._uploads}.txt"\r\n'
+            "Content-Type: text/plain\r\n\r\n"
+        ).encode("utf-8") + self.document(size) + f"\r\n--{boundary}--\r\n".encode("utf-8")
+        headers = {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+        if self.args.clients > 1:
+            headers["X-Client-Id"] = f"loadgen-{random.randrange(self.args.clients)}"
+        response = await self.client.request("POST", "/jobs", headers, body)
+        self.stats["upload"].record(time.perf_counter() - scheduled, response.status, response.headers)
+        if response.status < 300:
+            self.job_ids.append(json.loads(response.body)["jobId"])
+
+    async def poll(self, scheduled: float):
+        job_id = self.pick_job()
+        if job_id is None:
+            self.stats["poll"].skipped += 1
+            return
+        response = await self.client.request("GET", f"/jobs/{job_id}")
+        self.stats["poll"].record(time.perf_counter() - scheduled, response.status, response.headers)
+
+    async def stream(self, scheduled: float):
+        stats = self.stats["stream"]
+        job_id = self.pick_job()
+        if job_id is None:
+            stats.skipped += 1
+            return
+        # SSE는 오래 유지되므로 공유 연결을 쓰지 않고 연결을 따로 엶
+        reader, writer = await self.client.connect()
+        stats.open += 1
+        stats.peak_open = max(stats.peak_open, stats.open)
+        try:
+            writer.write(self.client.encode_request("GET", f"/jobs/{job_id}/stream", {"Accept": "text/event-stream"}, b""))
+            await writer.drain()
+            status, headers = await read_head(reader)
+            stats.record(time.perf_counter() - scheduled, status, headers)
+            if status >= 400:
+                return
+            buffer = b""
+            first = True
+            try:
+                async with asyncio.timeout(self.args.stream_hold):
+                    async for chunk in iter_body(reader, status, headers):
+                        buffer += chunk
+                        while b"\n\n" in buffer:
+                            _, buffer = buffer.split(b"\n\n", 1)
+                            stats.events += 1
+                            if first:
+                                stats.first_events.append(time.perf_counter() - scheduled)
+                                first = False
+                    stats.finished += 1
+            except TimeoutError:
+                pass
+        finally:
+            stats.open -= 1
+            writer.close()
+
+    async def run_arrival(self, start: float, arrival: dict):
+        scheduled = start + arrival["t"]
+        op = arrival["op"]
+        try:
+            if op == "upload":
+                coro = self.upload(scheduled, int(arrival.get("size") or self.sizes[0]))
+            elif op == "poll":
+                coro = self.poll(scheduled)
+            else:
+                # SSE 연결은 --stream-hold 동안 유지되므로 요청 타임아웃을 적용하지 않음
+                await self.stream(scheduled)
+                return
+            await asyncio.wait_for(coro, self.args.timeout)
+        except Exception as e:
+            self.stats[op].record_error(e)
+
+    async def run(self) -> dict:
+        arrivals = self.schedule()
+        if self.args.record_trace:
+            with open(self.args.record_trace, "w", encoding="utf-8") as f:
+                for arrival in arrivals:
+                    f.write(json.dumps(arrival) + "\n")
+
+        start = time.perf_counter()
+        tasks = []
+        for arrival in arrivals:
+            delay = start + arrival["t"] - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(self.run_arrival(start, arrival)))
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - start
+        self.client.close()
+        return {
+            "elapsed": elapsed,
+            "arrivals": dict(Counter(arrival["op"] for arrival in arrivals)),
+            "ops": {op: stats.report(elapsed) for op, stats in self.stats.items() if stats.statuses or stats.errors or stats.skipped}
+        }
+
+def _ms(value: Optional[float]) -> str:
+    return f"{value * 1000:8.1f}" if value is not None else "       -"
+
+def print_report(result: dict):
+    print(f"elapsed {result['elapsed']:.1f}s, arrivals {result['arrivals']}")
+    print(f"{'op':<8}{'ok':>7}{'req/s':>9}{'err%':>7}{'p50ms':>9}{'p90ms':>9}{'p99ms':>9}{'srv50':>9}{'srv99':>9}")
+    for op, report in result["ops"].items():
+        latency = report["latency"]
+        server = report["serverTime"]
+        print(
+            f"{op:<8}{report['ok']:>7}{report['throughput']:>9.2f}{report['errorRate'] * 100:>7.1f}"
+            f"{_ms(latency['p50'])} {_ms(latency['p90'])} {_ms(latency['p99'])} {_ms(server['p50'])} {_ms(server['p99'])}"
+        )
+        if report["errors"]:
+            print(f"{'':<8}errors: {report['errors']}")
+        if report["skipped"]:
+            print(f"{'':<8}skipped (no job yet): {report['skipped']}")
+        if op == "stream":
+            print(
+                f"{'':<8}first event p50/p99 {_ms(report['firstEvent']['p50']).strip()}/{_ms(report['firstEvent']['p99']).strip()}ms, "
+                f"events {report['events']}, finished {report['finished']}, peak open {report['peakOpen']}"
+            )
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--duration", type=float, default=30.0, help="도착 시각을 만드는 구간 (초)")
+    parser.add_argument("--upload-rate", type=float, default=1.0, help="초당 업로드 수")
+    parser.add_argument("--poll-rate", type=float, default=10.0, help="초당 상태 조회 수")
+    parser.add_argument("--stream-rate", type=float, default=0.5, help="초당 새 SSE 연결 수")
+    parser.add_argument("--upload-sizes", default="4k,64k,512k", help="업로드 파일 크기 목록 (예: 1k,100k,1m)")
+    parser.add_argument("--same-content", action="store_true", help="크기가 같으면 같은 내용으로 업로드 (중복 파일 재사용 경로)")
+    parser.add_argument("--job-id", action="append", help="조회/SSE 대상으로 쓸 기존 작업 ID (여러 번 지정 가능)")
+    parser.add_argument("--poll-window", type=int, default=50, help="조회/SSE 대상으로 고를 최근 작업 수")
+    parser.add_argument("--stream-hold", type=float, default=30.0, help="SSE 연결을 유지하는 최대 시간 (초)")
+    parser.add_argument("--connections", type=int, default=32, help="업로드/조회에 쓰는 최대 동시 연결 수")
+    parser.add_argument("--clients", type=int, default=1, help="X-Client-Id를 나눠 쓰는 가상 클라이언트 수")
+    parser.add_argument("--timeout", type=float, default=60.0, help="요청 타임아웃 (초)")
+    parser.add_argument("--trace", help="재생할 도착 기록 (JSON Lines)")
+    parser.add_argument("--speed", type=float, default=1.0, help="도착 기록 재생 배속")
+    parser.add_argument("--record-trace", help="이번 실행의 도착 시각을 저장할 파일")
+    parser.add_argument("--seed", type=int, help="도착 시각 난수 시드")
+    parser.add_argument("--json", help="결과를 JSON으로 저장할 파일")
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    result = asyncio.run(LoadGenerator(args).run())
+    print_report(result)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+if __name__ == "__main__":
+    main()
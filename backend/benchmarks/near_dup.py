@@ -0,0 +1,95 @@
+"""유사 문서 색인(MinHash LSH)의 조회 지연 시간을 측정하는 벤치마크입니다.
+
+색인에 무작위 서명 N개를 넣은 뒤, 색인된 서명을 일부 바꾼 유사 문서 조회와 색인에 없는 문서 조회의
+지연 시간(p50/p99)을 측정합니다. 색인 키를 직접 쓰므로 비어 있는 별도 Redis DB를 사용하세요.
+
+사용 예:
+    python benchmarks/near_dup.py --redis-url redis://localhost:6379/15                  # 문서 1,000,000개
+    python benchmarks/near_dup.py --redis-url redis://localhost:6379/15 --docs 100000 --skip-load
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from redis import Redis  # noqa: E402
+from app.core import near_dup  # noqa: E402
+
+def random_signature(rng: random.Random) -> list:
+    return [rng.getrandbits(25) for _ in range(near_dup.SIGNATURE_SIZE)]
+
+def perturb(signature: list, rng: random.Random, changed: int) -> list:
+    """서명의 일부 값을 바꿔 유사 문서를 흉내냅니다 (바꾼 비율만큼 유사도가 낮아짐)."""
+    result = list(signature)
+    for i in rng.sample(range(len(result)), changed):
+        result[i] = rng.getrandbits(25)
+    return result
+
+def load(redis: Redis, docs: int, seed: int, batch: int = 2000):
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    pipe = redis.pipeline(transaction=False)
+    for i in range(docs):
+        signature = random_signature(rng)
+        pipe.hset(near_dup.SIGNATURES_KEY, f"job-{i}", near_dup._pack(signature))
+        for band, field in enumerate(near_dup.band_fields(signature)):
+            pipe.hset(near_dup.BAND_KEY.format(band=band), field, f"job-{i}")
+        if (i + 1) % batch == 0:
+            pipe.execute()
+        if (i + 1) % 100000 == 0:
+            print(f"  indexed {i + 1} docs ({time.perf_counter() - started:.0f}s)")
+    pipe.execute()
+
+def measure(redis: Redis, queries: list, threshold: float) -> dict:
+    samples = []
+    found = 0
+    for signature in queries:
+        start = time.perf_counter()
+        if near_dup.find_near_duplicate(redis, signature, threshold):
+            found += 1
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "p50_ms": statistics.median(samples),
+        "p99_ms": samples[int(len(samples) * 0.99) - 1],
+        "found": found / len(queries)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--redis-url", required=True)
+    parser.add_argument("--docs", type=int, default=1000000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--threshold", type=float, default=0.9)
+    parser.add_argument("--changed", type=int, default=6, help="유사 문서 조회에서 바꿀 서명 값 수 (128개 중)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--skip-load", action="store_true", help="이미 색인된 문서로 측정")
+    args = parser.parse_args()
+
+    redis = Redis.from_url(args.redis_url, decode_responses=True)
+    if not args.skip_load:
+        print(f"indexing {args.docs} docs...")
+        load(redis, args.docs, args.seed)
+    print(f"used_memory={redis.info('memory')['used_memory_human']}")
+
+    # 색인할 때와 같은 시드로 서명을 다시 만들어 유사 문서 조회에 사용
+    rng = random.Random(args.seed)
+    picks = set(random.Random(args.seed + 1).sample(range(args.docs), min(args.queries, args.docs)))
+    indexed = [sig for i in range(max(picks) + 1) for sig in [random_signature(rng)] if i in picks]
+    query_rng = random.Random(args.seed + 2)
+    near = [perturb(sig, query_rng, args.changed) for sig in indexed]
+    misses = [random_signature(query_rng) for _ in range(args.queries)]
+
+    # 연결을 미리 맺어 첫 조회에 연결 시간이 포함되지 않도록 함
+    redis.ping()
+    for name, queries in (("near-duplicate", near), ("miss", misses)):
+        result = measure(redis, queries, args.threshold)
+        print(f"{name:<15} p50={result['p50_ms']:.3f}ms  p99={result['p99_ms']:.3f}ms  found={result['found']:.1%}")
+
+if __name__ == "__main__":
+    main()
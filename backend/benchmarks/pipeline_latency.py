@@ -0,0 +1,85 @@
+"""순차/병렬 에이전트 파이프라인의 작업당 지연 시간을 가짜 에이전트로 비교하는 벤치마크입니다.
+
+가짜 에이전트 서버(benchmarks/fake_agent.py)를 같은 프로세스에서 띄우고, 워커와 같은
+run_agent_pipeline()으로 문서를 처리해 파이프라인별 지연 시간(p50/p95)을 측정합니다.
+Redis와 DB는 사용하지 않습니다.
+
+사용 예:
+    python benchmarks/pipeline_latency.py
+    python benchmarks/pipeline_latency.py --summary-latency 4 --checklist-latency 3 --jitter 0.5 --jobs 50
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.join(BACKEND_DIR, "benchmarks"))
+
+from aiohttp import web  # noqa: E402
+from fake_agent import build_app  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.tasks import process_guideline as tasks  # noqa: E402
+
+# (이름, 파이프라인, 보정 단계 실행 여부)
+MODES = (
+    ("sequential", "sequential", False),
+    ("parallel", "parallel", False),
+    ("parallel+reconcile", "parallel", True),
+)
+
+async def measure(pipeline: str, reconcile: bool, jobs: int, concurrency: int, document: str) -> list:
+    settings.AGENT_RECONCILE = reconcile
+    semaphore = asyncio.Semaphore(concurrency)
+    samples = []
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            result = await tasks.run_agent_pipeline(document, pipeline)
+            samples.append(time.perf_counter() - start)
+            assert result["checklist"], "empty checklist"
+
+    await asyncio.gather(*(one() for _ in range(jobs)))
+    return sorted(samples)
+
+async def run(args):
+    runner = web.AppRunner(build_app(args))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", args.port)
+    await site.start()
+    tasks.AGENT_SERVER_URL = f"http://127.0.0.1:{args.port}"
+
+    document = "개인정보 처리 지침 본문입니다. " * 200
+    try:
+        results = {}
+        for name, pipeline, reconcile in MODES:
+            samples = await measure(pipeline, reconcile, args.jobs, args.concurrency, document)
+            results[name] = samples
+            p50 = statistics.median(samples)
+            p95 = samples[max(int(len(samples) * 0.95) - 1, 0)]
+            print(f"{name:<20} p50={p50:.2f}s  p95={p95:.2f}s  mean={statistics.mean(samples):.2f}s")
+        base = statistics.median(results["sequential"])
+        for name in ("parallel", "parallel+reconcile"):
+            print(f"{name} vs sequential: p50 {statistics.median(results[name]) / base - 1:+.0%}")
+    finally:
+        await runner.cleanup()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=18001)
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--summary-latency", type=float, default=2.0, help="요약 단계 지연 (초)")
+    parser.add_argument("--checklist-latency", type=float, default=1.5, help="체크리스트 단계 지연 (초)")
+    parser.add_argument("--reconcile-latency", type=float, default=0.3, help="체크리스트 보정 단계 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.2, help="지연 시간 변동폭 (초)")
+    # fake_agent.build_app이 사용하는 나머지 설정
+    parser.set_defaults(fail_rate=0.0, max_concurrency=0, checklist_items=5)
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
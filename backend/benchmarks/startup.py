@@ -0,0 +1,113 @@
+"""API/워커 프로세스의 기동 시간을 측정하는 벤치마크입니다.
+
+사용 예:
+    python benchmarks/startup.py                 # 모듈 임포트 시간만 측정
+    python benchmarks/startup.py --serve         # uvicorn 기동 후 첫 응답까지 측정
+    python benchmarks/startup.py --worker        # celery 워커 ready까지 측정 (Redis 필요)
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _env():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = BACKEND_DIR + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+def time_import(module: str, repeat: int) -> list:
+    """새 인터프리터에서 모듈 임포트에 걸리는 시간을 측정합니다."""
+    samples = []
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=BACKEND_DIR, env=_env(), capture_output=True, text=True, check=True
+        )
+        samples.append(float(out.stdout.strip().splitlines()[-1]))
+    return samples
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def time_uvicorn(repeat: int, timeout: float) -> list:
+    """uvicorn app.main:app 기동부터 첫 HTTP 응답까지의 시간을 측정합니다."""
+    samples = []
+    for _ in range(repeat):
+        port = _free_port()
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port)],
+            cwd=BACKEND_DIR, env=_env(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        try:
+            while time.perf_counter() - start < timeout:
+                try:
+                    urllib.request.urlopen(f"http://127.0.0.1:{port}/openapi.json", timeout=0.5)
+                    samples.append(time.perf_counter() - start)
+                    break
+                except OSError:
+                    time.sleep(0.01)
+            else:
+                raise RuntimeError("uvicorn did not become ready in time")
+        finally:
+            proc.terminate()
+            proc.wait()
+    return samples
+
+def time_worker(repeat: int, timeout: float) -> list:
+    """celery_worker.py 기동부터 'ready' 로그까지의 시간을 측정합니다."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            [sys.executable, "celery_worker.py", "worker", "--loglevel=info", "--pool=solo",
+             "-Q", "main-queue", "-n", f"startup-bench-{os.getpid()}@%h"],
+            cwd=BACKEND_DIR, env=_env(), stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+        )
+        try:
+            for line in proc.stdout:
+                if "ready." in line:
+                    samples.append(time.perf_counter() - start)
+                    break
+                if time.perf_counter() - start > timeout:
+                    raise RuntimeError("celery worker did not become ready in time")
+            else:
+                raise RuntimeError("celery worker exited before becoming ready")
+        finally:
+            proc.terminate()
+            proc.wait()
+    return samples
+
+def report(name: str, samples: list):
+    print(
+        f"{name:<32} n={len(samples):<3} "
+        f"median={statistics.median(samples) * 1000:8.1f}ms "
+        f"min={min(samples) * 1000:8.1f}ms max={max(samples) * 1000:8.1f}ms"
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--serve", action="store_true", help="uvicorn 기동 시간 측정")
+    parser.add_argument("--worker", action="store_true", help="celery 워커 기동 시간 측정")
+    args = parser.parse_args()
+
+    report("import app.main", time_import("app.main", args.repeat))
+    report("import celery_worker", time_import("celery_worker", args.repeat))
+    if args.serve:
+        report("uvicorn app.main:app ready", time_uvicorn(args.repeat, args.timeout))
+    if args.worker:
+        report("celery_worker.py ready", time_worker(args.repeat, args.timeout))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""TXT 추출 백엔드(txt-stream, chardet)의 처리량(MB/s)을 비교하는 벤치마크입니다.
+
+파일을 주지 않으면 UTF-8/CP949 한국어 문서와 한글이 드문 CP949 로그 파일을 생성해 측정합니다.
+chardet 백엔드는 파일 전체를 감지하므로 큰 파일에서는 오래 걸립니다 (--skip-chardet으로 생략).
+
+사용 예:
+    python benchmarks/txt_extract.py                       # 20MB 파일 생성 후 측정
+    python benchmarks/txt_extract.py --size-mb 200 --skip-chardet
+    python benchmarks/txt_extract.py path/to/file.txt
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.extractors import get_backends  # noqa: E402
+
+LINE = "제3조(개인정보의 처리 목적) 회사는 다음의 목적을 위하여 개인정보를 처리합니다. Version 2.1\n"
+# 대부분 ASCII이고 한글이 드물게 섞인 파일 (전체 감지 방식이 가장 느린 경우)
+LOG_LINE = "2024-01-01 INFO request handled path=/api/v1/items status=200 duration=12ms\n"
+
+def generate(directory: str, size_mb: float) -> list:
+    """UTF-8/CP949 벤치마크 파일과 한글이 드문 CP949 로그 파일을 생성합니다."""
+    paths = []
+    text = LINE * int(size_mb * 1e6 / len(LINE.encode("utf-8")))
+    for encoding in ("utf-8", "cp949"):
+        path = os.path.join(directory, f"benchmark-{encoding}.txt")
+        with open(path, "w", encoding=encoding) as f:
+            f.write(text)
+        paths.append(path)
+
+    path = os.path.join(directory, "benchmark-log-cp949.txt")
+    with open(path, "w", encoding="cp949") as f:
+        for i in range(int(size_mb * 1e6 / len(LOG_LINE))):
+            f.write(LOG_LINE)
+            if i % 1000 == 0:
+                f.write("참고: 개인정보 처리 로그\n")
+    paths.append(path)
+    return paths
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="*")
+    parser.add_argument("--size-mb", type=float, default=20)
+    parser.add_argument("--skip-chardet", action="store_true")
+    args = parser.parse_args()
+
+    paths = args.paths or generate(tempfile.mkdtemp(), args.size_mb)
+    backends = [b for b in get_backends("txt") if not (args.skip_chardet and b.name == "chardet")]
+    for path in paths:
+        size = os.path.getsize(path)
+        print(f"{os.path.basename(path)} ({size / 1e6:.1f}MB)")
+        reference = None
+        for backend in backends:
+            start = time.perf_counter()
+            text = backend.func(path)
+            elapsed = time.perf_counter() - start
+            same = "" if reference is None else f"  same_text={text == reference}"
+            reference = text if reference is None else reference
+            print(f"  {backend.name:<10} {elapsed:7.2f}s  {size / elapsed / 1e6:8.1f} MB/s{same}")
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,2 @@
-CREATE DATABASE guideline_db;
-\c guideline_db;
-
-CREATE TABLE IF NOT EXISTS jobs (
-    id VARCHAR(255) PRIMARY KEY,
-    status VARCHAR(50) NOT NULL,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-    result JSONB
-); 
\ No newline at end of file
+-- guideline_db 데이터베이스는 POSTGRES_DB 환경 변수로 생성됩니다.
+-- 테이블 스키마는 backend 시작 시 `alembic upgrade head`로 생성/갱신됩니다.
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, text
@@ -12,6 +13,226 @@ import redis
 from unittest.mock import MagicMock, patch
 from app.core.celery_app import celery_app
 
+class FakeRedis:
+    """단위 테스트에서 사용하는 명령만 구현한 메모리 Redis
+
+    decode_responses=True인 클라이언트처럼 값을 문자열로 돌려줍니다. 종류와 관계없이 모든 키는 data에 두고
+    (해시와 정렬 집합은 dict, 집합은 set, 리스트는 list), 만료 시간은 ttls에 기록만 합니다.
+    """
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    def _drop_if_empty(self, key):
+        # 실제 Redis처럼 비어 있는 해시, 집합, 리스트 키는 사라짐
+        if key in self.data and not self.data[key]:
+            self.delete(key)
+
+    # 문자열
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = str(value)
+        self.ttls.pop(key, None)
+        if ex is not None:
+            self.ttls[key] = ex
+        return True
+
+    def mget(self, keys, *args):
+        keys = [keys, *args] if isinstance(keys, str) else list(keys)
+        return [self.data.get(key) for key in keys]
+
+    def incr(self, key, amount=1):
+        self.data[key] = str(int(self.data.get(key, 0)) + amount)
+        return int(self.data[key])
+
+    def delete(self, *keys):
+        deleted = 0
+        for key in keys:
+            self.ttls.pop(key, None)
+            if self.data.pop(key, None) is not None:
+                deleted += 1
+        return deleted
+
+    def expire(self, key, seconds):
+        if key not in self.data:
+            return False
+        self.ttls[key] = seconds
+        return True
+
+    # 해시
+
+    def hset(self, key, field=None, value=None, mapping=None):
+        values = self.data.setdefault(key, {})
+        items = dict(mapping or {})
+        if field is not None:
+            items[field] = value
+        added = sum(1 for name in items if name not in values)
+        values.update({name: str(item) for name, item in items.items()})
+        return added
+
+    def hget(self, key, field):
+        return self.data.get(key, {}).get(field)
+
+    def hmget(self, key, fields, *args):
+        fields = [fields, *args] if isinstance(fields, str) else list(fields)
+        return [self.data.get(key, {}).get(field) for field in fields]
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def hscan_iter(self, key, count=None):
+        yield from list(self.data.get(key, {}).items())
+
+    def hdel(self, key, *fields):
+        values = self.data.get(key, {})
+        deleted = sum(1 for field in fields if values.pop(field, None) is not None)
+        self._drop_if_empty(key)
+        return deleted
+
+    def hincrby(self, key, field, amount=1):
+        values = self.data.setdefault(key, {})
+        values[field] = str(int(values.get(field, 0)) + amount)
+        return int(values[field])
+
+    def hincrbyfloat(self, key, field, amount=1.0):
+        values = self.data.setdefault(key, {})
+        values[field] = str(float(values.get(field, 0)) + amount)
+        return float(values[field])
+
+    # 집합
+
+    def sadd(self, key, *members):
+        values = self.data.setdefault(key, set())
+        added = len(set(members) - values)
+        values.update(members)
+        return added
+
+    def srem(self, key, *members):
+        values = self.data.get(key, set())
+        removed = len(values & set(members))
+        values.difference_update(members)
+        self._drop_if_empty(key)
+        return removed
+
+    def smembers(self, key):
+        return set(self.data.get(key, set()))
+
+    # 리스트
+
+    def rpush(self, key, *values):
+        self.data.setdefault(key, []).extend(str(value) for value in values)
+        return len(self.data[key])
+
+    def lpush(self, key, *values):
+        items = self.data.setdefault(key, [])
+        for value in values:
+            items.insert(0, str(value))
+        return len(items)
+
+    @staticmethod
+    def _slice(items, start, end):
+        end = len(items) + end if end < 0 else end
+        return items[start:end + 1]
+
+    def lrange(self, key, start, end):
+        return self._slice(self.data.get(key, []), start, end)
+
+    def ltrim(self, key, start, end):
+        if key in self.data:
+            self.data[key] = self._slice(self.data[key], start, end)
+            self._drop_if_empty(key)
+        return True
+
+    def llen(self, key):
+        return len(self.data.get(key, []))
+
+    # 정렬 집합
+
+    def _sorted(self, key):
+        return sorted(self.data.get(key, {}).items(), key=lambda item: (item[1], item[0]))
+
+    def zadd(self, key, mapping, nx=False, xx=False):
+        scores = self.data.setdefault(key, {})
+        added = 0
+        for member, score in mapping.items():
+            if (nx and member in scores) or (xx and member not in scores):
+                continue
+            added += member not in scores
+            scores[member] = float(score)
+        self._drop_if_empty(key)
+        return added
+
+    def zscore(self, key, member):
+        return self.data.get(key, {}).get(member)
+
+    def zrank(self, key, member):
+        members = [name for name, _ in self._sorted(key)]
+        return members.index(member) if member in members else None
+
+    def zrem(self, key, *members):
+        scores = self.data.get(key, {})
+        removed = sum(1 for member in members if scores.pop(member, None) is not None)
+        self._drop_if_empty(key)
+        return removed
+
+    def zcard(self, key):
+        return len(self.data.get(key, {}))
+
+    def zrange(self, key, start, end, withscores=False):
+        items = self._slice(self._sorted(key), start, end)
+        return items if withscores else [member for member, _ in items]
+
+    def zrangebyscore(self, key, low, high, start=None, num=None, withscores=False):
+        low, high = float(low), float(high)
+        items = [(member, score) for member, score in self._sorted(key) if low <= score <= high]
+        if start is not None:
+            items = items[start:start + num if num is not None and num >= 0 else None]
+        return items if withscores else [member for member, _ in items]
+
+    def zremrangebyscore(self, key, low, high):
+        return self.zrem(key, *self.zrangebyscore(key, low, high)) if self.zcard(key) else 0
+
+    def zremrangebyrank(self, key, start, end):
+        members = self._slice([member for member, _ in self._sorted(key)], start, end)
+        return self.zrem(key, *members) if members else 0
+
+    def zpopmin(self, key, count=1):
+        popped = self._sorted(key)[:count]
+        if popped:
+            self.zrem(key, *[member for member, _ in popped])
+        return popped
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+class FakePipeline:
+    """명령을 모아 두었다가 execute()에서 차례로 실행하고 결과 목록을 반환합니다."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+        return queue
+
+    def execute(self):
+        calls, self.calls = self.calls, []
+        return [getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in calls]
+
+@pytest.fixture
+def fake_redis():
+    """테스트마다 새 메모리 Redis를 제공합니다."""
+    return FakeRedis()
+
 @pytest.fixture(scope="function")
 def mock_redis():
     """Redis 연결을 모킹합니다."""
@@ -27,6 +248,17 @@ def setup_redis_mock(mock_redis):
     with patch('app.tasks.process_guideline.redis_client', mock_redis):
         yield
 
+@pytest.fixture(scope="function", autouse=True)
+def setup_event_loop():
+    """작업이 asyncio.get_event_loop()로 루프를 가져오므로 테스트마다 새 루프를 설정합니다.
+
+    앞선 테스트의 asyncio.run()이 현재 루프를 비워 두면 get_event_loop()가 실패합니다.
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield
+    loop.close()
+
 @pytest.fixture(scope="function", autouse=True)
 def setup_celery():
     """Celery 설정을 테스트 환경에 맞게 수정합니다."""
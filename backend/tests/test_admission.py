@@ -0,0 +1,75 @@
+import time
+import pytest
+from app.core import metrics
+from app.core.admission import AdmissionRejected, check_admission
+from app.core.config import settings
+
+@pytest.fixture
+def snapshot(monkeypatch):
+    """갱신되지 않는 부하 지표 스냅샷"""
+    snap = metrics.LoadSnapshot()
+    snap.fetched_at = time.monotonic()
+    monkeypatch.setattr(metrics, "_load_snapshot", snap)
+    monkeypatch.setattr(settings, "ADMISSION_CACHE_TTL", 3600.0)
+    monkeypatch.setattr(settings, "CLIENT_QUOTA_PER_MINUTE", 0)
+    return snap
+
+def test_admits_under_limits(snapshot, monkeypatch):
+    """한도 이내이면 접수하고 캐시된 대기열 길이를 증가"""
+    monkeypatch.setattr(settings, "ADMISSION_MAX_QUEUE_DEPTH", 100)
+    snapshot.queue_depth = 10
+    check_admission("client")
+    assert snapshot.queue_depth == 11
+
+def test_rejects_full_queue_with_retry_after(snapshot, monkeypatch):
+    """대기열이 가득 차면 처리량 기반 Retry-After와 함께 503"""
+    monkeypatch.setattr(settings, "ADMISSION_MAX_QUEUE_DEPTH", 100)
+    snapshot.queue_depth = 109
+    snapshot.throughput = 0.5  # 초당 0.5건
+
+    with pytest.raises(AdmissionRejected) as exc_info:
+        check_admission("client")
+
+    assert exc_info.value.status_code == 503
+    # 초과분 10건 / 0.5건/초 = 20초
+    assert exc_info.value.retry_after == 20
+
+def test_rejects_long_backlog(snapshot, monkeypatch):
+    """예상 대기 시간이 한도를 넘으면 503"""
+    monkeypatch.setattr(settings, "ADMISSION_MAX_QUEUE_DEPTH", 0)
+    monkeypatch.setattr(settings, "ADMISSION_MAX_BACKLOG_SECONDS", 600)
+    snapshot.queue_depth = 20
+    snapshot.throughput = 0.0
+    snapshot.avg_duration = 60.0  # 처리량 기록이 없으면 평균 처리 시간 사용
+
+    with pytest.raises(AdmissionRejected) as exc_info:
+        check_admission("client")
+
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.retry_after == 600
+
+def test_rejects_low_disk(snapshot, monkeypatch):
+    """업로드 볼륨 여유 공간이 부족하면 503"""
+    monkeypatch.setattr(settings, "ADMISSION_MIN_FREE_DISK_MB", 100)
+    snapshot.free_disk_bytes = 10 * 1024 * 1024
+
+    with pytest.raises(AdmissionRejected) as exc_info:
+        check_admission("client")
+
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.retry_after == settings.ADMISSION_DISK_RETRY_AFTER
+
+def test_staged_pipeline_counts_stage_queues(snapshot, fake_redis, monkeypatch):
+    """단계별 파이프라인에서는 main-queue가 비어 있어도 agent-queue가 가득 차면 503"""
+    monkeypatch.setattr(settings, "STAGED_PIPELINE", True)
+    monkeypatch.setattr(settings, "ADMISSION_MAX_QUEUE_DEPTH", 5)
+    monkeypatch.setattr(metrics, "get_redis", lambda: fake_redis)
+    monkeypatch.setattr(metrics, "get_broker_redis", lambda: fake_redis)
+    fake_redis.rpush("agent-queue", *[f"message-{i}" for i in range(5)])
+    snapshot.fetched_at = float("-inf")
+
+    with pytest.raises(AdmissionRejected) as exc_info:
+        check_admission("client")
+
+    assert exc_info.value.status_code == 503
+    assert snapshot.queue_depth == 5
@@ -0,0 +1,109 @@
+import asyncio
+import json
+import pytest
+from app.tasks import process_guideline as tasks
+from app.tasks.agent_output import STAGES, AgentOutputError, decode_stage_output
+
+SUMMARY = {"topic": "개인정보 처리", "purpose": "처리 기준 안내", "key_points": ["수집 목적 명시", "보관 기간 준수"]}
+CHECKLIST = {"items": [{"text": "수집 목적을 고지했는가", "priority": "high", "category": "법적 의무"}]}
+
+def stage_event(author, key, value):
+    return {"author": author, "actions": {"stateDelta": {key: value}}}
+
+def test_decode_accepts_json_text_and_code_fence():
+    """JSON 문자열과 코드 블록으로 감싼 JSON을 모두 검증"""
+    summary_stage, checklist_stage = STAGES
+    summary = decode_stage_output(summary_stage, json.dumps(SUMMARY, ensure_ascii=False))
+    assert summary.render().splitlines() == [
+        "[주제] 개인정보 처리", "[목적] 처리 기준 안내", "[주요 내용]", "1. 수집 목적 명시", "2. 보관 기간 준수"
+    ]
+
+    fenced = "```json\n" + json.dumps(CHECKLIST, ensure_ascii=False) + "\n```"
+    checklist = decode_stage_output(checklist_stage, fenced)
+    assert checklist.items[0].priority == "high"
+
+@pytest.mark.parametrize("value", [None, "1. 번호 목록", {"items": []}, {"items": [{"text": "항목", "priority": "urgent"}]}])
+def test_decode_rejects_schema_violations(value):
+    with pytest.raises(AgentOutputError):
+        decode_stage_output(STAGES[1], value)
+
+def test_only_malformed_stage_is_retried(monkeypatch):
+    """체크리스트 출력 형식이 잘못되면 체크리스트 단계만 요약을 참고해 다시 실행"""
+    calls = []
+
+    async def fake_create_session(app_name=tasks.AGENT_APP_NAME, state=None):
+        calls.append(("session", app_name, state))
+        return "session-id"
+
+    async def fake_run_agent(app_name, session_id, content):
+        calls.append(("run", app_name))
+        if app_name == tasks.AGENT_APP_NAME:
+            return [
+                stage_event("summary_agent", "summary", json.dumps(SUMMARY)),
+                stage_event("checklist_agent", "checklist", "1. 형식이 잘못된 체크리스트")
+            ]
+        return [stage_event("checklist_agent", "checklist", json.dumps(CHECKLIST))]
+
+    monkeypatch.setattr(tasks, "create_agent_session", fake_create_session)
+    monkeypatch.setattr(tasks, "run_agent", fake_run_agent)
+    monkeypatch.setattr(tasks, "record_metric", lambda *args: None)
+
+    result = asyncio.run(tasks.process_with_agent("session-id", "문서 본문"))
+
+    assert result["checklist"] == CHECKLIST["items"]
+    assert result["summary"].startswith("[주제] 개인정보 처리")
+    assert [call for call in calls if call[0] == "run"] == [("run", "guideline_agent"), ("run", "guideline_checklist")]
+    _, app_name, state = next(call for call in calls if call[0] == "session")
+    assert app_name == "guideline_checklist"
+    assert json.loads(state["summary"])["topic"] == "개인정보 처리"
+
+def test_stage_retries_are_bounded(monkeypatch):
+    """단계를 AGENT_STAGE_MAX_ATTEMPTS번 실행해도 형식이 잘못되면 영구 오류로 실패"""
+    runs = []
+
+    async def fake_create_session(app_name=tasks.AGENT_APP_NAME, state=None):
+        return "session-id"
+
+    async def fake_run_agent(app_name, session_id, content):
+        runs.append(app_name)
+        return [stage_event("summary_agent", "summary", "not json")]
+
+    monkeypatch.setattr(tasks, "create_agent_session", fake_create_session)
+    monkeypatch.setattr(tasks, "run_agent", fake_run_agent)
+    monkeypatch.setattr(tasks, "record_metric", lambda *args: None)
+    monkeypatch.setattr(tasks.settings, "AGENT_STAGE_MAX_ATTEMPTS", 3)
+
+    with pytest.raises(AgentOutputError, match="summary"):
+        asyncio.run(tasks.process_with_agent("session-id", "문서 본문"))
+    assert runs == ["guideline_agent", "guideline_summary", "guideline_summary"]
+
+@pytest.mark.parametrize("reconciled", [True, False])
+def test_parallel_pipeline_with_reconcile(monkeypatch, reconciled):
+    """병렬 파이프라인 뒤의 보정 단계는 요약과 체크리스트를 상태로 받고, 출력이 잘못되면 원래 체크리스트를 사용"""
+    runs = []
+    reconciled_items = {"items": [{"text": "보정된 항목", "priority": "medium", "category": "검증"}]}
+
+    async def fake_create_session(app_name=tasks.AGENT_APP_NAME, state=None):
+        runs.append(("session", app_name, state))
+        return "session-id"
+
+    async def fake_run_agent(app_name, session_id, content):
+        runs.append(("run", app_name, None))
+        if app_name == "guideline_parallel":
+            return [
+                stage_event("checklist_agent", "checklist", json.dumps(CHECKLIST)),
+                stage_event("summary_agent", "summary", json.dumps(SUMMARY))
+            ]
+        return [stage_event("reconcile_agent", "checklist", json.dumps(reconciled_items) if reconciled else "not json")]
+
+    monkeypatch.setattr(tasks, "create_agent_session", fake_create_session)
+    monkeypatch.setattr(tasks, "run_agent", fake_run_agent)
+    monkeypatch.setattr(tasks, "record_metric", lambda *args: None)
+    monkeypatch.setattr(tasks.settings, "AGENT_RECONCILE", True)
+
+    result = asyncio.run(tasks.run_agent_pipeline("문서 본문", "parallel"))
+
+    assert [app for kind, app, _ in runs if kind == "run"] == ["guideline_parallel", "guideline_reconcile"]
+    _, _, state = runs[2]
+    assert json.loads(state["checklist"]) == CHECKLIST
+    assert result["checklist"] == (reconciled_items if reconciled else CHECKLIST)["items"]
@@ -0,0 +1,38 @@
+from app.core.autoscale import compute_target_concurrency
+
+def _target(**kwargs):
+    params = {
+        "queue_depth": 0,
+        "active": 0,
+        "avg_duration": 60.0,
+        "agent_headroom": -1,
+        "min_concurrency": 1,
+        "max_concurrency": 8,
+        "target_drain_seconds": 600.0,
+    }
+    params.update(kwargs)
+    return compute_target_concurrency(**params)
+
+def test_empty_queue_scales_to_min():
+    """대기열이 비어 있으면 최소 동시성으로 축소"""
+    assert _target() == 1
+
+def test_backlog_scales_with_duration():
+    """대기열을 목표 시간 안에 비울 수 있는 만큼 확장"""
+    # 40개 * 60초 / 600초 = 4
+    assert _target(queue_depth=40) == 4
+    # 최대값을 넘지 않음
+    assert _target(queue_depth=1000) == 8
+
+def test_target_never_exceeds_backlog():
+    """처리할 작업 수보다 많은 프로세스는 만들지 않음"""
+    assert _target(queue_depth=2, avg_duration=3600.0) == 2
+
+def test_agent_headroom_limits_scale_up():
+    """에이전트 호출 여유량 이상으로 확장하지 않음"""
+    assert _target(queue_depth=1000, active=2, agent_headroom=1) == 3
+    assert _target(queue_depth=1000, active=0, agent_headroom=0, min_concurrency=1) == 1
+
+def test_backlog_split_across_workers():
+    """여러 워커가 있으면 필요한 동시성을 나눠서 담당"""
+    assert _target(queue_depth=40, worker_count=2) == 2
@@ -0,0 +1,70 @@
+import hashlib
+import io
+import os
+import pytest
+from app.storage import BlobNotFound, LocalBlobStore, acquire_blob, release_blob
+from app.storage.refs import BLOB_REFS_KEY
+from app.storage.sweeper import sweep
+
+@pytest.fixture
+def store(tmp_path):
+    return LocalBlobStore(str(tmp_path / "blobs"))
+
+def test_put_deduplicates_by_content(store):
+    """같은 내용은 한 번만 저장되고 같은 다이제스트를 반환"""
+    content = b"guideline " * 1000
+    first = store.put(io.BytesIO(content))
+    second = store.put(io.BytesIO(content))
+
+    assert first.digest == hashlib.sha256(content).hexdigest()
+    assert first.created and not second.created
+    assert first.size == len(content)
+    assert [blob.digest for blob in store.iter_blobs()] == [first.digest]
+    assert not os.listdir(store.tmp_dir)
+
+    with store.open_path(first.digest) as path:
+        with open(path, "rb") as f:
+            assert f.read() == content
+    with store.open_mmap(first.digest) as mapped:
+        assert mapped[:9] == b"guideline"
+
+def test_open_path_rejects_missing_or_invalid_digest(store):
+    with pytest.raises(BlobNotFound):
+        with store.open_path("0" * 64):
+            pass
+    with pytest.raises(ValueError):
+        with store.open_path("../etc/passwd"):
+            pass
+
+def test_sweep_keeps_referenced_and_recent_blobs(store, fake_redis):
+    """미완료 작업이 참조하거나 보관 기간이 지나지 않은 파일은 유지"""
+    redis = fake_redis
+    blob = store.put(io.BytesIO(b"content"))
+    acquire_blob(redis, blob.digest, "job-1", blob.size)
+    redis.hset("job:job-1", "status", "processing")
+    far_future = blob_mtime(store, blob.digest) + 10_000
+
+    stats = sweep(store, redis, retention=60, now=far_future)
+    assert stats["referenced"] == 1 and store.exists(blob.digest)
+
+    release_blob(redis, blob.digest, "job-1")
+    stats = sweep(store, redis, retention=60)
+    assert stats["retained"] == 1 and store.exists(blob.digest)
+
+def test_sweep_deletes_expired_and_drops_stale_refs(store, fake_redis):
+    """끝난 작업의 남은 참조는 정리하고 보관 기간이 지난 파일을 삭제"""
+    redis = fake_redis
+    blob = store.put(io.BytesIO(b"content"))
+    acquire_blob(redis, blob.digest, "job-1", blob.size)
+    redis.hset("job:job-1", "status", "completed")  # 참조 해제 누락
+
+    stats = sweep(store, redis, retention=60, dry_run=True, now=blob_mtime(store, blob.digest) + 120)
+    assert stats["deleted"] == 1 and store.exists(blob.digest)
+
+    stats = sweep(store, redis, retention=60, now=float(redis.hget(f"blob:{blob.digest}", "last_released_at")) + 120)
+    assert stats == {"scanned": 1, "referenced": 0, "retained": 0, "deleted": 1, "bytesFreed": 7}
+    assert not store.exists(blob.digest)
+    assert BLOB_REFS_KEY.format(digest=blob.digest) not in redis.data
+
+def blob_mtime(store, digest):
+    return os.path.getmtime(store.path_for(digest))
@@ -0,0 +1,65 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+import pytest
+from fastapi.testclient import TestClient
+from app.api import jobs
+from app.core.database import get_db
+from app.main import app
+from app.models.job import Job, JobStatus
+
+@pytest.fixture
+def bulk_client(monkeypatch):
+    """Redis 파이프라인과 DB를 모킹한 클라이언트"""
+    redis = MagicMock()
+    redis.pipeline.return_value.execute.return_value = [
+        {"status": "processing", "updated_at": "2024-01-01T00:05:00"},
+        {"status": "pending", "enqueued_at": "2024-01-01T00:00:00"},
+        {}
+    ]
+    monkeypatch.setattr(jobs, "get_redis", lambda: redis)
+
+    db = MagicMock()
+    db.query.return_value.filter.return_value.all.return_value = [
+        Job(
+            id="job-3",
+            status=JobStatus.COMPLETED,
+            updated_at=datetime(2024, 1, 1, 0, 10),
+            result={"summary": "요약", "checklist": []}
+        )
+    ]
+    app.dependency_overrides[get_db] = lambda: db
+    yield TestClient(app), redis, db
+    app.dependency_overrides.clear()
+
+def test_bulk_status_pipelines_redis_and_falls_back_to_db(bulk_client):
+    """Redis는 파이프라인 한 번, 없는 작업만 DB IN 쿼리 한 번"""
+    client, redis, db = bulk_client
+    response = client.post("/jobs/status", json={"jobIds": ["job-1", "job-2", "job-3", "job-1"], "includeResult": True})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert redis.pipeline.return_value.hgetall.call_count == 3
+    db.query.assert_called_once()
+    assert data["jobs"]["job-1"] == {"status": "processing", "updatedAt": "2024-01-01T00:05:00"}
+    assert data["jobs"]["job-3"]["result"] == {"summary": "요약", "checklist": []}
+    assert data["notFound"] == []
+
+def test_bulk_status_since_returns_only_changed(bulk_client):
+    """since 이후 바뀐 작업만 반환"""
+    client, _, _ = bulk_client
+    response = client.post("/jobs/status", json={
+        "jobIds": ["job-1", "job-2", "job-3"],
+        "since": "2024-01-01T00:04:00"
+    })
+
+    data = response.json()
+    assert set(data["jobs"]) == {"job-1", "job-3"}
+    assert data["unchanged"] == ["job-2"]
+    assert "result" not in data["jobs"]["job-3"]
+
+def test_bulk_status_limit(bulk_client, monkeypatch):
+    """한 번에 조회할 수 있는 작업 수 제한"""
+    client, _, _ = bulk_client
+    monkeypatch.setattr(jobs.settings, "BULK_STATUS_MAX_IDS", 2)
+    response = client.post("/jobs/status", json={"jobIds": ["a", "b", "c"]})
+    assert response.status_code == 400
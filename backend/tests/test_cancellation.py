@@ -0,0 +1,50 @@
+import asyncio
+import time
+import pytest
+from unittest.mock import MagicMock
+from app.core.cancellation import CancellationToken, JobCancelled, cancellation_scope, checkpoint, run_cancellable
+from app.core.config import settings
+
+def _token(cancelled: bool):
+    redis = MagicMock()
+    redis.get.return_value = "1" if cancelled else None
+    return CancellationToken(redis, "job-1")
+
+def test_checkpoint_without_scope_is_noop():
+    """취소 범위 밖에서는 checkpoint가 아무 일도 하지 않음"""
+    checkpoint()
+
+def test_checkpoint_raises_when_cancelled():
+    """취소 요청된 작업은 checkpoint에서 중단"""
+    with cancellation_scope(_token(True)):
+        with pytest.raises(JobCancelled):
+            checkpoint()
+
+    with cancellation_scope(_token(False)):
+        checkpoint()
+
+def test_run_cancellable_aborts_inflight_coroutine(monkeypatch):
+    """진행 중인 비동기 작업이 확인 간격 안에 중단됨"""
+    monkeypatch.setattr(settings, "CANCEL_CHECK_INTERVAL", 0.05)
+    aborted = []
+
+    async def slow_agent_call():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            aborted.append(True)
+            raise
+
+    start = time.monotonic()
+    with pytest.raises(JobCancelled):
+        asyncio.run(run_cancellable(slow_agent_call(), _token(True)))
+
+    assert aborted == [True]
+    assert time.monotonic() - start < 1.0
+
+def test_run_cancellable_returns_result():
+    """취소되지 않으면 결과를 그대로 반환"""
+    async def agent_call():
+        return {"summary": "ok"}
+
+    assert asyncio.run(run_cancellable(agent_call(), _token(False))) == {"summary": "ok"}
@@ -0,0 +1,125 @@
+import asyncio
+from unittest.mock import MagicMock
+import aiohttp
+import pytest
+from app.core import circuit_breaker, retry
+from app.core.cancellation import JobCancelled
+from app.core.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, ConsumerGate
+from app.core.config import settings
+from app.tasks.agent_output import AgentOutputError
+from app.tasks.process_guideline import agent_call
+
+def test_breaker_opens_after_threshold(fake_redis, monkeypatch):
+    """실패 한도를 넘으면 회로가 열리고 요청을 차단"""
+    monkeypatch.setattr(settings, "BREAKER_FAILURE_THRESHOLD", 3)
+    breaker = CircuitBreaker(fake_redis, "agent")
+
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state() == CLOSED
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state() == OPEN
+    assert not breaker.allow_request()
+    assert breaker.retry_after() > 0
+
+def test_breaker_half_open_allows_single_probe(fake_redis, monkeypatch):
+    """재설정 시간이 지나면 하나의 시험 요청만 허용"""
+    monkeypatch.setattr(settings, "BREAKER_FAILURE_THRESHOLD", 1)
+    redis = fake_redis
+    breaker = CircuitBreaker(redis, "agent")
+    breaker.record_failure()
+
+    now = circuit_breaker.time.time()
+    monkeypatch.setattr(circuit_breaker.time, "time", lambda: now + settings.BREAKER_RESET_TIMEOUT + 1)
+    assert breaker.state() == HALF_OPEN
+    assert breaker.allow_request()
+    assert not CircuitBreaker(redis, "agent").allow_request()
+
+    breaker.record_success()
+    assert breaker.state() == CLOSED
+
+def test_breaker_blocks_while_probe_in_flight(fake_redis, monkeypatch):
+    """half-open에서 다른 워커가 시험 요청 중이면 작업을 시작하기 전에 미룸"""
+    monkeypatch.setattr(settings, "BREAKER_FAILURE_THRESHOLD", 1)
+    breaker = CircuitBreaker(fake_redis, "agent")
+    assert not breaker.is_blocked()
+    breaker.record_failure()
+    assert breaker.is_blocked()
+
+    now = circuit_breaker.time.time()
+    monkeypatch.setattr(circuit_breaker.time, "time", lambda: now + settings.BREAKER_RESET_TIMEOUT + 1)
+    assert not breaker.is_blocked()
+    assert breaker.allow_request()
+    assert breaker.is_blocked()
+    breaker.release_probe()
+    assert not breaker.is_blocked()
+
+def test_breaker_failed_probe_reopens(fake_redis, monkeypatch):
+    """시험 요청이 실패하면 다시 회로를 엶"""
+    monkeypatch.setattr(settings, "BREAKER_FAILURE_THRESHOLD", 1)
+    breaker = CircuitBreaker(fake_redis, "agent")
+    breaker.record_failure()
+
+    now = circuit_breaker.time.time()
+    monkeypatch.setattr(circuit_breaker.time, "time", lambda: now + settings.BREAKER_RESET_TIMEOUT + 1)
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state() == OPEN
+
+def test_consumer_gate_pauses_and_resumes():
+    """회로가 열려 있는 동안만 큐 소비를 멈춤"""
+    app = MagicMock()
+    breaker = MagicMock()
+    gate = ConsumerGate(app, lambda: breaker, "main-queue", "worker@host")
+
+    breaker.state.return_value = OPEN
+    gate.tick()
+    gate.tick()
+    app.control.cancel_consumer.assert_called_once_with("main-queue", destination=["worker@host"])
+
+    breaker.state.return_value = HALF_OPEN
+    gate.tick()
+    app.control.add_consumer.assert_called_once_with("main-queue", destination=["worker@host"])
+
+def test_backoff_delay_is_bounded(monkeypatch):
+    """백오프는 지수적으로 늘어나되 최대 지연을 넘지 않음"""
+    monkeypatch.setattr(settings, "AGENT_RETRY_BASE_DELAY", 2.0)
+    monkeypatch.setattr(settings, "AGENT_RETRY_MAX_DELAY", 30.0)
+
+    for attempt, cap in ((0, 2.0), (2, 8.0), (10, 30.0)):
+        delay = retry.backoff_delay(attempt)
+        assert cap / 2 <= delay <= cap
+
+def test_error_classification():
+    """연결 오류와 타임아웃만 일시적 오류로 분류"""
+    assert retry.is_transient(retry.TransientError("503"))
+    assert retry.is_transient(asyncio.TimeoutError())
+    assert retry.is_transient(aiohttp.ClientConnectionError())
+    assert not retry.is_transient(retry.PermanentError("400"))
+    assert not retry.is_transient(ValueError("bad document"))
+
+def test_agent_call_always_releases_probe(fake_redis, monkeypatch):
+    """시험 요청은 어떻게 끝나든 자리를 반납하고, 영구 오류는 에이전트가 응답한 것으로 보고 회로를 닫음"""
+    monkeypatch.setattr(settings, "BREAKER_FAILURE_THRESHOLD", 1)
+    redis = fake_redis
+    breaker = CircuitBreaker(redis, "agent")
+    breaker.record_failure()
+    now = circuit_breaker.time.time()
+    monkeypatch.setattr(circuit_breaker.time, "time", lambda: now + settings.BREAKER_RESET_TIMEOUT + 1)
+
+    # 취소: 결과를 알 수 없으므로 자리만 반납
+    assert breaker.allow_request()
+    with pytest.raises(JobCancelled):
+        with agent_call(breaker):
+            raise JobCancelled("cancelled")
+    assert breaker.state() == HALF_OPEN
+    assert breaker.allow_request()
+
+    # 출력 형식 오류: 에이전트가 응답했으므로 회로를 닫음
+    with pytest.raises(AgentOutputError):
+        with agent_call(breaker):
+            raise AgentOutputError("summary", "invalid")
+    assert breaker.state() == CLOSED
+    assert breaker.redis.data.get(breaker.probe_key) is None
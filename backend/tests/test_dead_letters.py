@@ -0,0 +1,136 @@
+import time
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+import io
+import pytest
+from app.core import dead_letters
+from app.core.circuit_breaker import CLOSED, OPEN
+from app.core.config import settings
+from app.core.retry import TransientError
+from app.storage import LocalBlobStore, acquire_blob, release_blob
+from app.storage.sweeper import sweep
+from app.tasks.agent_output import AgentOutputError
+from app.tasks.process_guideline import AgentUnavailableError
+from app.tasks import maintenance
+
+@pytest.fixture
+def redis(fake_redis):
+    return fake_redis
+
+def fail(redis, job_id, error, failed_at=None):
+    dead_letters.record(redis, job_id, "agent", error, 4, "guide.pdf", f"digest-{job_id}", None, "parallel")
+    if failed_at is not None:
+        redis.data[dead_letters.DEAD_LETTERS_KEY][job_id] = failed_at.timestamp()
+
+def test_find_and_queue_replay(redis):
+    """실패 시각 구간과 오류 종류로 고르고, 이미 대기 중인 작업은 다시 넣지 않음"""
+    now = datetime.now()
+    fail(redis, "old", TransientError("agent down"), now - timedelta(hours=3))
+    fail(redis, "outage-1", TransientError("agent down"), now - timedelta(minutes=50))
+    fail(redis, "outage-2", TransientError("agent down"), now - timedelta(minutes=40))
+    fail(redis, "bad-file", ValueError("File is empty"), now - timedelta(minutes=45))
+
+    entries = dead_letters.find(redis, since=now - timedelta(hours=1), error_class="TransientError")
+    assert [entry["jobId"] for entry in entries] == ["outage-1", "outage-2"]
+    assert entries[0]["stage"] == "agent"
+    assert entries[0]["attempts"] == 4
+    assert entries[0]["pipeline"] == "parallel"
+
+    assert dead_letters.queue_replay(redis, entries) == ["outage-1", "outage-2"]
+    assert dead_letters.queue_replay(redis, dead_letters.find(redis, since=now - timedelta(hours=1))) == ["bad-file"]
+    assert [entry["jobId"] for entry in dead_letters.take_replays(redis, 2)] == ["outage-1", "outage-2"]
+    assert dead_letters.get_summary(redis)["replayQueue"] == 1
+
+def test_find_by_parent_class_and_retry_classification(redis):
+    """실제로 발생하는 하위 예외도 상위 클래스와 재시도 분류로 찾음"""
+    fail(redis, "agent-down", AgentUnavailableError("503"))
+    fail(redis, "timeout", TimeoutError())
+    fail(redis, "bad-output", AgentOutputError("summary", "invalid"))
+
+    assert [entry["jobId"] for entry in dead_letters.find(redis, error_class="TransientError")] == ["agent-down"]
+    assert [entry["jobId"] for entry in dead_letters.find(redis, transient=True)] == ["agent-down", "timeout"]
+    assert [entry["jobId"] for entry in dead_letters.find(redis, transient=False)] == ["bad-output"]
+    entry = dead_letters.find(redis, error_class="PermanentError")[0]
+    assert entry["errorClass"] == "AgentOutputError" and entry["transient"] is False
+
+@pytest.fixture
+def replay_env(redis, monkeypatch):
+    store = MagicMock()
+    store.exists.side_effect = lambda digest: digest != "digest-gone"
+    sent = []
+    breaker = MagicMock()
+    breaker.state.return_value = CLOSED
+    monkeypatch.setattr(maintenance, "redis_client", redis)
+    monkeypatch.setattr(maintenance, "get_blob_store", lambda: store)
+    monkeypatch.setattr(maintenance, "get_agent_breaker", lambda: breaker)
+    monkeypatch.setattr(maintenance, "SessionLocal", MagicMock())
+    monkeypatch.setattr(maintenance, "acquire_blob", lambda redis, digest, job_id, size: None)
+    monkeypatch.setattr(maintenance, "release_blob", lambda redis, digest, job_id: None)
+    monkeypatch.setattr(maintenance, "mark_enqueued", lambda *args: None)
+    monkeypatch.setattr(maintenance.celery_app, "send_task", lambda name, args, kwargs, task_id: sent.append((args, kwargs)))
+    monkeypatch.setattr(settings, "DLQ_REPLAY_RATE", 0.2)
+    monkeypatch.setattr(settings, "DLQ_REPLAY_INTERVAL", 10)
+    return sent, breaker
+
+def test_replay_is_rate_limited(redis, replay_env):
+    """주기마다 DLQ_REPLAY_RATE × 주기만큼만 새 작업으로 등록하고, 회로가 닫혀 있지 않으면 미룸"""
+    sent, breaker = replay_env
+    for i in range(3):
+        fail(redis, f"job-{i}", TransientError("agent down"))
+    dead_letters.queue_replay(redis, dead_letters.find(redis))
+
+    breaker.state.return_value = OPEN
+    maintenance.replay_dead_letters()
+    assert sent == []
+
+    breaker.state.return_value = CLOSED
+    maintenance.replay_dead_letters()
+    assert len(sent) == 2
+    args, kwargs = sent[0]
+    assert args[1] == "guide.pdf"
+    assert kwargs == {"blob": "digest-job-0", "parent_job_id": None, "pipeline": "parallel"}
+    new_job_id = args[0]
+    assert redis.hget(f"job:{new_job_id}", "replay_of") == "job-0"
+    assert dead_letters.find(redis, job_ids=["job-0"])[0]["replayedAs"] == new_job_id
+
+    maintenance.replay_dead_letters()
+    assert len(sent) == 3
+    assert dead_letters.get_summary(redis)["replayQueue"] == 0
+
+def test_replay_without_file(redis, replay_env):
+    """업로드 파일이 정리된 작업은 등록하지 않고 이유를 남김"""
+    sent, _ = replay_env
+    dead_letters.record(redis, "gone", "extract", Exception("boom"), 1, "guide.pdf", "digest-gone")
+    dead_letters.queue_replay(redis, dead_letters.find(redis))
+
+    maintenance.replay_dead_letters()
+    assert sent == []
+    entry = dead_letters.find(redis)[0]
+    assert entry["replayError"] == "Uploaded file no longer available"
+    # 다시 고를 수 있음
+    assert dead_letters.is_replayable(entry)
+
+def test_dead_letter_keeps_upload_until_replayed_or_expired(redis, tmp_path):
+    """실패한 작업의 참조가 해제되어도 dead-letter가 남아 있는 동안은 업로드 파일을 정리하지 않음"""
+    store = LocalBlobStore(str(tmp_path / "blobs"))
+    blob = store.put(io.BytesIO(b"content"))
+    acquire_blob(redis, blob.digest, "job-1", blob.size)
+    dead_letters.record(redis, "job-1", "agent", TransientError("agent down"), 4, "guide.pdf", blob.digest)
+    release_blob(redis, blob.digest, "job-1")
+    redis.hset("job:job-1", "status", "failed")
+
+    later = time.time() + 30 * 86400
+    assert sweep(store, redis, retention=60, now=later)["referenced"] == 1
+
+    # 재처리하면 새 작업이 참조하므로 dead-letter 참조는 해제
+    dead_letters.mark_replayed(redis, "job-1", "job-2", blob.digest)
+    assert sweep(store, redis, retention=60, now=later)["deleted"] == 1
+
+def test_expired_dead_letter_releases_upload(redis, tmp_path):
+    store = LocalBlobStore(str(tmp_path / "blobs"))
+    blob = store.put(io.BytesIO(b"content"))
+    dead_letters.record(redis, "job-1", "agent", TransientError("agent down"), 4, "guide.pdf", blob.digest)
+    redis.delete(dead_letters.DEAD_LETTER_KEY.format(job_id="job-1"))  # 보관 기간 만료
+
+    stats = sweep(store, redis, retention=60, now=time.time() + 120)
+    assert stats["deleted"] == 1 and not store.exists(blob.digest)
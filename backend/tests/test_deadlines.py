@@ -0,0 +1,96 @@
+import time
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+import pytest
+from celery.exceptions import Retry
+from app.core import deadlines, metrics
+from app.core.config import settings
+from app.models.job import JobStatus
+from app.tasks import process_guideline as tasks
+
+@pytest.fixture
+def redis(fake_redis):
+    return fake_redis
+
+def test_parse_deadline(monkeypatch):
+    """deadline은 지금부터의 초 또는 ISO 시각이며, 없으면 기본 마감 시간을 사용"""
+    now = datetime.now()
+    assert (deadlines.parse_deadline("60") - now).total_seconds() == pytest.approx(60, abs=1)
+    at = (now + timedelta(hours=1)).replace(microsecond=0)
+    assert deadlines.parse_deadline(at.isoformat()) == at
+
+    for value in ("0", "-5", (now - timedelta(minutes=1)).isoformat(), "soon", "nan", "1e300"):
+        with pytest.raises(ValueError):
+            deadlines.parse_deadline(value)
+
+    monkeypatch.setattr(settings, "JOB_DEFAULT_DEADLINE", 0)
+    assert deadlines.parse_deadline(None) is None
+    monkeypatch.setattr(settings, "JOB_DEFAULT_DEADLINE", 300)
+    assert deadlines.parse_deadline(None) > now + timedelta(seconds=299)
+
+def test_touch_only_tracked_jobs(redis):
+    """처리를 시작했거나 모르는 작업은 확인 시각을 새로 만들지 않음"""
+    deadlines.mark_job(redis, "job-1", None)
+    redis.data[deadlines.LAST_SEEN_KEY]["job-1"] = 0
+    deadlines.touch(redis, ["job-1", "job-2"])
+    assert redis.zscore(deadlines.LAST_SEEN_KEY, "job-1") > 0
+    assert redis.zscore(deadlines.LAST_SEEN_KEY, "job-2") is None
+
+def test_shed_reason(redis, monkeypatch):
+    monkeypatch.setattr(settings, "JOB_ABANDON_AFTER", 60)
+    deadlines.mark_job(redis, "fresh", datetime.now() + timedelta(minutes=5))
+    assert deadlines.shed_reason(redis, "fresh") is None
+
+    deadlines.mark_job(redis, "late", datetime.now() - timedelta(seconds=1))
+    assert deadlines.shed_reason(redis, "late") == deadlines.SKIP_DEADLINE
+
+    deadlines.mark_job(redis, "left", None)
+    redis.data[deadlines.LAST_SEEN_KEY]["left"] = time.time() - 120
+    assert deadlines.shed_reason(redis, "left") == deadlines.SKIP_ABANDONED
+
+    monkeypatch.setattr(settings, "JOB_ABANDON_AFTER", 0)
+    assert deadlines.shed_reason(redis, "left") is None
+
+def test_abandoned_job_deprioritized_then_skipped(redis, monkeypatch):
+    """떠난 클라이언트의 작업은 한 번 우선순위를 낮추고, 다시 차례가 와도 떠나 있으면 건너뜀"""
+    monkeypatch.setattr(settings, "JOB_ABANDON_AFTER", 60)
+    monkeypatch.setattr(settings, "JOB_ABANDON_POLICY", "deprioritize")
+    monkeypatch.setattr(tasks, "redis_client", redis)
+    monkeypatch.setattr(tasks, "record_metric", lambda func, *args: func(redis, *args))
+    monkeypatch.setattr(tasks, "update_job_status", lambda job_id, status, data: redis.hset(f"job:{job_id}", mapping={"status": status.value, **data}))
+    monkeypatch.setattr(tasks, "SessionLocal", MagicMock())
+    monkeypatch.setattr(tasks, "release_blob", lambda redis, digest, job_id: None)
+    monkeypatch.setattr(deadlines.estimates, "predict_duration", lambda *args, **kwargs: 12.0)
+
+    redis.hset("job:job-1", mapping={"format": "pdf", "lane": "main-queue", "size_bytes": 1000})
+    deadlines.mark_job(redis, "job-1", None)
+    redis.data[deadlines.LAST_SEEN_KEY]["job-1"] = time.time() - 120
+
+    task = MagicMock()
+    task.request.called_directly = False
+    task.retry.side_effect = Retry()
+    with pytest.raises(Retry):
+        tasks.shed_stale_job(task, "job-1", "digest", False, {"blob": "digest"})
+    options = task.retry.call_args.kwargs
+    assert options["kwargs"]["deprioritized"] is True
+    assert options["priority"] == deadlines.DEPRIORITIZED_PRIORITY
+
+    result = tasks.shed_stale_job(task, "job-1", "digest", True, {"blob": "digest"})
+    assert result == {"status": JobStatus.SKIPPED, "reason": deadlines.SKIP_ABANDONED}
+    assert redis.hget("job:job-1", "status") == "skipped"
+    assert redis.zscore(deadlines.LAST_SEEN_KEY, "job-1") is None
+
+    stats = deadlines.get_shedding_stats(metrics.get_counters(redis))
+    assert stats["skipped"][deadlines.SKIP_ABANDONED] == 1
+    assert stats["deprioritized"] == 1
+    assert stats["savedSeconds"] == 12.0
+
+def test_live_job_is_processed(redis, monkeypatch):
+    """기다리는 클라이언트가 있는 작업은 처리하고 확인 시각 추적을 멈춤"""
+    monkeypatch.setattr(settings, "JOB_ABANDON_AFTER", 60)
+    monkeypatch.setattr(tasks, "redis_client", redis)
+    monkeypatch.setattr(tasks, "record_metric", lambda func, *args: func(redis, *args))
+    deadlines.mark_job(redis, "job-1", datetime.now() + timedelta(minutes=5))
+
+    assert tasks.shed_stale_job(MagicMock(), "job-1", None, False, {}) is None
+    assert redis.zscore(deadlines.LAST_SEEN_KEY, "job-1") is None
@@ -0,0 +1,81 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+from app.core import estimates
+from app.tasks import process_guideline as tasks
+
+def _redis_with_model(samples):
+    """record_duration 호출 결과를 hgetall로 돌려주는 Redis 모킹"""
+    stats = defaultdict(float)
+    redis = MagicMock()
+    pipe = redis.pipeline.return_value
+    pipe.hincrbyfloat.side_effect = lambda key, field, amount: stats.__setitem__(field, stats[field] + amount)
+
+    for size_bytes, chars, duration in samples:
+        estimates.record_duration(redis, "pdf", "main-queue", duration, size_bytes=size_bytes, chars=chars)
+
+    redis.hgetall.return_value = {k: str(v) for k, v in stats.items()}
+    return redis
+
+def test_predict_duration_linear_in_chars():
+    """문자 수에 비례하는 처리 시간을 학습"""
+    redis = _redis_with_model([
+        (10000, 1000, 12.0),
+        (20000, 2000, 22.0),
+        (40000, 4000, 42.0),
+        (80000, 8000, 82.0),
+    ])
+
+    assert abs(estimates.predict_duration(redis, "pdf", "main-queue", chars=6000) - 62.0) < 1e-6
+    # 추출 전에는 파일 크기 모델 사용
+    assert abs(estimates.predict_duration(redis, "pdf", "main-queue", size_bytes=30000) - 32.0) < 1e-6
+
+def test_predict_duration_few_samples_uses_mean():
+    """표본이 적으면 평균 처리 시간 사용"""
+    redis = _redis_with_model([(1000, 100, 10.0), (2000, 200, 30.0)])
+    assert estimates.predict_duration(redis, "pdf", "main-queue", chars=5000) == 20.0
+
+def test_estimate_processing_job():
+    """처리 중인 작업은 시작 시각 + 예상 처리 시간"""
+    redis = _redis_with_model([(1000, 100, 3600.0)])
+    started_at = datetime.now().replace(microsecond=0)
+
+    result = estimates.estimate_job_times(redis, "job-1", {
+        "status": "processing",
+        "format": "pdf",
+        "lane": "main-queue",
+        "started_at": started_at.isoformat(),
+        "chars": "100"
+    })
+
+    assert result["estimatedStartAt"] == started_at.isoformat()
+    assert (datetime.fromisoformat(result["estimatedCompletedAt"]) - started_at).total_seconds() == 3600.0
+
+def test_estimate_terminal_job_is_empty():
+    """완료된 작업은 예상 시각을 반환하지 않음"""
+    redis = MagicMock()
+    assert estimates.estimate_job_times(redis, "job-1", {"status": "completed", "format": "pdf", "lane": "main-queue"}) == {}
+
+def test_retried_job_is_estimated_again(fake_redis, monkeypatch):
+    """재시도를 기다리는 작업은 대기 목록에 다시 들어가 재시도 시각 이후로 예상"""
+    monkeypatch.setattr(tasks, "SessionLocal", MagicMock())
+    monkeypatch.setattr(tasks, "record_metric", lambda func, *args: func(fake_redis, *args))
+    monkeypatch.setattr(tasks, "update_job_status", lambda job_id, status, data: fake_redis.hset(f"job:{job_id}", mapping={"status": status.value, **data}))
+    estimates.mark_enqueued(fake_redis, "job-1", "pdf", "main-queue", 1000)
+    estimates.mark_started(fake_redis, "job-1")
+
+    tasks.handle_job_retry("job-1", Exception("agent down"), 1, 600)
+    job_data = fake_redis.hgetall("job:job-1")
+    result = estimates.estimate_job_times(fake_redis, "job-1", job_data)
+    assert result["estimatedStartAt"] == job_data["next_retry_at"]
+    assert datetime.fromisoformat(result["estimatedStartAt"]) > datetime.now() + timedelta(seconds=590)
+
+def test_staged_job_sums_stage_models(fake_redis):
+    """단계별 파이프라인 작업은 단계 큐마다 기록한 처리 시간의 합으로 예상"""
+    for lane, duration in (("extract-queue", 2.0), ("agent-queue", 30.0), ("persist-queue", 1.0)):
+        estimates.record_duration(fake_redis, "pdf", lane, duration, size_bytes=1000)
+
+    assert estimates.predict_duration(fake_redis, "pdf", "extract-queue", size_bytes=1000) == 33.0
+    # 일반 파이프라인 레인의 모델과는 섞지 않음
+    estimates.record_duration(fake_redis, "pdf", "main-queue", 50.0, size_bytes=1000)
+    assert estimates.predict_duration(fake_redis, "pdf", "main-queue", size_bytes=1000) == 50.0
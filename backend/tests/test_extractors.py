@@ -0,0 +1,131 @@
+import time
+import zipfile
+import pytest
+from app import extractors
+from app.core.config import settings
+from app.extractors import registry
+from app.extractors.calibration import calibrate, save_calibration
+
+@pytest.fixture(autouse=True)
+def calibration_cache():
+    """프로세스에 캐시된 보정 결과가 다른 테스트로 이어지지 않도록 비움"""
+    registry.reset_calibration_cache()
+    yield
+    registry.reset_calibration_cache()
+
+@pytest.fixture
+def fake_format(monkeypatch, tmp_path, fake_redis):
+    """테스트용 형식(.fake)과 백엔드 등록 (보정 결과는 비어 있는 메모리 Redis에서 읽음)"""
+    monkeypatch.setattr(registry, "_backends", registry.defaultdict(list, registry._backends))
+    monkeypatch.setattr("app.core.redis_client.get_redis", lambda: fake_redis)
+
+    @extractors.register("fake", "slow")
+    def slow(path):
+        time.sleep(0.02)
+        return "full text content"
+
+    @extractors.register("fake", "fast")
+    def fast(path):
+        return "full text content"
+
+    @extractors.register("fake", "lossy")
+    def lossy(path):
+        return "full"
+
+    path = tmp_path / "sample.fake"
+    path.write_bytes(b"x" * 1000)
+    return str(path)
+
+def test_default_order_and_recorded_backend(fake_format):
+    """기본으로는 먼저 등록된 백엔드를 사용하고 결과에 기록"""
+    result = extractors.extract(fake_format)
+    assert result.backend == "slow"
+    assert result.text == "full text content"
+
+def test_pinned_backend(fake_format, monkeypatch):
+    """설정으로 고정한 백엔드를 우선 사용"""
+    monkeypatch.setattr(settings, "EXTRACTOR_BACKENDS", "fake=fast")
+    assert extractors.extract(fake_format).backend == "fast"
+
+def test_falls_back_when_backend_fails(fake_format, monkeypatch):
+    """우선 백엔드가 실패하면 다음 백엔드로 추출"""
+    @extractors.register("fake", "broken")
+    def broken(path):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(settings, "EXTRACTOR_BACKENDS", "fake=broken")
+    assert extractors.extract(fake_format).backend == "slow"
+
+def test_calibration_picks_fastest_meeting_quality(fake_format, monkeypatch):
+    """품질 기준을 만족하는 백엔드 중 가장 빠른 것을 선택"""
+    monkeypatch.setattr(settings, "EXTRACTOR_MIN_QUALITY", 0.95)
+    report = calibrate([fake_format])
+
+    assert report["fake"]["backend"] == "fast"
+    assert report["fake"]["results"]["lossy"]["quality"] < 0.95
+
+def test_saved_calibration_is_used(fake_format, fake_redis, monkeypatch):
+    """저장한 보정 결과는 캐시 시간이 지나거나 캐시를 비운 뒤 적용"""
+    monkeypatch.setattr(settings, "EXTRACTOR_CALIBRATION_TTL", 3600)
+    assert extractors.extract(fake_format).backend == "slow"
+
+    save_calibration(fake_redis, {"fake": {"backend": "fast"}})
+    assert extractors.extract(fake_format).backend == "slow"
+    registry.reset_calibration_cache()
+    assert extractors.extract(fake_format).backend == "fast"
+
+def test_doc_saved_docx_is_detected(tmp_path):
+    """DOCX를 .doc 확장자로 저장한 파일은 docx로 처리"""
+    path = tmp_path / "renamed.doc"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("word/document.xml", "<w:document/>")
+    assert extractors.detect_format(str(path)) == "docx"
+
+def test_legacy_doc_without_backend(tmp_path, monkeypatch):
+    """DOC를 읽을 백엔드가 없으면 명확한 오류"""
+    monkeypatch.setattr(registry, "get_backends", lambda fmt, available_only=True: [])
+    path = tmp_path / "legacy.doc"
+    path.write_bytes(b"\xd0\xcf\x11\xe0" + b"\x00" * 100)
+
+    with pytest.raises(extractors.UnsupportedFormatError, match="DOCX"):
+        extractors.extract(str(path))
+
+def test_docx_stream_includes_tables_headers_and_footers(tmp_path):
+    """스트리밍 DOCX 추출은 표, 머리글/바닥글을 문서 순서대로 포함"""
+    import docx
+
+    doc = docx.Document()
+    doc.sections[0].header.paragraphs[0].text = "머리글"
+    doc.sections[0].footer.paragraphs[0].text = "바닥글"
+    doc.add_paragraph("첫 문단")
+    table = doc.add_table(rows=1, cols=2)
+    table.cell(0, 0).text = "항목"
+    table.cell(0, 1).text = "기준"
+    doc.add_paragraph("끝 문단")
+    path = tmp_path / "sample.docx"
+    doc.save(path)
+
+    result = extractors.extract(str(path))
+    assert result.backend == "docx-stream"
+    assert result.text.splitlines() == ["머리글", "첫 문단", "항목 | 기준", "끝 문단", "바닥글"]
+
+def test_txt_encoding_detection_fast_paths():
+    """BOM, UTF-8, CP949 순서로 표본의 인코딩을 감지"""
+    from app.extractors.text import detect_encoding
+
+    assert detect_encoding("한글".encode("utf-16")) == "utf-16"
+    assert detect_encoding(b"\xef\xbb\xbf" + "한글".encode("utf-8")) == "utf-8-sig"
+    assert detect_encoding("가이드라인".encode("utf-8")) == "utf-8"
+    assert detect_encoding("가이드라인".encode("cp949")) == "cp949"
+    # 표본 끝에서 잘린 멀티바이트 문자는 허용
+    assert detect_encoding("가이드라인".encode("utf-8")[:-1]) == "utf-8"
+
+def test_txt_redecodes_when_sample_is_misleading(tmp_path, monkeypatch):
+    """표본은 ASCII뿐이고 뒤에 CP949가 나오면 CP949로 다시 읽음"""
+    monkeypatch.setattr(settings, "TXT_DETECT_SAMPLE_BYTES", 16)
+    path = tmp_path / "log.txt"
+    path.write_bytes(b"plain ascii header line\r\n" + "한글 본문".encode("cp949"))
+
+    result = extractors.extract(str(path))
+    assert result.backend == "txt-stream"
+    assert result.text == "plain ascii header line\n한글 본문"
@@ -0,0 +1,23 @@
+from unittest.mock import MagicMock
+from app.core import idempotency
+
+def test_reserve_new_key():
+    """처음 사용하는 키는 새로 예약"""
+    redis = MagicMock()
+    redis.set.return_value = True
+
+    assert idempotency.reserve(redis, "client", "key-1", "job-1") is None
+    redis.set.assert_called_once()
+    assert redis.set.call_args[1]["nx"] is True
+
+def test_reserve_existing_key_returns_original_job():
+    """이미 예약된 키는 원래 작업 ID를 반환"""
+    redis = MagicMock()
+    redis.set.return_value = False
+    redis.get.return_value = "job-1"
+
+    assert idempotency.reserve(redis, "client", "key-1", "job-2") == "job-1"
+
+def test_keys_are_scoped_by_client():
+    """같은 키라도 클라이언트별로 구분"""
+    assert idempotency._redis_key("a", "key") != idempotency._redis_key("b", "key")
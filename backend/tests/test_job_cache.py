@@ -0,0 +1,54 @@
+import json
+from unittest.mock import MagicMock
+from app.api.jobs import job_payload_from_redis
+from app.core.job_cache import TerminalResponseCache, etag_matches, make_etag
+
+def test_etag_matching():
+    """If-None-Match는 약한 비교와 여러 값을 지원"""
+    etag = make_etag("body")
+    assert etag.startswith('W/"')
+    assert etag_matches(etag, etag)
+    assert etag_matches(etag[2:], etag)
+    assert etag_matches(f'"other", {etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+def test_terminal_cache_serves_from_memory():
+    """한 번 저장한 응답은 Redis 조회 없이 메모리에서 반환"""
+    redis = MagicMock()
+    cache = TerminalResponseCache(max_size=2)
+    body, etag = cache.put(redis, "job-1", {"jobId": "job-1", "status": "completed"})
+
+    redis.reset_mock()
+    assert cache.get(redis, "job-1") == (body, etag)
+    redis.hgetall.assert_not_called()
+    assert json.loads(body)["status"] == "completed"
+
+def test_terminal_cache_evicts_oldest():
+    """최대 개수를 넘으면 가장 오래된 응답을 메모리에서 제거하고 Redis에서 다시 읽음"""
+    redis = MagicMock()
+    redis.hgetall.return_value = {}
+    cache = TerminalResponseCache(max_size=2)
+    for job_id in ("job-1", "job-2", "job-3"):
+        cache.put(redis, job_id, {"jobId": job_id})
+
+    assert cache.get(redis, "job-1") is None
+    redis.hgetall.assert_called_once()
+    assert cache.get(redis, "job-3") is not None
+
+def test_payload_from_redis_has_frontend_fields():
+    """Redis 응답도 프론트엔드가 사용하는 createdAt/updatedAt/result를 포함"""
+    payload = job_payload_from_redis("job-1", {
+        "status": "completed",
+        "filename": "job-1_guide.pdf",
+        "enqueued_at": "2024-01-01T00:00:00",
+        "updated_at": "2024-01-01T00:01:00",
+        "summary": "요약",
+        "checklist": json.dumps(["항목"], ensure_ascii=False)
+    })
+
+    assert payload["filename"] == "guide.pdf"
+    assert payload["createdAt"] == "2024-01-01T00:00:00"
+    assert payload["updatedAt"] == "2024-01-01T00:01:00"
+    assert payload["result"] == {"summary": "요약", "checklist": ["항목"]}
@@ -0,0 +1,82 @@
+import asyncio
+import json
+from app.core.config import settings
+from app.core.job_events import JobEventHub
+
+def _hub(jobs):
+    async def load_job(job_id):
+        return jobs.get(job_id)
+    return JobEventHub(load_job, terminal_statuses=["completed", "failed", "cancelled"])
+
+async def _run(hub, scenario):
+    try:
+        await scenario()
+    finally:
+        await hub.close()
+
+def _drain(subscriber):
+    messages = []
+    while not subscriber.queue.empty():
+        messages.append(subscriber.queue.get_nowait())
+    return messages
+
+def test_subscribe_sends_snapshot_and_fans_out_transitions():
+    """구독 시 현재 상태를 보내고, 전이는 해당 작업의 구독자에게만 전달"""
+    jobs = {"job-1": {"jobId": "job-1", "status": "pending"}, "job-2": {"jobId": "job-2", "status": "pending"}}
+    hub = _hub(jobs)
+
+    async def scenario():
+        a, b = hub.connect(), hub.connect()
+        await hub.subscribe(a, ["job-1", "job-2"])
+        await hub.subscribe(b, ["job-1"])
+        assert [m["type"] for m in _drain(a)] == ["snapshot", "snapshot"]
+        _drain(b)
+
+        jobs["job-2"]["status"] = "processing"
+        await hub._dispatch(json.dumps({"jobId": "job-2", "status": "processing"}))
+        assert _drain(a) == [{"type": "update", "job": {"jobId": "job-2", "status": "processing"}}]
+        assert _drain(b) == []
+
+    asyncio.run(_run(hub, scenario))
+
+def test_terminal_transition_unsubscribes():
+    """완료된 작업은 마지막 전이를 보낸 뒤 구독 해제"""
+    jobs = {"job-1": {"jobId": "job-1", "status": "processing"}}
+    hub = _hub(jobs)
+
+    async def scenario():
+        subscriber = hub.connect()
+        await hub.subscribe(subscriber, ["job-1"])
+        jobs["job-1"]["status"] = "completed"
+        await hub._dispatch(json.dumps({"jobId": "job-1", "status": "completed"}))
+
+        assert _drain(subscriber)[-1]["job"]["status"] == "completed"
+        assert subscriber.job_ids == set()
+        assert hub.subscription_count() == 0
+
+    asyncio.run(_run(hub, scenario))
+
+def test_subscription_limit(monkeypatch):
+    """연결당 구독 한도를 넘는 작업은 거절"""
+    monkeypatch.setattr(settings, "WS_MAX_SUBSCRIPTIONS", 2)
+    hub = _hub({job_id: {"jobId": job_id, "status": "pending"} for job_id in ("a", "b", "c")})
+
+    async def scenario():
+        subscriber = hub.connect()
+        assert await hub.subscribe(subscriber, ["a", "b", "c"]) == ["c"]
+
+    asyncio.run(_run(hub, scenario))
+
+def test_slow_subscriber_is_marked_for_disconnect(monkeypatch):
+    """대기 메시지가 한도를 넘으면 연결 종료 신호를 보냄"""
+    monkeypatch.setattr(settings, "WS_MAX_PENDING_MESSAGES", 2)
+    hub = _hub({})
+
+    async def scenario():
+        subscriber = hub.connect()
+        for i in range(3):
+            subscriber.offer({"type": "update", "n": i})
+        assert subscriber.overflowed
+        assert _drain(subscriber)[-1] is None
+
+    asyncio.run(_run(hub, scenario))
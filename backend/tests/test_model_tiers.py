@@ -0,0 +1,41 @@
+import pytest
+from app.core import model_tiers
+from app.core.config import settings
+
+TIERS = "long=gemini-1.5-pro:2000000:1800,fast=gemini-2.0-flash-lite:2000:120,standard=gemini-2.0-flash:100000:600"
+
+@pytest.fixture
+def tiers(monkeypatch):
+    monkeypatch.setattr(settings, "AGENT_MODEL_TIERS", TIERS)
+    monkeypatch.setattr(settings, "AGENT_MODEL_PRICES", "gemini-2.0-flash-lite=0.075/0.30")
+
+def test_select_smallest_tier_that_fits(tiers):
+    assert [tier.name for tier in model_tiers.get_tiers()] == ["fast", "standard", "long"]
+    assert model_tiers.select_tier(500).name == "fast"
+    assert model_tiers.select_tier(2001).name == "standard"
+    # 가장 큰 티어보다 긴 문서도 가장 큰 티어로 처리
+    assert model_tiers.select_tier(5000000).name == "long"
+
+def test_default_tier_keeps_agent_model(monkeypatch):
+    monkeypatch.setattr(settings, "AGENT_MODEL_TIERS", "fast=gemini-2.0-flash-lite")
+    tier = model_tiers.select_tier(10)
+    assert tier.name == model_tiers.DEFAULT_TIER and tier.model == ""
+    assert tier.timeout == settings.AGENT_REQUEST_TIMEOUT
+
+def test_usage_and_tier_stats(tiers):
+    """범위 안의 에이전트 응답 토큰을 합산하고 티어별 평균 지연 시간과 작업당 비용을 계산"""
+    events = [{"usageMetadata": {"promptTokenCount": 1000, "candidatesTokenCount": 200}}, {"author": "user"}]
+    with model_tiers.model_tier_scope(model_tiers.select_tier(100)) as usage:
+        model_tiers.note_usage(events)
+        model_tiers.note_usage(events)
+    assert model_tiers.current_usage() is None
+    assert (usage.input_tokens, usage.output_tokens) == (2000, 400)
+    assert model_tiers.estimate_cost(usage) == pytest.approx((2000 * 0.075 + 400 * 0.30) / 1e6)
+
+    stats = model_tiers.get_tier_stats({
+        "tier_jobs:fast": 4.0, "tier_runs:fast": 2.0, "tier_agent_seconds:fast": 3.0,
+        "tier_cost_usd:fast": 0.02, "agent_retries": 1.0
+    })
+    assert list(stats) == ["fast"]
+    assert stats["fast"]["avgAgentSeconds"] == 1.5
+    assert stats["fast"]["costPerJobUsd"] == pytest.approx(0.005)
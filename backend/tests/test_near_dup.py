@@ -0,0 +1,68 @@
+import random
+from app.core import near_dup
+from app.core.config import settings
+
+def make_document(seed: int, paragraphs: int = 40) -> str:
+    rng = random.Random(seed)
+    words = ["개인정보", "수집", "목적", "보관", "기간", "동의", "파기", "위탁", "안전성", "점검", "관리자", "교육"]
+    return "\n".join(" ".join(rng.choice(words) for _ in range(25)) + f" 제{i}조" for i in range(paragraphs))
+
+def test_similarity_of_reexported_document():
+    """날짜와 오탈자만 바뀐 문서는 높은 유사도, 다른 문서는 낮은 유사도"""
+    original = "2024년 1월 1일 시행\n" + make_document(1)
+    reexported = "2025년 3월 15일 시행\n" + make_document(1).replace("관리자", "관리 자", 1)
+
+    a = near_dup.compute_signature(original)
+    assert near_dup.similarity(a, near_dup.compute_signature(reexported)) >= 0.9
+    assert near_dup.similarity(a, near_dup.compute_signature(make_document(2))) < 0.5
+    assert near_dup.compute_signature("   ") is None
+
+def test_index_and_lookup(fake_redis):
+    """색인된 완료 작업 중 임계값 이상으로 유사한 작업을 찾음"""
+    redis = fake_redis
+    for seed in range(5):
+        near_dup.index_document(redis, f"job-{seed}", near_dup.compute_signature(make_document(seed)))
+
+    query = near_dup.compute_signature("2025년 개정\n" + make_document(3))
+    match = near_dup.find_near_duplicate(redis, query, threshold=0.8)
+    assert match.job_id == "job-3" and match.similarity >= 0.8
+
+    # 자기 자신은 제외
+    assert near_dup.find_near_duplicate(redis, near_dup.compute_signature(make_document(3)), 0.8, exclude="job-3") is None
+    assert near_dup.find_near_duplicate(redis, near_dup.compute_signature(make_document(99)), 0.8) is None
+
+def test_index_size_is_bounded(fake_redis, monkeypatch):
+    """최대 작업 수를 넘거나 보관 기간이 지난 작업은 서명과 밴드 필드째 정리"""
+    monkeypatch.setattr(settings, "NEAR_DUP_MAX_DOCUMENTS", 3)
+    redis = fake_redis
+    for seed in range(6):
+        near_dup.index_document(redis, f"job-{seed}", near_dup.compute_signature(make_document(seed)))
+
+    assert set(redis.hgetall(near_dup.SIGNATURES_KEY)) == {"job-3", "job-4", "job-5"}
+    assert redis.zcard(near_dup.INDEXED_KEY) == 3
+    for band in range(near_dup.BANDS):
+        assert set(redis.hgetall(near_dup.BAND_KEY.format(band=band)).values()) <= {"job-3", "job-4", "job-5"}
+    assert near_dup.find_near_duplicate(redis, near_dup.compute_signature(make_document(1)), 0.8) is None
+    assert near_dup.find_near_duplicate(redis, near_dup.compute_signature(make_document(4)), 0.8).job_id == "job-4"
+
+    # 보관 기간이 지난 작업은 개수와 관계없이 정리
+    redis.data[near_dup.INDEXED_KEY]["job-3"] -= settings.NEAR_DUP_RETENTION + 1
+    near_dup.index_document(redis, "job-6", near_dup.compute_signature(make_document(6)))
+    assert set(redis.hgetall(near_dup.SIGNATURES_KEY)) == {"job-4", "job-5", "job-6"}
+
+def test_backfill_indexed_makes_old_entries_prunable(fake_redis, monkeypatch):
+    """색인 시각 기록 없이 남은 작업을 가장 오래된 작업으로 추가해 먼저 정리"""
+    monkeypatch.setattr(settings, "NEAR_DUP_MAX_DOCUMENTS", 2)
+    redis = fake_redis
+    for seed in range(2):
+        near_dup.index_document(redis, f"job-{seed}", near_dup.compute_signature(make_document(seed)))
+    # INDEXED_KEY가 생기기 전에 색인된 작업
+    redis.data[near_dup.INDEXED_KEY].pop("job-0")
+    oldest = redis.data[near_dup.INDEXED_KEY]["job-1"]
+
+    assert near_dup.backfill_indexed(redis) == 1
+    assert near_dup.backfill_indexed(redis) == 0
+    assert redis.zscore(near_dup.INDEXED_KEY, "job-0") == oldest
+
+    near_dup.index_document(redis, "job-2", near_dup.compute_signature(make_document(2)))
+    assert set(redis.hgetall(near_dup.SIGNATURES_KEY)) == {"job-1", "job-2"}
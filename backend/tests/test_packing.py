@@ -0,0 +1,117 @@
+import json
+from unittest.mock import MagicMock
+import pytest
+from app.core import deadlines, metrics, packing
+from app.core.config import settings
+from app.tasks import packing as pack_tasks
+from app.tasks import process_guideline as tasks
+from app.tasks.agent_output import AgentOutputError, decode_batch_output
+
+def batch_document(doc_id):
+    return {
+        "id": doc_id,
+        "summary": {"topic": f"공지 {doc_id}", "purpose": "안내", "key_points": ["요점"]},
+        "checklist": {"items": [{"text": "확인", "priority": "low", "category": "공지"}]}
+    }
+
+@pytest.fixture
+def redis(fake_redis, monkeypatch):
+    monkeypatch.setattr(tasks, "redis_client", fake_redis)
+    monkeypatch.setattr(pack_tasks, "redis_client", fake_redis)
+    monkeypatch.setattr(settings, "PACKING_ENABLED", True)
+    monkeypatch.setattr(settings, "PACK_MAX_DOCS", 3)
+    return fake_redis
+
+def test_packable_by_estimated_tokens(monkeypatch):
+    monkeypatch.setattr(settings, "PACKING_ENABLED", True)
+    monkeypatch.setattr(settings, "PACK_MAX_TOKENS", 10)
+    monkeypatch.setattr(settings, "PACK_CHARS_PER_TOKEN", 2.0)
+    assert packing.is_packable("가" * 20)
+    assert not packing.is_packable("가" * 21)
+
+def test_explicit_pipeline_is_not_packed(monkeypatch):
+    """파이프라인을 직접 지정한 작업은 짧아도 묶지 않음"""
+    monkeypatch.setattr(settings, "PACKING_ENABLED", True)
+    monkeypatch.setattr(settings, "PACK_MAX_DOCS", 3)
+    assert tasks.should_pack("짧은 공지", True, None, None)
+    assert not tasks.should_pack("짧은 공지", True, None, "parallel")
+    assert not tasks.should_pack("짧은 공지", True, None, "sequential")
+    assert not tasks.should_pack("짧은 공지", True, "parent-1", None)
+    assert not tasks.should_pack("짧은 공지", False, None, None)
+
+def test_enqueue_schedules_on_first_and_full(redis, monkeypatch):
+    """첫 작업은 PACK_MAX_WAIT 뒤, 목록이 차면 바로 묶음 처리를 예약"""
+    scheduled = []
+    monkeypatch.setattr(tasks, "schedule_pack", lambda countdown=0: scheduled.append(countdown))
+
+    for i in range(3):
+        assert tasks.enqueue_for_pack(f"job-{i}", f"{i}.txt", None, "2024-01-01T00:00:00", f"본문 {i}")
+    assert scheduled == [settings.PACK_MAX_WAIT, 0]
+
+    entries = packing.take_pack(redis)
+    assert [entry["job_id"] for entry in entries] == ["job-0", "job-1", "job-2"]
+    assert entries[1]["text"] == "본문 1"
+    assert packing.pending_count(redis) == 0
+    assert not any(key.startswith("pack:text:") for key in redis.data)
+
+def test_pack_splits_results_and_falls_back_for_missing(redis, monkeypatch):
+    """묶음 결과를 작업별로 저장하고, 결과가 없는 작업은 단독 처리로 다시 등록"""
+    monkeypatch.setattr(tasks, "schedule_pack", lambda countdown=0: None)
+    for i in range(3):
+        tasks.enqueue_for_pack(f"job-{i}", f"{i}.txt", None, "2024-01-01T00:00:00", f"본문 {i}", profile=True, deprioritized=i == 1)
+
+    breaker = MagicMock()
+    breaker.allow_request.return_value = True
+    monkeypatch.setattr(pack_tasks, "get_agent_breaker", lambda: breaker)
+    monkeypatch.setattr(pack_tasks, "is_cancel_requested", lambda redis, job_id: False)
+
+    async def fake_batch(entries):
+        assert "<<<DOC 2>>>\n본문 1\n<<<END 2>>>" in pack_tasks.build_pack_message(entries)
+        # 두 번째 문서는 형식이 잘못되어 결과에서 빠짐
+        return decode_batch_output(json.dumps({"documents": [batch_document("1"), {"id": "2"}, batch_document("3")]}))
+
+    monkeypatch.setattr(pack_tasks, "run_agent_batch", fake_batch)
+    completed = []
+    monkeypatch.setattr(pack_tasks, "handle_job_completed", lambda job_id, filename, result, started_at: completed.append((job_id, result)))
+    send_task = MagicMock()
+    monkeypatch.setattr(pack_tasks.celery_app, "send_task", send_task)
+
+    pack_tasks.process_pack.run()
+
+    assert [job_id for job_id, _ in completed] == ["job-0", "job-2"]
+    assert completed[0][1]["summary"].startswith("[주제] 공지 1")
+    send_task.assert_called_once()
+    assert send_task.call_args.kwargs["args"] == ["job-1", "1.txt"]
+    assert send_task.call_args.kwargs["kwargs"] == {"blob": None, "pack": False, "profile": True, "pipeline": None, "deprioritized": True}
+    assert send_task.call_args.kwargs["priority"] == deadlines.DEPRIORITIZED_PRIORITY
+    breaker.record_success.assert_called_once()
+
+    counters = metrics.get_counters(redis)
+    assert counters["packed_jobs"] == 2
+    assert counters["pack_llm_calls_saved"] == 3
+    assert counters["pack_fallbacks"] == 1
+
+def test_pack_settles_breaker_probe(redis, monkeypatch):
+    """빈 목록에서는 시험 요청 자리를 얻지 않고, 영구 오류로 단독 처리로 넘겨도 자리를 반납"""
+    monkeypatch.setattr(tasks, "schedule_pack", lambda countdown=0: None)
+    breaker = MagicMock()
+    breaker.allow_request.return_value = True
+    monkeypatch.setattr(pack_tasks, "get_agent_breaker", lambda: breaker)
+    monkeypatch.setattr(pack_tasks, "is_cancel_requested", lambda redis, job_id: False)
+    send_task = MagicMock()
+    monkeypatch.setattr(pack_tasks.celery_app, "send_task", send_task)
+
+    pack_tasks.process_pack.run()
+    breaker.allow_request.assert_not_called()
+
+    async def broken_batch(entries):
+        raise AgentOutputError("not json")
+
+    monkeypatch.setattr(pack_tasks, "run_agent_batch", broken_batch)
+    tasks.enqueue_for_pack("job-1", "1.txt", None, "2024-01-01T00:00:00", "본문", pipeline="parallel")
+    pack_tasks.process_pack.run()
+
+    # 에이전트는 응답했으므로 회로에는 성공으로 기록
+    breaker.record_success.assert_called_once()
+    breaker.record_failure.assert_not_called()
+    assert send_task.call_args.kwargs["kwargs"]["pipeline"] == "parallel"
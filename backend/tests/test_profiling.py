@@ -0,0 +1,35 @@
+import contextlib
+import os
+from app.core.config import settings
+from app.core import profiling
+
+def test_profile_job_disabled_is_noop(tmp_path, monkeypatch):
+    """프로파일링 대상이 아닌 작업은 아무 산출물도 만들지 않음"""
+    monkeypatch.setattr(settings, "PROFILE_DIR", str(tmp_path))
+
+    ctx = profiling.profile_job("job-1", False)
+    assert isinstance(ctx, contextlib.nullcontext)
+    with ctx:
+        sum(range(1000))
+
+    assert profiling.list_profile_artifacts("job-1") == []
+
+def test_profile_job_writes_artifacts(tmp_path, monkeypatch):
+    """프로파일링 대상 작업은 CPU 프로파일과 메모리 할당 정보를 저장"""
+    monkeypatch.setattr(settings, "PROFILE_DIR", str(tmp_path))
+
+    with profiling.profile_job("job-2", True):
+        data = [str(i) * 10 for i in range(10000)]
+
+    assert sorted(profiling.list_profile_artifacts("job-2")) == sorted(profiling.PROFILE_ARTIFACTS)
+    with open(os.path.join(tmp_path, "job-2", "tracemalloc.txt"), encoding="utf-8") as f:
+        assert f.readline().startswith("peak:")
+
+def test_should_profile_sampling(monkeypatch):
+    """명시적 요청 또는 샘플링 비율에 따라 프로파일링 여부 결정"""
+    monkeypatch.setattr(settings, "PROFILE_SAMPLE_RATE", 0.0)
+    assert profiling.should_profile(True) is True
+    assert profiling.should_profile(False) is False
+
+    monkeypatch.setattr(settings, "PROFILE_SAMPLE_RATE", 1.0)
+    assert profiling.should_profile(False) is True
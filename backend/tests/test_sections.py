@@ -0,0 +1,93 @@
+import asyncio
+import json
+import re
+from app.core import sections
+from app.core.config import settings
+from app.tasks import process_guideline as tasks
+
+CHECKLIST = {"items": [{"text": "수집 목적을 고지했는가", "priority": "high", "category": "법적 의무"}]}
+
+def make_document(changed: str = "") -> str:
+    body = "개인정보처리자는 수집 목적을 명시하고 목적 외로 이용하지 않아야 한다. " * 6
+    articles = [f"제{i}조 (조항 {i})\n{body}{i}항" for i in range(1, 5)]
+    if changed:
+        articles[2] = f"제3조 (조항 3)\n{changed}"
+    return "개인정보 처리 지침\n\n" + "\n\n".join(articles)
+
+def test_split_sections_by_heading():
+    """조항 제목 기준으로 나누고, 공백만 다른 섹션은 같은 해시"""
+    result = sections.split_sections(make_document())
+    assert [section.title for section in result][-4:] == [f"제{i}조 (조항 {i})" for i in range(1, 5)]
+    assert sections.Section("", "가 나\n다").digest == sections.Section("", "가  나 다").digest
+
+def test_short_sections_are_merged():
+    text = "제1조 목적\n" + "가" * 300 + "\n1. 짧은 항목\n2. 짧은 항목\n제2조 정의\n" + "나" * 300
+    result = sections.split_sections(text)
+    assert [section.title for section in result] == ["제1조 목적", "제2조 정의"]
+    assert "2. 짧은 항목" in result[0].text
+
+def test_versioned_pipeline_reuses_unchanged_sections(fake_redis, monkeypatch):
+    """이전 버전과 같은 섹션은 요약을 재사용하고 바뀐 섹션만 다시 요약"""
+    redis = fake_redis
+    requests = []
+
+    async def fake_create_session(app_name=tasks.AGENT_APP_NAME, state=None):
+        return "session-id"
+
+    async def fake_run_agent(app_name, session_id, content):
+        if app_name == "guideline_sections":
+            ids = re.findall(r"<<<SECTION (\d+)>>>", content)
+            requests.append(len(ids))
+            value = {"sections": [{"id": i, "summary": f"요약 {len(requests)}-{i}"} for i in ids]}
+            return [{"author": "sections_agent", "actions": {"stateDelta": {"sections": json.dumps(value)}}}]
+        return [{"author": "checklist_agent", "actions": {"stateDelta": {"checklist": json.dumps(CHECKLIST)}}}]
+
+    monkeypatch.setattr(tasks, "redis_client", redis)
+    monkeypatch.setattr(tasks, "create_agent_session", fake_create_session)
+    monkeypatch.setattr(tasks, "run_agent", fake_run_agent)
+    monkeypatch.setattr(tasks, "record_metric", lambda *args: None)
+
+    first = asyncio.run(tasks.run_versioned_pipeline("job-1", "missing", make_document()))
+    total = first["sections"]["total"]
+    assert first["sections"]["reused"] == 0
+    assert first["checklist"] == CHECKLIST["items"]
+
+    second = asyncio.run(tasks.run_versioned_pipeline("job-2", "job-1", make_document("수집한 개인정보는 1년 후 파기한다. " * 10)))
+    assert second["sections"] == {"total": total, "reused": total - 1}
+    assert requests[-1] == 1
+    assert "[제3조 (조항 3)] 요약 2-1" in second["summary"]
+    assert "[제1조 (조항 1)]" in second["summary"]
+    # 섹션 요약은 보관 기간이 지나면 사라짐
+    assert redis.ttls[sections.SECTIONS_KEY.format(job_id="job-2")] == settings.SECTION_SUMMARY_TTL
+
+def test_first_version_from_normal_job_reuses_sections(fake_redis, monkeypatch):
+    """이전 버전 없이 처리한 작업의 섹션 요약을 첫 새 버전이 재사용"""
+    requests = []
+
+    async def fake_create_session(app_name=tasks.AGENT_APP_NAME, state=None):
+        return "session-id"
+
+    async def fake_run_agent(app_name, session_id, content):
+        if app_name == "guideline_sections":
+            ids = re.findall(r"<<<SECTION (\d+)>>>", content)
+            requests.append(len(ids))
+            value = {"sections": [{"id": i, "summary": f"요약 {len(requests)}-{i}"} for i in ids]}
+            return [{"author": "sections_agent", "actions": {"stateDelta": {"sections": json.dumps(value)}}}]
+        return [{"author": "checklist_agent", "actions": {"stateDelta": {"checklist": json.dumps(CHECKLIST)}}}]
+
+    async def fake_pipeline(content, pipeline=None):
+        return {"summary": "전체 요약", "checklist": CHECKLIST["items"]}
+
+    monkeypatch.setattr(tasks, "redis_client", fake_redis)
+    monkeypatch.setattr(tasks, "create_agent_session", fake_create_session)
+    monkeypatch.setattr(tasks, "run_agent", fake_run_agent)
+    monkeypatch.setattr(tasks, "run_agent_pipeline", fake_pipeline)
+    monkeypatch.setattr(tasks, "record_metric", lambda *args: None)
+    monkeypatch.setattr(settings, "SECTION_CACHE_ALL_JOBS", True)
+
+    first = asyncio.run(tasks.run_document_pipeline("job-1", make_document()))
+    assert first["summary"] == "전체 요약"
+
+    second = asyncio.run(tasks.run_versioned_pipeline("job-2", "job-1", make_document("수집한 개인정보는 1년 후 파기한다. " * 10)))
+    assert second["sections"]["reused"] == second["sections"]["total"] - 1
+    assert requests == [second["sections"]["total"], 1]
@@ -0,0 +1,97 @@
+import contextlib
+import time
+from unittest.mock import MagicMock
+import pytest
+from app.core import metrics, stage_payloads
+from app.core.config import settings
+from app.models.job import JobStatus
+from app.tasks import stages
+
+class FakeSession:
+    def __init__(self):
+        self.job = MagicMock()
+
+    def query(self, model):
+        return self
+
+    def filter(self, *args):
+        return self
+
+    def first(self):
+        return self.job
+
+    def commit(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+@pytest.fixture
+def redis(fake_redis, monkeypatch):
+    monkeypatch.setattr(stages, "redis_client", fake_redis)
+    return fake_redis
+
+def test_stages_hand_off_by_reference(redis, monkeypatch, tmp_path):
+    """단계마다 다음 단계에는 작업 ID와 컨텍스트만 넘기고, 텍스트와 결과는 Redis로 전달"""
+    upload = tmp_path / "guide.txt"
+    upload.write_text("개인정보 처리 지침 본문", encoding="utf-8")
+
+    @contextlib.contextmanager
+    def fake_open_upload(filename, blob=None):
+        yield str(upload)
+
+    async def fake_pipeline(job_id, content, pipeline=None):
+        assert content == "개인정보 처리 지침 본문"
+        return {"summary": "요약", "checklist": [{"text": "항목", "priority": "high", "category": "법적 의무"}]}
+
+    sent = []
+    completed = []
+    breaker = MagicMock()
+    monkeypatch.setattr(stages, "send_stage", lambda name, job_id, context: sent.append((name, job_id, context)))
+    monkeypatch.setattr(stages, "open_upload", fake_open_upload)
+    monkeypatch.setattr(stages, "SessionLocal", FakeSession)
+    monkeypatch.setattr(stages, "update_job_status", lambda *args: None)
+    monkeypatch.setattr(stages, "record_metric", lambda func, *args: func(redis, *args) if func in (metrics.record_stage_run, stage_payloads.clear) else None)
+    monkeypatch.setattr(stages, "CancellationToken", lambda redis, job_id: MagicMock())
+    monkeypatch.setattr(stages, "get_agent_breaker", lambda: breaker)
+    monkeypatch.setattr(stages, "run_document_pipeline", fake_pipeline)
+    monkeypatch.setattr(stages, "handle_job_completed", lambda job_id, filename, result, started_at: completed.append((job_id, result)))
+    monkeypatch.setattr(settings, "NEAR_DUP_POLICY", "off")
+
+    stages.extract_stage.run("job-1", "guide.txt", pipeline="parallel")
+    name, job_id, context = sent.pop()
+    assert (name, job_id, context["pipeline"]) == ("agent_stage", "job-1", "parallel")
+    assert "text" not in context
+    assert stage_payloads.get_text(redis, "job-1") == "개인정보 처리 지침 본문"
+
+    stages.agent_stage.run(job_id, context)
+    name, job_id, context = sent.pop()
+    assert name == "persist_stage"
+    assert stage_payloads.get_result(redis, "job-1")["summary"] == "요약"
+
+    result = stages.persist_stage.run(job_id, context)
+    assert result["status"] == JobStatus.COMPLETED
+    assert completed == [("job-1", {"summary": "요약", "checklist": result["checklist"]})]
+    # 작업이 끝나면 단계 사이 데이터를 지움
+    assert stage_payloads.get_text(redis, "job-1") is None
+    assert stage_payloads.get_result(redis, "job-1") is None
+
+    bucket = metrics.STAGE_RUNS_KEY.format(bucket=metrics._bucket(time.time()))
+    assert {field for field in redis.data[bucket]} == {
+        "extract:tasks", "extract:busy", "agent:tasks", "agent:busy", "persist:tasks", "persist:busy"
+    }
+
+def test_stage_stats(redis, monkeypatch):
+    """완료된 분 단위 버킷으로 단계별 처리량과 이용률 계산"""
+    monkeypatch.setattr(settings, "STAGE_METRICS_WINDOW", 120)
+    previous = metrics._bucket(time.time()) - 1
+    redis.data[metrics.STAGE_RUNS_KEY.format(bucket=previous)] = {"agent:tasks": "12", "agent:busy": "240.0"}
+
+    stats = metrics.get_stage_stats(redis, {"extract": 2, "agent": 8})
+    assert stats["agent"]["throughput"] == pytest.approx(12 / 120)
+    assert stats["agent"]["avgBusyWorkers"] == pytest.approx(2.0)
+    assert stats["agent"]["utilization"] == pytest.approx(0.25)
+    assert stats["extract"]["throughput"] == 0
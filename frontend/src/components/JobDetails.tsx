@@ -9,8 +9,12 @@ import {
   ListItemIcon,
   Checkbox,
   Divider,
+  Chip,
 } from "@mui/material";
-import { Job } from "../types/job";
+import { Job, checklistText } from "../types/job";
+
+const PRIORITY_LABELS = { high: "높음", medium: "보통", low: "낮음" };
+const PRIORITY_COLORS = { high: "error", medium: "warning", low: "default" } as const;
 
 interface JobDetailsProps {
   job: Job;
@@ -112,7 +116,17 @@ const JobDetails: React.FC<JobDetailsProps> = ({ job }) => {
                     disableRipple
                   />
                 </ListItemIcon>
-                <ListItemText primary={decodeUnicode(item)} />
+                <ListItemText
+                  primary={decodeUnicode(checklistText(item))}
+                  secondary={typeof item === "string" ? undefined : item.category}
+                />
+                {typeof item !== "string" && (
+                  <Chip
+                    size="small"
+                    label={PRIORITY_LABELS[item.priority]}
+                    color={PRIORITY_COLORS[item.priority]}
+                  />
+                )}
               </ListItem>
             ))}
           </List>
@@ -1,5 +1,6 @@
 import React, { useEffect, useState } from "react";
 import { Box, Typography, CircularProgress, Alert } from "@mui/material";
+import { ChecklistEntry, checklistText } from "../types/job";
 
 const API_BASE_URL = "http://localhost:8000";
 
@@ -7,7 +8,7 @@ interface JobStatus {
   status: string;
   filename: string;
   summary: string | null;
-  checklist: string[] | null;
+  checklist: ChecklistEntry[] | null;
   started_at: string;
   completed_at: string | null;
   failed_at: string | null;
@@ -79,7 +80,7 @@ export const JobStatus: React.FC<JobStatusProps> = ({ jobId }) => {
           </Typography>
           {status.checklist?.map((item, index) => (
             <Typography key={index} variant="body1">
-              • {item}
+              • {checklistText(item)}
             </Typography>
           ))}
         </Box>
@@ -1,10 +1,13 @@
-import React, { useState, useEffect } from "react";
+import React, { useState, useEffect, useRef, useCallback } from "react";
 import { Box, Container, Typography, Paper } from "@mui/material";
 import { FileUpload } from "../components/FileUpload";
 import { QueueStatus } from "../components/QueueStatus";
 import { CompletedJobs } from "../components/CompletedJobs";
 import JobDetails from "../components/JobDetails";
 
+const WS_URL = "ws://localhost:8000/ws/jobs";
+const TERMINAL_STATUSES = ["completed", "failed", "cancelled", "skipped"];
+
 const containerStyles = {
   maxWidth: "100%",
   margin: "0 auto",
@@ -102,76 +105,103 @@ export const Home: React.FC = () => {
     }
   };
 
-  // 작업 상태 폴링
+  // 작업 상태 구독 (하나의 WebSocket으로 대기 중인 모든 작업의 상태 전이를 받음)
+  const socketRef = useRef<WebSocket | null>(null);
+  const subscribedRef = useRef<Set<string>>(new Set());
+  const queueRef = useRef<any[]>([]);
+  queueRef.current = queue;
+
+  const applyJobUpdate = useCallback((data: any) => {
+    if (!data?.jobId) return;
+
+    // API 응답 형식에 맞게 데이터 변환
+    const transformedData = {
+      jobId: data.jobId,
+      status: data.status || "unknown",
+      startedAt: data.createdAt || null,
+      completedAt: data.updatedAt || null,
+      failedAt: null,
+      summary: data.result?.summary || "",
+      checklist: data.result?.checklist || [],
+      error: null,
+      estimatedStartAt: data.estimatedStartAt,
+      estimatedCompletedAt: data.estimatedCompletedAt,
+    };
+
+    // 완료된 작업 처리
+    if (TERMINAL_STATUSES.includes(data.status)) {
+      subscribedRef.current.delete(data.jobId);
+      setCompletedJobs((prev) => {
+        const exists = prev.some((j) => j.jobId === data.jobId);
+        if (!exists) {
+          return [...prev, transformedData];
+        }
+        return prev;
+      });
+      // 대기열에서 제거
+      setQueue((prev) => prev.filter((job) => job.jobId !== data.jobId));
+      return;
+    }
+
+    setQueue((prev) =>
+      prev.map((job) =>
+        job.jobId === data.jobId ? { ...job, ...transformedData } : job
+      )
+    );
+  }, []);
+
+  const subscribe = useCallback((jobIds: string[]) => {
+    const socket = socketRef.current;
+    if (!socket || socket.readyState !== WebSocket.OPEN) return;
+
+    const newIds = jobIds.filter((id) => !subscribedRef.current.has(id));
+    if (newIds.length === 0) return;
+    newIds.forEach((id) => subscribedRef.current.add(id));
+    socket.send(JSON.stringify({ action: "subscribe", jobIds: newIds }));
+  }, []);
+
   useEffect(() => {
-    const pollInterval = setInterval(async () => {
-      if (queue.length === 0) return;
-
-      try {
-        const updatedJobs = await Promise.all(
-          queue.map(async (job) => {
-            try {
-              console.log("Polling job:", job.jobId);
-              const response = await fetch(
-                `http://localhost:8000/jobs/${job.jobId}`
-              );
-              console.log("Poll response status:", response.status);
-
-              if (!response.ok) {
-                throw new Error(`HTTP error! status: ${response.status}`);
-              }
-
-              const data = await response.json();
-              console.log("Poll response data:", data);
-
-              // API 응답 형식에 맞게 데이터 변환
-              const transformedData = {
-                jobId: job.jobId,
-                status: data.status || "unknown",
-                startedAt: data.createdAt || null,
-                completedAt: data.updatedAt || null,
-                failedAt: null,
-                summary: data.result?.summary || "",
-                checklist: data.result?.checklist || [],
-                error: null,
-              };
-
-              console.log("Transformed job data:", transformedData);
-
-              // 완료된 작업 처리
-              if (data.status === "completed" || data.status === "failed") {
-                setCompletedJobs((prev) => {
-                  const exists = prev.some((j) => j.jobId === job.jobId);
-                  if (!exists) {
-                    return [...prev, transformedData];
-                  }
-                  return prev;
-                });
-                return null; // 대기열에서 제거
-              }
-
-              return transformedData;
-            } catch (error) {
-              console.error(
-                `Failed to fetch status for job ${job.jobId}:`,
-                error
-              );
-              return job;
-            }
-          })
-        );
-
-        // null이 아닌 작업만 필터링
-        const activeJobs = updatedJobs.filter((job) => job !== null);
-        console.log("Updated active jobs:", activeJobs);
-        setQueue(activeJobs);
-      } catch (error) {
-        console.error("Error polling job statuses:", error);
-      }
-    }, 1000);
+    let closed = false;
+    let retryTimer: ReturnType<typeof setTimeout> | undefined;
+
+    const connect = () => {
+      const socket = new WebSocket(WS_URL);
+      socketRef.current = socket;
 
-    return () => clearInterval(pollInterval);
-  }, [queue]);
+      socket.onopen = () => {
+        // 재연결 시 대기 중인 작업을 다시 구독 (스냅샷으로 놓친 전이를 받음)
+        subscribedRef.current = new Set();
+        subscribe(queueRef.current.map((job) => job.jobId));
+      };
+
+      socket.onmessage = (event) => {
+        const message = JSON.parse(event.data);
+        if (message.type === "error") {
+          console.error("Job subscription error:", message);
+          return;
+        }
+        applyJobUpdate(message.job);
+      };
+
+      socket.onclose = () => {
+        if (!closed) {
+          retryTimer = setTimeout(connect, 1000);
+        }
+      };
+    };
+
+    connect();
+    return () => {
+      closed = true;
+      clearTimeout(retryTimer);
+      socketRef.current?.close();
+    };
+  }, [applyJobUpdate, subscribe]);
+
+  // 새로 추가된 작업 구독
+  useEffect(() => {
+    subscribe(queue.map((job) => job.jobId));
+  }, [queue, subscribe]);
 
   return (
     <Container sx={containerStyles} maxWidth={false}>
@@ -1,11 +1,25 @@
+export interface ChecklistItem {
+  text: string;
+  priority: "high" | "medium" | "low";
+  category: string;
+}
+
+// 이전 작업의 체크리스트는 문자열 항목
+export type ChecklistEntry = ChecklistItem | string;
+
+export const checklistText = (entry: ChecklistEntry) =>
+  typeof entry === "string" ? entry : entry.text;
+
 export interface Job {
   jobId: string;
   status: string;
   filename: string;
   summary: string;
-  checklist: string[];
+  checklist: ChecklistEntry[];
   startedAt: string;
   completedAt?: string;
   failedAt?: string;
   error?: string;
+  estimatedStartAt?: string;
+  estimatedCompletedAt?: string;
 }
@@ -0,0 +1,17 @@
+from typing import Optional
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmRequest, LlmResponse
+
+# 워커가 작업의 모델 티어에 맞는 모델 이름을 넣는 세션 상태 키
+MODEL_STATE_KEY = "model"
+
+def apply_model_tier(callback_context: CallbackContext, llm_request: LlmRequest) -> Optional[LlmResponse]:
+    """세션 상태에 모델이 지정되어 있으면 그 모델로 요청합니다 (없으면 에이전트에 지정된 모델 사용).
+
+    같은 Gemini 클라이언트로 요청하므로 티어 모델은 Gemini 모델이어야 합니다.
+    """
+    model = callback_context.state.get(MODEL_STATE_KEY)
+    if isinstance(model, str) and model:
+        llm_request.model = model
+    return None
@@ -1 +1 @@
-from .agent import checklist_agent
\ No newline at end of file
+from .agent import checklist_agent, create_checklist_agent
\ No newline at end of file
@@ -1,10 +1,8 @@
 from google.adk.agents import LlmAgent
+from google.genai import types
+from ...model_tier import apply_model_tier
 
-checklist_agent = LlmAgent(
-    name="checklist_agent",
-    model="gemini-2.0-flash",
-    description="입력된 텍스트로부터 체크리스트를 생성하는 에이전트입니다.",
-    instruction="""주어진 텍스트를 분석하여 문서의 성격과 목적에 맞는 체크리스트를 생성해주세요.
+CHECKLIST_INSTRUCTION = """주어진 텍스트를 분석하여 문서의 성격과 목적에 맞는 체크리스트를 생성해주세요.
 
 문서 유형별 체크리스트 생성 기준:
 
@@ -63,7 +61,32 @@ checklist_agent = LlmAgent(
 4. 실행 가능하고 검증 가능한 항목으로 작성
 5. 불필요한 형식적 제약 없이 내용 중심으로 작성
 
+응답 형식:
+다른 설명 없이 items 필드 하나를 가진 JSON 객체로만 응답하세요.
+items는 체크리스트 항목의 배열이며, 각 항목은 다음 필드를 가집니다.
+- text: 체크리스트 항목 내용 (번호 없이 한 문장)
+- priority: 우선순위 ("high", "medium", "low" 중 하나)
+- category: 항목 분류 (예: "법적 의무", "설정", "검증", "리스크")"""
+
+# 순차 파이프라인에서는 앞 단계의 요약(세션 상태의 summary)을 참고
+SUMMARY_REFERENCE = """
+
 참고할 요약 내용:
-{summary}""",
-    output_key="checklist"
-) 
\ No newline at end of file
+{summary}"""
+
+def create_checklist_agent(use_summary: bool = True) -> LlmAgent:
+    """체크리스트 에이전트를 생성합니다. 에이전트는 한 부모에만 속할 수 있어 앱마다 새로 만듭니다.
+
+    use_summary=False면 요약을 기다리지 않고 원문만으로 체크리스트를 만듭니다 (병렬 파이프라인용).
+    """
+    return LlmAgent(
+        name="checklist_agent",
+        model="gemini-2.0-flash",
+        description="입력된 텍스트로부터 체크리스트를 생성하는 에이전트입니다.",
+        instruction=CHECKLIST_INSTRUCTION + (SUMMARY_REFERENCE if use_summary else ""),
+        generate_content_config=types.GenerateContentConfig(response_mime_type="application/json"),
+        before_model_callback=apply_model_tier,  # 작업의 모델 티어 적용
+        output_key="checklist"  # 체크리스트(JSON)를 상태에 저장
+    )
+
+checklist_agent = create_checklist_agent()
@@ -1 +1 @@
-from .agent import summary_agent
\ No newline at end of file
+from .agent import summary_agent, create_summary_agent
\ No newline at end of file
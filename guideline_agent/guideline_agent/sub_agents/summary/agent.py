@@ -1,10 +1,14 @@
 from google.adk.agents import LlmAgent
+from google.genai import types
+from ...model_tier import apply_model_tier
 
-summary_agent = LlmAgent(
-    name="summary_agent",
-    model="gemini-2.0-flash",
-    description="입력된 텍스트를 요약하는 에이전트입니다.",
-    instruction="""주어진 텍스트를 다음과 같은 기준으로 요약해주세요:
+def create_summary_agent() -> LlmAgent:
+    """요약 에이전트를 생성합니다. 에이전트는 한 부모에만 속할 수 있어 앱마다 새로 만듭니다."""
+    return LlmAgent(
+        name="summary_agent",
+        model="gemini-2.0-flash",
+        description="입력된 텍스트를 요약하는 에이전트입니다.",
+        instruction="""주어진 텍스트를 다음과 같은 기준으로 요약해주세요:
 
 1. 문서의 주요 주제와 목적을 파악하여 명시
 2. 핵심 내용을 3-5개의 주요 포인트로 정리
@@ -12,17 +16,17 @@ summary_agent = LlmAgent(
 4. 원문의 중요한 키워드와 개념을 반드시 포함
 5. 요약은 한글로 작성하며, 전문적이고 명확한 문체 사용
 
-요약 형식:
-[주제]
-[목적]
-[주요 내용]
-1. [첫 번째 핵심 포인트]
-2. [두 번째 핵심 포인트]
-3. [세 번째 핵심 포인트]
+응답 형식:
+다른 설명 없이 아래 필드를 가진 JSON 객체 하나로만 응답하세요.
+- topic: 문서의 주제 (문자열)
+- purpose: 문서의 목적 (문자열)
+- key_points: 핵심 포인트 3-5개 (문자열 배열, 각 항목은 번호 없이 설명 형식의 문장)
 
 주의사항:
-- 체크리스트 형식으로 작성하지 마세요
-- 각 포인트는 설명 형식으로 작성하세요
-- 번호는 1., 2., 3. 형식으로 작성하세요""",
-    output_key="summary"  # 요약 결과를 상태에 저장
-) 
\ No newline at end of file
+- 체크리스트 형식으로 작성하지 마세요""",
+        generate_content_config=types.GenerateContentConfig(response_mime_type="application/json"),
+        before_model_callback=apply_model_tier,  # 작업의 모델 티어 적용
+        output_key="summary"  # 요약 결과(JSON)를 상태에 저장
+    )
+
+summary_agent = create_summary_agent() 
\ No newline at end of file
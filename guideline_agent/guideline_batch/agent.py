@@ -0,0 +1,32 @@
+# 짧은 문서 여러 개를 한 번의 실행으로 요약하고 체크리스트를 만드는 앱 (워커의 묶음 처리용)
+from google.adk.agents import LlmAgent
+from google.genai import types
+from guideline_agent.model_tier import apply_model_tier
+
+root_agent = LlmAgent(
+    name="batch_agent",
+    model="gemini-2.0-flash",
+    description="여러 문서를 한 번에 요약하고 문서별 체크리스트를 생성하는 에이전트입니다.",
+    instruction="""입력에는 여러 문서가 있으며, 각 문서는 <<<DOC 번호>>>와 <<<END 번호>>> 사이에 있습니다.
+문서마다 독립적으로 처리하고, 다른 문서의 내용을 섞지 마세요.
+
+요약 기준:
+1. 문서의 주요 주제와 목적을 파악하여 명시
+2. 핵심 내용을 1-5개의 주요 포인트로 정리 (짧은 문서는 포인트 수를 줄여도 됨)
+3. 원문의 중요한 키워드와 개념을 반드시 포함하고, 한글로 전문적이고 명확하게 작성
+
+체크리스트 기준:
+1. 문서의 성격(법률/규정, 매뉴얼, 공지, 계약 등)과 목적에 맞는 항목 선정
+2. 구체적이고 실행 가능하며 검증 가능한 항목으로 작성
+3. 우선순위를 고려한 순서로 정렬
+
+응답 형식:
+다른 설명 없이 documents 필드 하나를 가진 JSON 객체로만 응답하세요.
+documents는 입력 문서마다 하나씩인 배열이며, 각 원소는 다음 필드를 가집니다.
+- id: 문서 번호 (문자열, 예: "1")
+- summary: topic(주제), purpose(목적), key_points(핵심 포인트 문자열 배열)를 가진 객체
+- checklist: items 배열을 가진 객체, 각 항목은 text(항목 내용), priority("high", "medium", "low" 중 하나), category(항목 분류)를 가짐""",
+    generate_content_config=types.GenerateContentConfig(response_mime_type="application/json"),
+    before_model_callback=apply_model_tier,  # 작업의 모델 티어 적용
+    output_key="documents"
+)
@@ -0,0 +1,4 @@
+# 체크리스트 단계만 실행하는 앱 (세션 상태의 summary를 참고)
+from guideline_agent.sub_agents.checklist import create_checklist_agent
+
+root_agent = create_checklist_agent()
@@ -0,0 +1,10 @@
+# 요약과 체크리스트를 동시에 실행하는 앱 (체크리스트는 요약을 기다리지 않고 원문으로 생성)
+from google.adk.agents import ParallelAgent
+from guideline_agent.sub_agents.summary import create_summary_agent
+from guideline_agent.sub_agents.checklist import create_checklist_agent
+
+root_agent = ParallelAgent(
+    name="guideline_parallel",
+    description="가이드라인 문서의 요약과 체크리스트를 동시에 생성하는 에이전트입니다.",
+    sub_agents=[create_summary_agent(), create_checklist_agent(use_summary=False)]
+)
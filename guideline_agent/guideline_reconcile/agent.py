@@ -0,0 +1,30 @@
+# 병렬 파이프라인의 체크리스트를 요약과 대조해 다듬는 앱 (세션 상태의 summary, checklist를 참고)
+from google.adk.agents import LlmAgent
+from google.genai import types
+
+# 짧은 입력(요약과 체크리스트)만 다루므로 작업의 모델 티어와 관계없이 가벼운 모델 사용
+root_agent = LlmAgent(
+    name="reconcile_agent",
+    model="gemini-2.0-flash-lite",
+    description="요약과 체크리스트를 대조해 체크리스트를 보정하는 에이전트입니다.",
+    instruction="""아래 요약과 체크리스트는 같은 문서에서 각각 따로 만들어졌습니다.
+요약과 대조해 체크리스트를 보정해주세요.
+
+보정 기준:
+1. 요약의 핵심 내용 중 체크리스트에 빠진 중요한 항목이 있으면 추가
+2. 요약의 주제나 목적과 맞지 않는 항목은 삭제
+3. 중복되거나 겹치는 항목은 하나로 합침
+4. 나머지 항목은 문구와 우선순위, 분류를 그대로 유지
+
+응답 형식:
+다른 설명 없이 items 필드 하나를 가진 JSON 객체로만 응답하세요.
+items는 체크리스트 항목의 배열이며, 각 항목은 text(항목 내용), priority("high", "medium", "low" 중 하나), category(항목 분류)를 가집니다.
+
+요약:
+{summary}
+
+체크리스트:
+{checklist}""",
+    generate_content_config=types.GenerateContentConfig(response_mime_type="application/json"),
+    output_key="checklist"
+)
@@ -0,0 +1,26 @@
+# 문서의 섹션(변경된 섹션만)을 섹션별로 요약하는 앱 (새 버전 문서의 섹션 단위 재처리용)
+from google.adk.agents import LlmAgent
+from google.genai import types
+from guideline_agent.model_tier import apply_model_tier
+
+root_agent = LlmAgent(
+    name="sections_agent",
+    model="gemini-2.0-flash",
+    description="문서의 섹션을 섹션별로 요약하는 에이전트입니다.",
+    instruction="""입력에는 한 문서의 여러 섹션이 있으며, 각 섹션은 <<<SECTION 번호>>>와 <<<END 번호>>> 사이에 있습니다.
+섹션의 첫 줄은 섹션 제목일 수 있습니다.
+
+요약 기준:
+1. 섹션마다 독립적으로 2-4문장으로 요약
+2. 의무사항, 기준, 기한, 수치 등 체크리스트 작성에 필요한 내용을 반드시 포함
+3. 원문의 중요한 키워드와 개념을 유지하고, 한글로 전문적이고 명확하게 작성
+
+응답 형식:
+다른 설명 없이 sections 필드 하나를 가진 JSON 객체로만 응답하세요.
+sections는 입력 섹션마다 하나씩인 배열이며, 각 원소는 다음 필드를 가집니다.
+- id: 섹션 번호 (문자열, 예: "1")
+- summary: 섹션 요약 (문자열)""",
+    generate_content_config=types.GenerateContentConfig(response_mime_type="application/json"),
+    before_model_callback=apply_model_tier,  # 작업의 모델 티어 적용
+    output_key="sections"
+)
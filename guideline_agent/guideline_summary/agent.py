@@ -0,0 +1,4 @@
+# 요약 단계만 실행하는 앱 (출력 형식이 잘못되었을 때 이 단계만 다시 실행)
+from guideline_agent.sub_agents.summary import create_summary_agent
+
+root_agent = create_summary_agent()